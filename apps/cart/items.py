@@ -0,0 +1,123 @@
+"""
+Cart item writes.
+
+Items are upserted with INSERT ... ON CONFLICT (cart_id, product_id)
+DO UPDATE, so adding a product already in the cart changes its quantity
+instead of creating a second row, whatever the number of entries. Raw SQL
+bypasses the CartItem signals, so the cached cart figures are recounted
+once per call.
+"""
+from typing import Iterable, List
+
+from django.db import IntegrityError, connection, transaction
+
+from apps.cart.models import Cart, CartItem
+from apps.cart.totals import recalculate_cart_totals
+
+MODE_INCREMENT = 'increment'
+MODE_SET = 'set'
+MODES = (MODE_INCREMENT, MODE_SET)
+
+# CartItem.quantity is a PostgreSQL integer; increments saturate here
+MAX_QUANTITY = 2147483647
+
+
+def resolve_default_cart(user) -> Cart:
+    """
+    The user's default cart: one lookup on the partial unique index, and on
+    first use a create that is safe against concurrent requests.
+    """
+    cart = Cart.objects.filter(user=user, is_default=True).first()
+    if cart is not None:
+        return cart
+    try:
+        with transaction.atomic():
+            return Cart.objects.create(user=user, is_default=True)
+    except IntegrityError:
+        # A concurrent request created it first
+        return Cart.objects.get(user=user, is_default=True)
+
+
+def get_default_cart(request) -> Cart:
+    """resolve_default_cart for the request user, resolved once per request."""
+    cart = getattr(request, 'default_cart', None)
+    if cart is None:
+        cart = resolve_default_cart(request.user)
+        request.default_cart = cart
+    return cart
+
+
+def set_default_cart(cart: Cart):
+    """Make ``cart`` its user's default (the previous default is unset first)."""
+    with transaction.atomic():
+        # Serializes concurrent switches for the same user
+        list(Cart.objects.select_for_update().filter(user_id=cart.user_id).values_list('pk', flat=True))
+        Cart.objects.filter(user_id=cart.user_id, is_default=True).exclude(pk=cart.pk).update(is_default=False)
+        Cart.objects.filter(pk=cart.pk).update(is_default=True)
+    cart.is_default = True
+
+
+def merge_entries(entries: Iterable[dict], mode: str) -> dict:
+    """
+    One entry per product: ON CONFLICT can't touch the same row twice in
+    one statement. Increments add up (capped at MAX_QUANTITY); with
+    MODE_SET the last entry wins.
+    """
+    merged = {}
+    for entry in entries:
+        product_id, quantity, notes = entry['product_id'], entry['quantity'], entry.get('notes')
+        if product_id in merged and mode == MODE_INCREMENT:
+            previous_quantity, previous_notes = merged[product_id]
+            quantity = min(quantity + previous_quantity, MAX_QUANTITY)
+            notes = notes if notes is not None else previous_notes
+        merged[product_id] = (quantity, notes)
+    return merged
+
+
+def upsert_cart_items(
+    cart_id: int, entries: Iterable[dict], mode: str = MODE_INCREMENT, recalculate: bool = True
+) -> List[dict]:
+    """
+    Apply (product_id, quantity, notes) entries to a cart with one statement.
+
+    MODE_INCREMENT adds to the quantity already in the cart (saturating at
+    MAX_QUANTITY), MODE_SET replaces it. notes=None keeps the stored notes. Returns one dict per
+    product: id, product_id, quantity and whether the row was created.
+
+    recalculate=False leaves the cached cart figures to the caller, for
+    callers that aggregate the cart themselves in the same transaction.
+    """
+    merged = merge_entries(entries, mode)
+    if not merged:
+        return []
+
+    table = connection.ops.quote_name(CartItem._meta.db_table)
+    quantity_sql = (
+        'EXCLUDED.quantity' if mode == MODE_SET
+        # bigint sum so the addition itself can't overflow before the cap
+        else f'LEAST(item.quantity::bigint + EXCLUDED.quantity, {MAX_QUANTITY})'
+    )
+    params = []
+    for product_id, (quantity, notes) in merged.items():
+        params.extend([cart_id, product_id, quantity, notes])
+
+    sql = (
+        f'INSERT INTO {table} AS item (cart_id, product_id, quantity, notes) '
+        f'VALUES {", ".join(["(%s, %s, %s, %s)"] * len(merged))} '
+        f'ON CONFLICT (cart_id, product_id) DO UPDATE '
+        f'SET quantity = {quantity_sql}, notes = COALESCE(EXCLUDED.notes, item.notes) '
+        # xmax is 0 only for rows this statement inserted
+        f'RETURNING id, product_id, quantity, (xmax = 0) AS created'
+    )
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        if recalculate:
+            recalculate_cart_totals(cart_id)
+
+    return [
+        {'id': item_id, 'product_id': product_id, 'quantity': quantity, 'created': created}
+        for item_id, product_id, quantity, created in rows
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cart', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cart',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='total',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=30),
+        ),
+    ]
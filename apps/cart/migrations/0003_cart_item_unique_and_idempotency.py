@@ -0,0 +1,70 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Fold duplicate (cart, product) rows into the oldest one before the
+# unique constraint, then recount the cached cart figures
+MERGE_DUPLICATE_ITEMS_SQL = """
+UPDATE cart_cartitem AS keep
+SET quantity = duplicates.quantity
+FROM (
+    SELECT min(id) AS id, sum(quantity) AS quantity
+    FROM cart_cartitem
+    GROUP BY cart_id, product_id
+    HAVING count(*) > 1
+) AS duplicates
+WHERE keep.id = duplicates.id;
+
+DELETE FROM cart_cartitem AS item
+USING cart_cartitem AS keep
+WHERE item.cart_id = keep.cart_id AND item.product_id = keep.product_id AND item.id > keep.id;
+
+UPDATE cart_cart AS cart
+SET item_count = totals.item_count, total = totals.total
+FROM (
+    SELECT item.cart_id, count(*) AS item_count, sum(item.quantity * product.real_price) AS total
+    FROM cart_cartitem AS item
+    JOIN products_product AS product ON product.id = item.product_id
+    GROUP BY item.cart_id
+) AS totals
+WHERE cart.id = totals.cart_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cart', '0002_cart_cached_totals'),
+        ('products', '0010_discount_campaign'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CartIdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255)),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('status_code', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('response', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.RunSQL(MERGE_DUPLICATE_ITEMS_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='cartitem',
+            constraint=models.UniqueConstraint(fields=('cart', 'product'), name='cart_item_cart_product_uniq'),
+        ),
+        migrations.AddField(
+            model_name='cartidempotencykey',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddConstraint(
+            model_name='cartidempotencykey',
+            constraint=models.UniqueConstraint(fields=('user', 'key'), name='cart_idempotency_user_key_uniq'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Existing users keep adding to the cart get_or_create used to return: their oldest one
+MARK_OLDEST_CART_DEFAULT_SQL = """
+UPDATE cart_cart
+SET is_default = true
+WHERE id IN (SELECT DISTINCT ON (user_id) id FROM cart_cart ORDER BY user_id, id)
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cart', '0003_cart_item_unique_and_idempotency'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cart',
+            name='is_default',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunSQL(MARK_OLDEST_CART_DEFAULT_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='cart',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_default', True)), fields=('user',), name='cart_one_default_per_user'),
+        ),
+    ]
@@ -8,10 +8,24 @@ class Cart(models.Model):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     name = models.CharField(max_length=255, default="My Meal List")
     created_at = models.DateTimeField(auto_now_add=True)
+    # Badge figures kept up to date incrementally by apps.cart.signals;
+    # total is at discounted (real) prices. GET .../summary/ is authoritative.
+    item_count = models.PositiveIntegerField(default=0)
+    total = models.DecimalField(max_digits=30, decimal_places=2, default=0)
+    # The cart items are added to when none is named (apps.cart.items.get_default_cart)
+    is_default = models.BooleanField(default=False)
     
 
     def __str__(self):
         return f"Cart of {self.user.username} - {self.name}"
+
+    class Meta:
+        constraints = [
+            # At most one default per user; also the index of the default-cart lookup
+            models.UniqueConstraint(
+                fields=['user'], condition=models.Q(is_default=True), name='cart_one_default_per_user'
+            ),
+        ]
     
 class CartItem(models.Model):
     cart = models.ForeignKey(Cart, on_delete=models.CASCADE, related_name='items')
@@ -27,5 +41,28 @@ class CartItem(models.Model):
     @property
     def estimated_price(self):
         return self.quantity * self.product.price
-    
-    
+
+    class Meta:
+        constraints = [
+            # Conflict target of the item upserts (apps.cart.items)
+            models.UniqueConstraint(fields=['cart', 'product'], name='cart_item_cart_product_uniq'),
+        ]
+
+
+class CartIdempotencyKey(models.Model):
+    """Response of a batch item request, replayed when the same key is sent again."""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    key = models.CharField(max_length=255)
+    # sha256 of the request body: a reused key with another body is rejected
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    response = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.key}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='cart_idempotency_user_key_uniq'),
+        ]
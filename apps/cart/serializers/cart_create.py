@@ -1,11 +1,59 @@
+from django.conf import settings
+from django.db import models
 from rest_framework import serializers
+from apps.cart.items import MAX_QUANTITY, MODE_INCREMENT, MODES, upsert_cart_items
 from apps.cart.models import Cart, CartItem
 from apps.products.models import Product
-from apps.products.serializers.product_list_create import ProductListSerializer
+from apps.shared.mixins.translation_mixins import get_media_index
+
+
+class CartProductSerializer(serializers.ModelSerializer):
+    """
+    Compact product snapshot for cart items: text in the request language
+    and a single image, read from the MediaIndex the list serializers fill.
+    """
+    title = serializers.SerializerMethodField()
+    # GeneratedField maps to a ModelField (float in JSON); keep it a string like price
+    real_price = serializers.DecimalField(max_digits=30, decimal_places=2, read_only=True)
+    image = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Product
+        fields = ['id', 'title', 'price', 'real_price', 'discount', 'measurement_type', 'is_active', 'image']
+
+    def get_language(self):
+        request = self.context.get('request')
+        return getattr(request, 'lang', None) or settings.LANGUAGE_CODE
+
+    def get_title(self, product):
+        return getattr(product, f"title_{self.get_language()}", None) or product.title
+
+    def get_image(self, product):
+        media_index = get_media_index(self.context)
+        # No-op when the list serializers already loaded the page
+        media_index.load([product])
+
+        # Request language first, then any language
+        languages = [self.get_language()] + [code.lower() for code, _ in settings.LANGUAGES]
+        for language in languages:
+            media = media_index.get(product, language)
+            if media:
+                return getattr(media[0].file, 'url', None)
+        return None
+
+
+class CartItemListSerializer(serializers.ListSerializer):
+    """Load media for the products of every item with one query."""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        items = list(iterable)
+        get_media_index(self.context).load([item.product for item in items])
+        return super().to_representation(items)
 
 
 class CartItemSerializer(serializers.ModelSerializer):
-    product = ProductListSerializer(read_only=True)
+    product = CartProductSerializer(read_only=True)
     product_id = serializers.PrimaryKeyRelatedField(
         queryset=Product.objects.all(),
         write_only=True
@@ -14,6 +62,7 @@ class CartItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = CartItem
         fields = ['id', 'product', 'quantity', 'notes', 'estimated_price', 'product_id']
+        list_serializer_class = CartItemListSerializer
         
     
     def validate_quantity(self, value):
@@ -24,16 +73,67 @@ class CartItemSerializer(serializers.ModelSerializer):
         
     def create(self, validated_data):
         product = validated_data.pop('product_id')
-        return CartItem.objects.create(product=product, **validated_data)
+        cart = validated_data.pop('cart')
+        # Adding a product that is already in the cart increments its quantity
+        (row,) = upsert_cart_items(cart.pk, [{
+            'product_id': product.pk,
+            'quantity': validated_data.get('quantity', 1),
+            'notes': validated_data.get('notes'),
+        }])
+        return CartItem.objects.select_related('product').get(pk=row['id'])
         
         
 
+class CartItemEntrySerializer(serializers.Serializer):
+    # Plain ids: CartItemBatchSerializer checks them all with one query
+    product_id = serializers.IntegerField(min_value=1)
+    quantity = serializers.IntegerField(min_value=1, max_value=MAX_QUANTITY)
+    notes = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
+class CartItemBatchSerializer(serializers.Serializer):
+    max_items = 200
+
+    cart_id = serializers.IntegerField(required=False)
+    mode = serializers.ChoiceField(choices=MODES, default=MODE_INCREMENT)
+    items = CartItemEntrySerializer(many=True, allow_empty=False, max_length=max_items)
+
+    def validate_items(self, items):
+        product_ids = {item['product_id'] for item in items}
+        existing = set(Product.objects.filter(pk__in=product_ids).values_list('pk', flat=True))
+        missing = product_ids - existing
+        if missing:
+            raise serializers.ValidationError(
+                [f"Invalid pk \"{pk}\" - object does not exist." for pk in sorted(missing)]
+            )
+        return items
+
+
+class CartListSerializer(serializers.ListSerializer):
+    """Load media for the products of every cart on the page with one query."""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        carts = list(iterable)
+        # items are prefetched (with their products) by the view
+        get_media_index(self.context).load([item.product for cart in carts for item in cart.items.all()])
+        return super().to_representation(carts)
+
+
 class CartSerializer(serializers.ModelSerializer):
     items = CartItemSerializer(many=True, read_only=True)
     
     class Meta:
         model = Cart
-        fields = ['id', 'user', 'name', 'created_at', 'items']
-        
+        fields = ['id', 'user', 'name', 'created_at', 'is_default', 'item_count', 'total', 'items']
+        read_only_fields = ['is_default', 'item_count', 'total']
+        list_serializer_class = CartListSerializer
 
 
+class CartSummarySerializer(serializers.Serializer):
+    """Figures from apps.cart.totals.get_summary, money as strings like Cart.total."""
+    cart_id = serializers.IntegerField()
+    item_count = serializers.IntegerField()
+    total_quantity = serializers.IntegerField()
+    total_price = serializers.DecimalField(max_digits=30, decimal_places=2)
+    total_discounted_price = serializers.DecimalField(max_digits=30, decimal_places=2)
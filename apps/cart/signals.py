@@ -0,0 +1,67 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from apps.cart.models import Cart, CartItem
+from apps.cart.totals import adjust_cart_totals, recalculate_cart_totals
+from apps.products.models import Product
+
+
+def _state(instance):
+    # __dict__ so a deferred field is never fetched just to remember it
+    values = instance.__dict__
+    return values.get('cart_id'), values.get('product_id'), values.get('quantity')
+
+
+def _cached_product(instance):
+    return instance._state.fields_cache.get('product')
+
+
+def _amount(product_id, quantity, product=None):
+    """quantity x real_price, reusing the loaded product when it is the right one."""
+    if product is None or product.pk != product_id:
+        product = Product.objects.only('real_price').get(pk=product_id)
+    return quantity * product.real_price
+
+
+@receiver(post_init, sender=CartItem)
+def remember_cart_item_state(sender, instance, **kwargs):
+    instance._saved_state = _state(instance) if instance.pk else None
+
+
+@receiver(post_save, sender=CartItem)
+def update_cart_totals_on_item_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+
+    previous = None if created else instance._saved_state
+    current = _state(instance)
+    instance._saved_state = current
+    cart_id, product_id, quantity = current
+
+    if not created and (previous is None or None in previous):
+        # Unknown previous row (e.g. deferred fields): recount the cart
+        recalculate_cart_totals(cart_id)
+        return
+
+    if previous is not None and previous[:2] == (cart_id, product_id):
+        delta = quantity - previous[2]
+        if delta:
+            adjust_cart_totals(cart_id, amount=_amount(product_id, delta, _cached_product(instance)))
+        return
+
+    if previous is not None:
+        old_cart_id, old_product_id, old_quantity = previous
+        adjust_cart_totals(old_cart_id, -1, -_amount(old_product_id, old_quantity, _cached_product(instance)))
+    adjust_cart_totals(cart_id, 1, _amount(product_id, quantity, _cached_product(instance)))
+
+
+@receiver(post_delete, sender=CartItem)
+def update_cart_totals_on_item_delete(sender, instance, origin=None, **kwargs):
+    # The cart itself is going away: nothing to keep up to date
+    if isinstance(origin, Cart) or getattr(origin, 'model', None) is Cart:
+        return
+
+    cart_id, product_id, quantity = instance._saved_state or _state(instance)
+    if None in (cart_id, product_id, quantity):
+        return
+    adjust_cart_totals(cart_id, -1, -_amount(product_id, quantity, _cached_product(instance)))
@@ -1,8 +1,10 @@
+from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 from apps.cart.models import Cart, CartItem
 from apps.products.models import Product
+from apps.shared.models import Media
 from django.contrib.auth import get_user_model
 
 
@@ -133,4 +135,30 @@ class CartApiTestCase(APITestCase):
        
         cart = Cart.objects.create(user=self.user, name='Empty Cart')
         cart.delete()
-        self.assertFalse(Cart.objects.filter(id=cart.id).exists())
\ No newline at end of file
+        self.assertFalse(Cart.objects.filter(id=cart.id).exists())
+
+    def test_cart_query_count_does_not_grow_with_items(self):
+
+        content_type = ContentType.objects.get_for_model(Product)
+        products = [
+            Product.objects.create(title=f"Product {i}", description="d", price=1)
+            for i in range(40)
+        ]
+        CartItem.objects.bulk_create(CartItem(cart=self.cart, product=product) for product in products)
+        Media.objects.bulk_create(
+            Media(
+                content_type=content_type, object_id=product.pk, file=f"2025/01/01/{product.pk}.jpg",
+                media_type="image", file_size=1, mime_type="image/jpeg",
+                original_filename=f"{product.pk}.jpg", language="uz"
+            )
+            for product in products
+        )
+
+        # count, carts, items + products, media
+        with self.assertNumQueries(4):
+            response = self.client.get(self.cart_url)
+
+        items = response.data['results'][0]['items']
+        self.assertEqual(len(items), 40)
+        self.assertEqual(items[0]['product']['title'], "Product 0")
+        self.assertTrue(items[0]['product']['image'].endswith(f"{products[0].pk}.jpg"))
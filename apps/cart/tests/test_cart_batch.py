@@ -0,0 +1,102 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.cart.items import MAX_QUANTITY
+from apps.cart.models import Cart, CartItem
+from apps.products.models import Product
+
+User = get_user_model()
+
+
+class CartItemBatchTestCase(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='batch', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.cart = Cart.objects.create(user=self.user, is_default=True)
+        self.products = [
+            Product.objects.create(title=f"Product {i}", description="d", price=Decimal("2.00")) for i in range(3)
+        ]
+        self.url = reverse('cart:cart-item-batch')
+
+    def quantities(self):
+        return dict(CartItem.objects.filter(cart=self.cart).values_list('product_id', 'quantity'))
+
+    def test_adding_a_product_twice_increments(self):
+        url = reverse('cart:cart-item-create')
+        for _ in range(2):
+            response = self.client.post(url, {"product_id": self.products[0].pk, "quantity": 2}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.quantities(), {self.products[0].pk: 4})
+
+    def test_batch_upsert_is_one_statement(self):
+        CartItem.objects.create(cart=self.cart, product=self.products[0], quantity=1, notes="keep")
+        payload = {'items': [
+            {'product_id': self.products[0].pk, 'quantity': 2},
+            {'product_id': self.products[1].pk, 'quantity': 1, 'notes': "new"},
+            {'product_id': self.products[1].pk, 'quantity': 4},
+        ]}
+
+        # products check, upsert, totals aggregate + sync, cart reload (plus savepoints)
+        with self.assertNumQueries(8):
+            response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.quantities(), {self.products[0].pk: 3, self.products[1].pk: 5})
+        self.assertEqual(CartItem.objects.get(product=self.products[0]).notes, "keep")
+        self.assertEqual(sorted(row['created'] for row in response.data['items']), [False, True])
+        self.assertEqual((response.data['item_count'], response.data['total']), (2, "16.00"))
+
+    def test_increments_saturate_at_the_column_limit(self):
+        CartItem.objects.create(cart=self.cart, product=self.products[0], quantity=MAX_QUANTITY - 1)
+        payload = {'items': [
+            {'product_id': self.products[0].pk, 'quantity': 5},
+            {'product_id': self.products[1].pk, 'quantity': MAX_QUANTITY},
+            {'product_id': self.products[1].pk, 'quantity': MAX_QUANTITY},
+        ]}
+        response = self.client.post(self.url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.quantities(), {self.products[0].pk: MAX_QUANTITY, self.products[1].pk: MAX_QUANTITY})
+
+    def test_set_mode_replaces_quantities(self):
+        CartItem.objects.create(cart=self.cart, product=self.products[0], quantity=5)
+        payload = {'mode': 'set', 'items': [{'product_id': self.products[0].pk, 'quantity': 1}]}
+        self.client.post(self.url, payload, format='json')
+        self.assertEqual(self.quantities(), {self.products[0].pk: 1})
+
+    def test_idempotency_key_replays_the_response(self):
+        payload = {'items': [{'product_id': self.products[2].pk, 'quantity': 1}]}
+        first = self.client.post(self.url, payload, format='json', HTTP_IDEMPOTENCY_KEY='sync-1')
+        replay = self.client.post(self.url, payload, format='json', HTTP_IDEMPOTENCY_KEY='sync-1')
+
+        self.assertEqual(replay.status_code, status.HTTP_200_OK)
+        self.assertEqual(replay.json(), first.json())
+        self.assertEqual(replay['Idempotent-Replayed'], 'true')
+        self.assertEqual(self.quantities(), {self.products[2].pk: 1})
+
+        other = {'items': [{'product_id': self.products[2].pk, 'quantity': 9}]}
+        response = self.client.post(self.url, other, format='json', HTTP_IDEMPOTENCY_KEY='sync-1')
+        self.assertEqual(response.status_code, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+    def test_invalid_batches(self):
+        bad_payloads = [
+            {'items': []},
+            {'items': [{'product_id': 9999, 'quantity': 1}]},
+            {'items': [{'product_id': self.products[0].pk, 'quantity': 0}]},
+            {'items': [{'product_id': self.products[0].pk, 'quantity': 10 ** 10}]},
+            {'mode': 'replace', 'items': [{'product_id': self.products[0].pk, 'quantity': 1}]},
+        ]
+        for payload in bad_payloads:
+            response = self.client.post(self.url, payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
+
+        other_cart = Cart.objects.create(user=User.objects.create_user(username='other', password='x'))
+        payload = {'cart_id': other_cart.pk, 'items': [{'product_id': self.products[0].pk, 'quantity': 1}]}
+        response = self.client.post(self.url, payload, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(CartItem.objects.count(), 0)
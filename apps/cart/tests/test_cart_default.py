@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.cart.items import get_default_cart
+from apps.cart.models import Cart, CartItem
+from apps.products.models import Product
+
+User = get_user_model()
+
+
+class DefaultCartTestCase(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='default', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.product = Product.objects.create(title="Milk", description="d", price=1)
+        self.item_url = reverse('cart:cart-item-create')
+
+    def test_named_carts_do_not_break_adding_items(self):
+        Cart.objects.create(user=self.user, name='Breakfast')
+        Cart.objects.create(user=self.user, name='Dinner')
+
+        for _ in range(2):
+            response = self.client.post(self.item_url, {"product_id": self.product.pk, "quantity": 1}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        default = Cart.objects.get(user=self.user, is_default=True)
+        self.assertEqual(list(CartItem.objects.values_list('cart_id', 'quantity')), [(default.pk, 2)])
+
+    def test_resolved_once_per_request(self):
+        default = Cart.objects.create(user=self.user, is_default=True)
+        request = SimpleNamespace(user=self.user)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_default_cart(request), default)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_default_cart(request), default)
+
+    def test_one_default_per_user(self):
+        Cart.objects.create(user=self.user, is_default=True)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Cart.objects.create(user=self.user, is_default=True)
+
+    def test_switch_default(self):
+        first = Cart.objects.create(user=self.user, is_default=True)
+        second = Cart.objects.create(user=self.user, name='Party')
+
+        response = self.client.post(reverse('cart:cart-set-default', args=[second.pk]))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(Cart.objects.filter(user=self.user, is_default=True)), [second])
+
+        self.client.post(self.item_url, {"product_id": self.product.pk, "quantity": 1}, format='json')
+        self.assertFalse(first.items.exists())
+        self.assertTrue(second.items.exists())
+
+        other = Cart.objects.create(user=User.objects.create_user(username='other', password='x'))
+        response = self.client.post(reverse('cart:cart-set-default', args=[other.pk]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.cart.models import Cart, CartItem
+from apps.products.models import Product
+
+User = get_user_model()
+
+
+class CartTotalsTestCase(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='totals', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.cart = Cart.objects.create(user=self.user, is_default=True)
+        self.milk = Product.objects.create(title="Milk", description="d", price=Decimal("10.00"), discount=10)
+        self.bread = Product.objects.create(title="Bread", description="d", price=Decimal("4.00"))
+
+    def cached(self):
+        cart = Cart.objects.get(pk=self.cart.pk)
+        return cart.item_count, cart.total
+
+    def test_cached_totals_follow_item_changes(self):
+        item = CartItem.objects.create(cart=self.cart, product=self.milk, quantity=2)
+        CartItem.objects.create(cart=self.cart, product=self.bread, quantity=1)
+        self.assertEqual(self.cached(), (2, Decimal("22.00")))
+
+        item = CartItem.objects.get(pk=item.pk)
+        item.quantity = 5
+        item.save()
+        self.assertEqual(self.cached(), (2, Decimal("49.00")))
+
+        item.product = Product.objects.create(title="Tea", description="d", price=Decimal("4.00"))
+        item.save()
+        self.assertEqual(self.cached(), (2, Decimal("24.00")))
+
+        item.delete()
+        self.assertEqual(self.cached(), (1, Decimal("4.00")))
+
+    def test_cached_totals_through_the_api(self):
+        response = self.client.post(
+            reverse('cart:cart-item-create'), {"product_id": self.milk.pk, "quantity": 3}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        item_url = reverse('cart:cart-item-update-delete', args=[response.data['id']])
+
+        self.client.patch(item_url, {"quantity": 1}, format='json')
+        self.assertEqual(self.cached(), (1, Decimal("9.00")))
+
+        self.client.delete(item_url)
+        self.assertEqual(self.cached(), (0, Decimal("0.00")))
+
+    def test_summary_is_one_query_and_resyncs_cache(self):
+        CartItem.objects.create(cart=self.cart, product=self.milk, quantity=2)
+        CartItem.objects.create(cart=self.cart, product=self.bread, quantity=3)
+        # A price change the incremental cache can't see
+        Product.objects.filter(pk=self.bread.pk).update(price=Decimal("5.00"))
+        url = reverse('cart:cart-summary', args=[self.cart.pk])
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            'cart_id': self.cart.pk,
+            'item_count': 2,
+            'total_quantity': 5,
+            'total_price': "35.00",
+            'total_discounted_price': "33.00",
+        })
+        self.assertEqual(self.cached(), (2, Decimal("33.00")))
+
+        # In sync now: the aggregate is the only query
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+    def test_summary_of_empty_and_foreign_carts(self):
+        response = self.client.get(reverse('cart:cart-summary', args=[self.cart.pk]))
+        self.assertEqual((response.data['item_count'], response.data['total_price']), (0, "0.00"))
+
+        other = Cart.objects.create(user=User.objects.create_user(username='other', password='x'))
+        response = self.client.get(reverse('cart:cart-summary', args=[other.pk]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
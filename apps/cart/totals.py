@@ -0,0 +1,57 @@
+"""
+Cart totals computed by the database.
+
+``with_summary`` annotates carts with their figures from one aggregate
+query joining CartItem to Product; ``adjust_cart_totals`` applies the
+incremental changes behind the cached Cart.item_count / Cart.total.
+"""
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, F, Sum, Value
+from django.db.models.functions import Coalesce
+
+from apps.cart.models import Cart
+
+ZERO = Value(Decimal('0.00'), output_field=DecimalField(max_digits=30, decimal_places=2))
+SUMMARY_FIELDS = ('item_count', 'total_quantity', 'total_price', 'total_discounted_price')
+
+
+def with_summary(queryset):
+    """Annotate carts with item count, quantity and totals (before and after discount)."""
+    return queryset.annotate(
+        summary_item_count=Count('items'),
+        summary_total_quantity=Coalesce(Sum('items__quantity'), 0),
+        summary_total_price=Coalesce(
+            Sum(F('items__quantity') * F('items__product__price'), output_field=ZERO.output_field), ZERO
+        ),
+        summary_total_discounted_price=Coalesce(
+            Sum(F('items__quantity') * F('items__product__real_price'), output_field=ZERO.output_field), ZERO
+        ),
+    )
+
+
+def get_summary(cart) -> dict:
+    """Figures of a cart annotated by with_summary."""
+    return {field: getattr(cart, f'summary_{field}') for field in SUMMARY_FIELDS}
+
+
+def adjust_cart_totals(cart_id, items: int = 0, amount: Decimal = Decimal('0')):
+    """Shift the cached figures with one UPDATE (F expressions, safe under concurrency)."""
+    if not cart_id or (not items and not amount):
+        return
+    Cart.objects.filter(pk=cart_id).update(item_count=F('item_count') + items, total=F('total') + amount)
+
+
+def sync_cached_totals(cart, summary: dict):
+    """Correct the cached figures when they drifted (e.g. after product price changes)."""
+    item_count, total = summary['item_count'], summary['total_discounted_price']
+    if (cart.item_count, cart.total) != (item_count, total):
+        Cart.objects.filter(pk=cart.pk).update(item_count=item_count, total=total)
+        cart.item_count, cart.total = item_count, total
+
+
+def recalculate_cart_totals(cart_id):
+    """Recompute the cached figures of one cart from its items."""
+    cart = with_summary(Cart.objects.filter(pk=cart_id)).first()
+    if cart is not None:
+        sync_cached_totals(cart, get_summary(cart))
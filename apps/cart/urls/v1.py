@@ -1,14 +1,20 @@
 from django.conf import settings
 from django.urls import path
 from django.conf.urls.static import static
-from apps.cart.views.cart_create_list import CartListCreateAPIView, CartItemCreateAPIView, CartItemUpdateDeleteAPIView
+from apps.cart.views.cart_create_list import (
+    CartListCreateAPIView, CartItemCreateAPIView, CartItemUpdateDeleteAPIView, CartSummaryAPIView,
+    CartItemBatchAPIView, CartSetDefaultAPIView
+)
 
 
 app_name = 'cart'
 
 urlpatterns = [
     path('', CartListCreateAPIView.as_view(), name='cart-list-create'),
+    path('<int:pk>/summary/', CartSummaryAPIView.as_view(), name='cart-summary'),
+    path('<int:pk>/default/', CartSetDefaultAPIView.as_view(), name='cart-set-default'),
     path('items/', CartItemCreateAPIView.as_view(), name='cart-item-create'),
+    path('items/batch/', CartItemBatchAPIView.as_view(), name='cart-item-batch'),
     path('items/<int:pk>/', CartItemUpdateDeleteAPIView.as_view(), name='cart-item-update-delete')
 ]
 
@@ -1,6 +1,16 @@
-from rest_framework import generics, permissions
-from apps.cart.models import Cart, CartItem
-from apps.cart.serializers.cart_create import CartSerializer, CartItemSerializer
+import hashlib
+
+from django.db import transaction
+from django.db.models import Prefetch
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+from apps.cart.items import get_default_cart, set_default_cart, upsert_cart_items
+from apps.cart.models import Cart, CartIdempotencyKey, CartItem
+from apps.cart.serializers.cart_create import (
+    CartSerializer, CartItemBatchSerializer, CartItemSerializer, CartSummarySerializer
+)
+from apps.cart.totals import get_summary, sync_cached_totals, with_summary
 
 
 class CartListCreateAPIView(generics.ListCreateAPIView):
@@ -9,7 +19,9 @@ class CartListCreateAPIView(generics.ListCreateAPIView):
     
     
     def get_queryset(self):
-        return Cart.objects.filter(user=self.request.user)
+        # Items and their products in one query; media is loaded per page by CartListSerializer
+        items = CartItem.objects.select_related('product').order_by('id')
+        return Cart.objects.filter(user=self.request.user).prefetch_related(Prefetch('items', queryset=items))
     
     
     def perform_create(self, serializer):
@@ -23,8 +35,7 @@ class CartItemCreateAPIView(generics.CreateAPIView):
     
     
     def perform_create(self, serializer):
-        cart, _ = Cart.objects.get_or_create(user=self.request.user)
-        serializer.save(cart=cart)
+        serializer.save(cart=get_default_cart(self.request))
         
         
 class CartItemUpdateDeleteAPIView(generics.RetrieveUpdateDestroyAPIView):
@@ -36,8 +47,93 @@ class CartItemUpdateDeleteAPIView(generics.RetrieveUpdateDestroyAPIView):
     
     
     def get_queryset(self):
-        return CartItem.objects.filter(cart__user=self.request.user)
-    
+        return CartItem.objects.filter(cart__user=self.request.user).select_related('product')
 
-        
-    
\ No newline at end of file
+
+class CartSummaryAPIView(generics.RetrieveAPIView):
+    """Item count and totals of one cart from a single aggregate query."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return with_summary(Cart.objects.filter(user=self.request.user))
+
+    def retrieve(self, request, *args, **kwargs):
+        cart = self.get_object()
+        summary = get_summary(cart)
+        # Self-heals the badge figures (no write unless they drifted)
+        sync_cached_totals(cart, summary)
+        return Response(CartSummarySerializer({'cart_id': cart.pk, **summary}).data)
+
+
+class CartSetDefaultAPIView(generics.GenericAPIView):
+    """POST /cart/<id>/default/ makes the cart the one items are added to by default."""
+    serializer_class = CartSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        return Cart.objects.filter(user=self.request.user)
+
+    def post(self, request, *args, **kwargs):
+        cart = self.get_object()
+        set_default_cart(cart)
+        return Response({'cart_id': cart.pk, 'is_default': cart.is_default})
+
+
+class CartItemBatchAPIView(generics.GenericAPIView):
+    """
+    POST /cart/items/batch/
+
+    Apply many (product_id, quantity, notes) entries to a cart with one
+    upsert. With an Idempotency-Key header, a retried request gets the
+    stored response back instead of being applied twice.
+    """
+    serializer_class = CartItemBatchSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    idempotency_header = 'Idempotency-Key'
+
+    def post(self, request, *args, **kwargs):
+        key = request.headers.get(self.idempotency_header)
+        if not key:
+            return self.apply(request)
+
+        fingerprint = hashlib.sha256(request.body).hexdigest()
+        with transaction.atomic():
+            # A concurrent request with the same key waits here until this one commits
+            record, created = CartIdempotencyKey.objects.select_for_update().get_or_create(
+                user=request.user, key=key[:255], defaults={'fingerprint': fingerprint}
+            )
+            if not created:
+                if record.fingerprint != fingerprint:
+                    return Response(
+                        {'detail': f"{self.idempotency_header} was already used with a different request."},
+                        status=status.HTTP_422_UNPROCESSABLE_ENTITY
+                    )
+                if record.status_code is not None:
+                    response = Response(record.response, status=record.status_code)
+                    response['Idempotent-Replayed'] = 'true'
+                    return response
+
+            response = self.apply(request)
+            record.status_code, record.response = response.status_code, response.data
+            record.save(update_fields=['status_code', 'response'])
+        return response
+
+    def apply(self, request):
+        serializer = self.get_serializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        data = serializer.validated_data
+
+        if 'cart_id' in data:
+            cart = get_object_or_404(Cart, pk=data['cart_id'], user=request.user)
+        else:
+            cart = get_default_cart(request)
+
+        rows = upsert_cart_items(cart.pk, data['items'], data['mode'])
+        cart.refresh_from_db(fields=['item_count', 'total'])
+        return Response({
+            'cart_id': cart.pk,
+            'item_count': cart.item_count,
+            'total': str(cart.total),
+            'items': rows,
+        })
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0001_initial'),
+        ('products', '0004_alter_product_options_alter_product_category_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['recipient', '-created_at', '-id'], name='notification_feed_idx'),
+        ),
+    ]
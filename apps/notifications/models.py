@@ -33,6 +33,10 @@ class Notification(BaseModel):
     class Meta:
         db_table = 'notifications'
         ordering = ['-created_at']
+        indexes = [
+            # Keyset pagination of a user's feed: (created_at, id) descending
+            models.Index(fields=['recipient', '-created_at', '-id'], name='notification_feed_idx'),
+        ]
         
         def __str__(self):
             return f"{self.title} -> {self.recipient}"
\ No newline at end of file
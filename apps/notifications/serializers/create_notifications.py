@@ -4,6 +4,9 @@ from apps.products.models import Product
 
 
 class ProductMiniSerializer(serializers.ModelSerializer):
+    # GeneratedField maps to a ModelField (float in JSON); keep it a string like price
+    real_price = serializers.DecimalField(max_digits=30, decimal_places=2, read_only=True)
+
     class Meta:
         model = Product
         fields = ['id', 'title', 'description', 'price', 'real_price']
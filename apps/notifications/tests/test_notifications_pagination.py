@@ -0,0 +1,82 @@
+import base64
+import json
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.notifications.models import Notification
+
+User = get_user_model()
+
+
+class NotificationKeysetPaginationTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='reader', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('notifications:notifications-list')
+
+        now = timezone.now()
+        for i in range(25):
+            notification = Notification.objects.create(title=f"N{i}", message="msg", recipient=self.user)
+            # Pairs share a timestamp so the id tiebreak is exercised
+            Notification.objects.filter(pk=notification.pk).update(created_at=now - timedelta(minutes=i // 2))
+
+    def test_walk_forward_and_back(self):
+        expected = list(
+            Notification.objects.filter(recipient=self.user)
+            .order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+
+        seen, pages, cursor = [], [], ''
+        while cursor is not None:
+            response = self.client.get(self.url, {'cursor': cursor, 'page_size': 10})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append(response.data['pagination'])
+            seen.extend(item['id'] for item in response.data['results'])
+            cursor = response.data['pagination']['next_page']
+
+        self.assertEqual(seen, expected)
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0]['total_items'])
+        self.assertIsNone(pages[0]['prev_page'])
+
+        response = self.client.get(self.url, {'cursor': pages[2]['prev_page'], 'page_size': 10})
+        self.assertEqual([item['id'] for item in response.data['results']], expected[10:20])
+
+    def test_optional_count_and_invalid_cursor(self):
+        response = self.client.get(self.url, {'with_count': 'true'})
+        self.assertEqual(response.data['pagination']['total_items'], 25)
+        self.assertEqual(response.data['pagination']['total_pages'], 3)
+
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_malformed_cursor_values(self):
+        payloads = [
+            ["garbage", 1, False],
+            ["2026-01-01T00:00:00+00:00", "abc", False],
+            [{"a": 1}, 1, False],
+            [None, 1, False],
+            ["2026-01-01T00:00:00+00:00", 1, "yes"],
+        ]
+        for payload in payloads:
+            cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+            response = self.client.get(self.url, {'cursor': cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, payload)
+
+    def test_page_numbers_still_work(self):
+        expected = list(
+            Notification.objects.filter(recipient=self.user)
+            .order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['pagination']['current_page'], 1)
+        self.assertEqual(response.data['pagination']['next_page'], 2)
+
+        response = self.client.get(self.url, {'page': 2})
+        self.assertEqual(response.data['pagination']['current_page'], 2)
+        self.assertEqual([item['id'] for item in response.data['results']], expected[10:20])
@@ -9,12 +9,14 @@ from apps.notifications.serializers.create_notifications import NotificationSeri
 class NotificationViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = NotificationSerializer
+    # Page numbers by default; clients opt in to cursors with ?cursor=
+    count_strategy = 'approximate'
 
     def get_queryset(self):
         user = self.request.user
         if user.is_superuser:
             return Notification.objects.all()
-        return Notification.objects.filter(recipient=user).order_by('-created_at')
+        return Notification.objects.filter(recipient=user).order_by('-created_at', '-id')
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -1,3 +1,19 @@
 from django.contrib import admin
 
-# Register your models here.
+from apps.products.models import CampaignStatus, DiscountCampaign
+
+
+@admin.register(DiscountCampaign)
+class DiscountCampaignAdmin(admin.ModelAdmin):
+    list_display = ('name', 'discount', 'category', 'starts_at', 'ends_at', 'status')
+    list_filter = ('status', 'category')
+    raw_id_fields = ('products',)
+    readonly_fields = ('status', 'applied_at', 'finished_at')
+    # Fixed once applied: revert_campaign matches the applied discount and targets
+    applied_readonly_fields = ('discount', 'category', 'products', 'starts_at')
+
+    def get_readonly_fields(self, request, obj=None):
+        fields = super().get_readonly_fields(request, obj)
+        if obj is not None and obj.status != CampaignStatus.SCHEDULED:
+            fields = (*fields, *self.applied_readonly_fields)
+        return fields
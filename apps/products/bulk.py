@@ -0,0 +1,197 @@
+"""
+Bulk product import.
+
+Rows are validated in chunks and each chunk is written with one
+INSERT ... ON CONFLICT (sku) DO UPDATE and one media INSERT. bulk_create
+bypasses model signals, so what they do per row is done here once per
+batch: the per-language projections, the catalog version and the "new
+product" broadcast of apps.notifications.signals. real_price (generated
+column) and search_vector (trigger) are computed by the database.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
+from rest_framework import serializers
+
+from apps.notifications.models import Notification, NotificationType
+from apps.products.cache import bump_catalog_version
+from apps.products.models import Product
+from apps.products.projections import refresh_product_projections
+from apps.products.serializers.product_import import ProductImportSerializer
+from apps.shared.models import Media
+
+MEDIA_FIELD = 'images'
+
+# sku -> language code -> files
+MediaFiles = Dict[str, Dict[str, list]]
+
+
+def _update_fields():
+    """Columns overwritten when the sku already exists (created_at and uuid are kept)."""
+    translated = [
+        f"{name}_{code.lower()}" for name in ProductImportSerializer.translatable_fields
+        for code, _ in settings.LANGUAGES
+    ]
+    return [
+        'title', 'description', *translated, 'price', 'discount',
+        'measurement_type', 'is_active', 'category', 'updated_at'
+    ]
+
+
+def media_languages():
+    """Suffix ('en') -> language code as stored on Media."""
+    return {code.lower(): code for code, _ in settings.LANGUAGES}
+
+
+def parse_media_files(files) -> MediaFiles:
+    """
+    Group uploaded files by sku from multipart keys of the form
+    ``<sku>:images_<lang>`` (several files per key are allowed).
+    """
+    languages = media_languages()
+    media: MediaFiles = {}
+    invalid = []
+    for key in files:
+        sku, _, field_name = key.rpartition(':')
+        prefix, _, suffix = field_name.partition('_')
+        if not sku or prefix != MEDIA_FIELD or suffix not in languages:
+            invalid.append(key)
+            continue
+        media.setdefault(sku, {}).setdefault(languages[suffix], []).extend(files.getlist(key))
+
+    if invalid:
+        raise serializers.ValidationError(
+            {'files': [f"Unexpected file key {key!r}, expected '<sku>:{MEDIA_FIELD}_<lang>'." for key in invalid]}
+        )
+    return media
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    updated: int = 0
+    media: int = 0
+    errors: List[dict] = field(default_factory=list)
+
+    def as_dict(self):
+        return {'created': self.created, 'updated': self.updated, 'media': self.media, 'errors': self.errors}
+
+
+class ProductImporter:
+    """
+    Upsert products by sku in batches.
+
+    Invalid rows are reported in ``result.errors`` with their position in
+    the input and skipped; the rest of the batch is still imported.
+    """
+
+    def __init__(self, batch_size: Optional[int] = None, user=None, notify: bool = True):
+        self.batch_size = batch_size or settings.PRODUCT_IMPORT['BATCH_SIZE']
+        self.user = user if getattr(user, 'is_authenticated', False) else None
+        self.notify = notify
+        self.result = ImportResult()
+        # One serializer validates every row: the field layout is built once
+        self.serializer = ProductImportSerializer()
+        self.update_fields = _update_fields()
+
+    def run(self, rows: Iterable[dict], media: Optional[MediaFiles] = None) -> ImportResult:
+        batch, offset = [], 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self.import_batch(batch, media, offset)
+                offset += len(batch)
+                batch = []
+        if batch:
+            self.import_batch(batch, media, offset)
+        return self.result
+
+    def import_batch(self, rows: List[dict], media: Optional[MediaFiles] = None, offset: int = 0):
+        products = self.validate(rows, offset)
+        if not products:
+            return
+
+        with transaction.atomic():
+            saved = Product.objects.bulk_create(
+                products.values(),
+                update_conflicts=True,
+                unique_fields=['sku'],
+                update_fields=self.update_fields,
+            )
+            # Read before anything else locks these rows (projection FKs do)
+            created = self.count_inserted(saved)
+            updated = len(saved) - created
+            media_count = self.save_media(saved, media or {})
+
+            if self.notify and created:
+                # The shape send_product_notification broadcasts, once per batch
+                Notification.objects.create(
+                    type=NotificationType.PRODUCT,
+                    title="New products added!",
+                    message=f"{created} new products are now available.",
+                )
+
+            refresh_product_projections(product.pk for product in saved)
+            bump_catalog_version()
+
+        self.result.created += created
+        self.result.updated += updated
+        self.result.media += media_count
+
+    @staticmethod
+    def count_inserted(products: List[Product]) -> int:
+        """
+        How many of the just-upserted products the statement inserted.
+
+        xmax is 0 only on rows inserted (not updated) by this transaction,
+        as in apps.cart.items, so concurrent imports can't skew the count.
+        """
+        table = connection.ops.quote_name(Product._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT COUNT(*) FROM {table} WHERE id = ANY(%s) AND xmax = 0',
+                [[product.pk for product in products]]
+            )
+            return cursor.fetchone()[0]
+
+    def validate(self, rows: List[dict], offset: int) -> Dict[str, Product]:
+        """Valid rows as unsaved products keyed by sku (a repeated sku keeps its last row)."""
+        products = {}
+        for index, row in enumerate(rows, start=offset):
+            try:
+                data = self.serializer.run_validation(row)
+            except serializers.ValidationError as exc:
+                sku = row.get('sku') if isinstance(row, dict) else None
+                self.result.errors.append({'index': index, 'sku': sku, 'errors': exc.detail})
+                continue
+
+            data['discount'] = data.get('discount') or 0
+            products.pop(data['sku'], None)
+            products[data['sku']] = Product(**data)
+        return products
+
+    def save_media(self, products: List[Product], media: MediaFiles) -> int:
+        """Insert the media of every product in the batch with one query."""
+        content_type = ContentType.objects.get_for_model(Product)
+        rows = []
+        for product in products:
+            for language, files in media.get(product.sku, {}).items():
+                for file_obj in files:
+                    rows.append(Media(
+                        content_type=content_type,
+                        object_id=product.pk,
+                        file=file_obj,
+                        media_type="image",
+                        # Media.save() fills these; bulk_create doesn't call it
+                        file_size=file_obj.size,
+                        mime_type=getattr(file_obj, 'content_type', None) or 'application/octet-stream',
+                        original_filename=getattr(file_obj, 'name', None),
+                        uploaded_by=self.user,
+                        language=language,
+                        is_public=True,
+                    ))
+        Media.objects.bulk_create(rows)
+        return len(rows)
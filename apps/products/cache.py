@@ -0,0 +1,159 @@
+"""
+Read-through cache for the product catalog list.
+
+List responses are stored as rendered JSON, together with their ETag and
+Last-Modified, under a key built from the query parameters, device type,
+language and the catalog version. Saving or
+deleting a Product (or a Media row attached to one) bumps the version, so
+stale pages are never read again and simply expire.
+
+The version has to be seen by every process that writes products (all
+web workers, import_products, run_discount_campaigns), so the list cache
+is only used when the default cache is shared (Redis, Memcached or the
+database cache). With a per-process backend such as locmem it is
+bypassed; PRODUCT_CACHE['LIST_CACHE'] forces it on or off.
+
+List validators come from the catalog version and the request, without a
+query; the detail view derives its validators from one aggregate query
+over the product and its media.
+"""
+import hashlib
+import time
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+from django.db import transaction
+from django.db.models import Count, Max
+
+from apps.shared.utils.conditional import make_etag
+
+CATALOG_VERSION_KEY = 'products:catalog:version'
+LIST_KEY_PREFIX = 'products:list'
+
+# The same URL renders differently per language and device
+VARY_HEADERS = ('Accept-Language', 'Device-Token')
+
+# Backends every worker and management command sees the same data in
+SHARED_CACHE_BACKENDS = (RedisCache, BaseMemcachedCache, DatabaseCache)
+
+
+def _options():
+    return getattr(settings, 'PRODUCT_CACHE', {})
+
+
+def list_cache_enabled() -> bool:
+    """Whether list pages may be cached: forced by LIST_CACHE, else only on a shared backend."""
+    enabled = _options().get('LIST_CACHE')
+    if enabled is not None:
+        return enabled
+    return isinstance(caches[DEFAULT_CACHE_ALIAS], SHARED_CACHE_BACKENDS)
+
+
+def _new_version() -> int:
+    # Never reused, so a version lost to eviction can't bring back pages
+    # cached under an earlier value (as a restart from 1 would)
+    return time.time_ns()
+
+
+def get_catalog_version() -> int:
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # add() so concurrent first readers agree on the starting value
+        cache.add(CATALOG_VERSION_KEY, _new_version(), timeout=None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version if version is not None else _new_version()
+
+
+def _bump():
+    cache.set(CATALOG_VERSION_KEY, _new_version(), timeout=None)
+
+
+def bump_catalog_version():
+    """
+    Invalidate every cached catalog page.
+
+    Bumped immediately and again after commit, so a page cached from
+    pre-commit data in between is not served afterwards.
+    """
+    _bump()
+    transaction.on_commit(_bump)
+
+
+def _query_params(request):
+    return sorted((key, value) for key in request.query_params for value in request.query_params.getlist(key))
+
+
+def product_list_cache_key(request, version: Optional[int] = None) -> str:
+    """Key for one list page: query params, device type, language, catalog version."""
+    signature = hashlib.sha1(repr(_query_params(request)).encode()).hexdigest()
+    return ':'.join((
+        LIST_KEY_PREFIX,
+        str(version if version is not None else get_catalog_version()),
+        getattr(request, 'device_type', 'WEB'),
+        getattr(request, 'lang', '') or '',
+        signature,
+    ))
+
+
+def _request_signature(request) -> tuple:
+    return (
+        _query_params(request),
+        getattr(request, 'device_type', 'WEB'),
+        getattr(request, 'lang', ''),
+        # Response messages are negotiated from the full preference list
+        getattr(request, 'accept_languages', ()),
+        getattr(request, 'accepted_media_type', ''),
+    )
+
+
+def list_validators(request, version: int) -> Tuple[str, datetime]:
+    """
+    ETag and Last-Modified of a list page without touching the database.
+
+    Any product or media change bumps the shared catalog version, so the
+    version plus the query signature identifies the page content. The
+    version is the time of the last bump, which is the Last-Modified.
+    """
+    etag = make_etag(version, *_request_signature(request))
+    return etag, datetime.fromtimestamp(version / 1e9, tz=timezone.utc)
+
+
+def product_validators(queryset, request):
+    """
+    ETag and Last-Modified for the product detail in ``queryset``.
+
+    One aggregate query: latest product/media ``updated_at`` plus product and
+    media counts, so deletions also change the ETag. The ETag additionally
+    covers query params, device type, language and response format.
+    Lists use list_validators (or the rendered page) instead: this join over
+    every filtered product is only cheap for a single row.
+
+    Returns:
+        (etag, last_modified, product_count)
+    """
+    state = queryset.order_by().aggregate(
+        updated=Max('updated_at'),
+        products=Count('id', distinct=True),
+        media_updated=Max('media_files__updated_at'),
+        media=Count('media_files', distinct=True),
+    )
+    etag = make_etag(
+        state['updated'], state['products'], state['media_updated'], state['media'],
+        *_request_signature(request)
+    )
+    last_modified = max(filter(None, (state['updated'], state['media_updated'])), default=None)
+    return etag, last_modified, state['products']
+
+
+def get_cached_list(key: str) -> Optional[bytes]:
+    """Rendered page content or None"""
+    return cache.get(key)
+
+
+def set_cached_list(key: str, content: bytes):
+    cache.set(key, content, _options().get('LIST_TTL', 300))
@@ -0,0 +1,119 @@
+"""
+Discount campaigns: set-based apply / revert.
+
+Applying a campaign snapshots the current discount of every targeted
+product with one INSERT ... SELECT and sets the campaign discount with one
+UPDATE; reverting restores the snapshot with one UPDATE. No product is
+loaded into Python and no model signal runs.
+
+Only the affected rows get a new updated_at, so ETags of untouched
+products stay valid; the catalog version (list pages) is bumped only when
+some row changed. Projections hold no prices and are left alone.
+"""
+import logging
+
+from django.db import connection, transaction
+from django.db.models import OuterRef, Q, Subquery
+from django.utils import timezone
+
+from apps.products.cache import bump_catalog_version
+from apps.products.models import CampaignStatus, DiscountCampaign, DiscountCampaignItem, Product
+
+logger = logging.getLogger(__name__)
+
+
+def target_products(campaign: DiscountCampaign):
+    """Products in the campaign category or its product list, minus those another active campaign holds."""
+    match = Q(pk__in=campaign.products.values('pk'))
+    if campaign.category:
+        match |= Q(category=campaign.category)
+    return Product.objects.filter(match).exclude(
+        campaign_items__campaign__status=CampaignStatus.ACTIVE
+    )
+
+
+def apply_campaign(campaign: DiscountCampaign, now=None) -> int:
+    """Snapshot and overwrite the discount of the targeted products; returns the rows changed."""
+    now = now or timezone.now()
+    with transaction.atomic():
+        targets_sql, params = target_products(campaign).values('id', 'discount').query.sql_with_params()
+        table = connection.ops.quote_name(DiscountCampaignItem._meta.db_table)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {table} (campaign_id, product_id, previous_discount) '
+                f'SELECT %s, target.id, target.discount FROM ({targets_sql}) AS target '
+                f'ON CONFLICT DO NOTHING',
+                [campaign.pk, *params]
+            )
+
+        changed = Product.objects.filter(
+            campaign_items__campaign=campaign
+        ).exclude(discount=campaign.discount).update(discount=campaign.discount, updated_at=now)
+
+        campaign.status = CampaignStatus.ACTIVE
+        campaign.applied_at = now
+        campaign.save(update_fields=['status', 'applied_at', 'updated_at'])
+        if changed:
+            bump_catalog_version()
+
+    logger.info("Applied discount campaign %s to %s products", campaign.pk, changed)
+    return changed
+
+
+def revert_campaign(campaign: DiscountCampaign, now=None) -> int:
+    """
+    Restore the snapshotted discounts; returns the rows changed.
+
+    Products whose discount was edited while the campaign ran keep the edit.
+    """
+    now = now or timezone.now()
+    previous = DiscountCampaignItem.objects.filter(
+        campaign=campaign, product=OuterRef('pk')
+    ).values('previous_discount')[:1]
+
+    with transaction.atomic():
+        changed = Product.objects.filter(
+            campaign_items__campaign=campaign, discount=campaign.discount
+        ).update(discount=Subquery(previous), updated_at=now)
+
+        campaign.status = CampaignStatus.FINISHED
+        campaign.finished_at = now
+        campaign.save(update_fields=['status', 'finished_at', 'updated_at'])
+        if changed:
+            bump_catalog_version()
+
+    logger.info("Reverted discount campaign %s on %s products", campaign.pk, changed)
+    return changed
+
+
+def run_due_campaigns(now=None) -> dict:
+    """
+    Revert ended campaigns, then apply started ones (so back-to-back
+    campaigns hand products over). Campaigns locked by a concurrent run
+    are skipped.
+    """
+    now = now or timezone.now()
+    summary = {'applied': 0, 'reverted': 0, 'expired': 0}
+
+    ending = DiscountCampaign.objects.filter(status=CampaignStatus.ACTIVE, ends_at__lte=now)
+    for pk in ending.values_list('pk', flat=True):
+        with transaction.atomic():
+            campaign = ending.select_for_update(skip_locked=True).filter(pk=pk).first()
+            if campaign is not None:
+                revert_campaign(campaign, now)
+                summary['reverted'] += 1
+
+    # Missed entirely (e.g. the scheduler was down): never applied
+    summary['expired'] = DiscountCampaign.objects.filter(
+        status=CampaignStatus.SCHEDULED, ends_at__lte=now
+    ).update(status=CampaignStatus.FINISHED, finished_at=now, updated_at=now)
+
+    starting = DiscountCampaign.objects.filter(status=CampaignStatus.SCHEDULED, starts_at__lte=now)
+    for pk in starting.order_by('starts_at', 'pk').values_list('pk', flat=True):
+        with transaction.atomic():
+            campaign = starting.select_for_update(skip_locked=True).filter(pk=pk).first()
+            if campaign is not None:
+                apply_campaign(campaign, now)
+                summary['applied'] += 1
+
+    return summary
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:26
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0004_alter_product_options_alter_product_category_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductProjection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('language', models.CharField(max_length=8)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField(blank=True, default='')),
+                ('media', models.JSONField(blank=True, default=list)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='projections', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'product projection',
+                'verbose_name_plural': 'product projections',
+                'constraints': [models.UniqueConstraint(fields=('language', 'product'), name='product_projection_language_uniq')],
+            },
+        ),
+    ]
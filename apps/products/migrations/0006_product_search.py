@@ -0,0 +1,78 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:28
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# 'simple' config: no stemming, so Uzbek and English tokens behave the same
+SEARCH_TRIGGER_SQL = """
+CREATE FUNCTION products_product_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.title_en, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.title_uz, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.description_en, '')), 'B') ||
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.description_uz, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER products_product_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title_en, title_uz, description_en, description_uz, search_vector
+    ON products_product
+    FOR EACH ROW EXECUTE FUNCTION products_product_search_vector_update();
+
+UPDATE products_product SET search_vector = NULL;
+"""
+
+DROP_SEARCH_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS products_product_search_vector_trigger ON products_product;
+DROP FUNCTION IF EXISTS products_product_search_vector_update();
+"""
+
+TRIGRAM_INDEXES = {
+    'product_title_en_trgm': 'title_en',
+    'product_title_uz_trgm': 'title_uz',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    pg_trgm is a contrib extension; installs without it still get
+    full-text search, and the search view skips trigram matching.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON products_product USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_product_projection'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='product_search_vector_gin'),
+        ),
+        migrations.RunSQL(SEARCH_TRIGGER_SQL, DROP_SEARCH_TRIGGER_SQL),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
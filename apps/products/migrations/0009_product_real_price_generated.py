@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:36
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    A column can't be altered into a generated one, so real_price is dropped
+    and re-added (PostgreSQL recomputes every row); the price indexes built
+    on it are recreated afterwards.
+    """
+
+    dependencies = [
+        ('products', '0008_product_sku'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_active_price_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='product_category_price_idx',
+        ),
+        migrations.RemoveField(
+            model_name='product',
+            name='real_price',
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='real_price',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('price'), '-', django.db.models.expressions.CombinedExpression(django.db.models.expressions.CombinedExpression(models.F('price'), '*', models.F('discount')), '/', models.Value(100))), output_field=models.DecimalField(decimal_places=2, max_digits=30)),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['real_price', 'id'], name='product_active_price_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', 'real_price', 'id'], name='product_category_price_idx'),
+        ),
+    ]
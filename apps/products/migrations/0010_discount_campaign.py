@@ -0,0 +1,71 @@
+# Generated by Django 5.2.7 on 2026-10-18 09:37
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_product_real_price_generated'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DiscountCampaign',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.UUIDField(db_index=True, default=uuid.uuid4, editable=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=255)),
+                ('discount', models.PositiveSmallIntegerField(validators=[django.core.validators.MaxValueValidator(100)])),
+                ('category', models.CharField(blank=True, choices=[('BREAKFAST', 'Breakfast'), ('LUNCH', 'Lunch'), ('DINNER', 'Dinner'), ('ALL', 'All')], null=True)),
+                ('starts_at', models.DateTimeField()),
+                ('ends_at', models.DateTimeField()),
+                ('status', models.CharField(choices=[('SCHEDULED', 'Scheduled'), ('ACTIVE', 'Active'), ('FINISHED', 'Finished')], default='SCHEDULED')),
+                ('applied_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('products', models.ManyToManyField(blank=True, related_name='targeting_campaigns', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'discount campaign',
+                'verbose_name_plural': 'discount campaigns',
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountCampaignItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('previous_discount', models.PositiveSmallIntegerField()),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='products.discountcampaign')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='campaign_items', to='products.product')),
+            ],
+            options={
+                'verbose_name': 'discount campaign item',
+                'verbose_name_plural': 'discount campaign items',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='discountcampaign',
+            index=models.Index(fields=['status', 'starts_at'], name='discount_campaign_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discountcampaign',
+            index=models.Index(fields=['status', 'ends_at'], name='discount_campaign_end_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='discountcampaign',
+            constraint=models.CheckConstraint(condition=models.Q(('discount__lte', 100)), name='discount_campaign_discount_lte_100'),
+        ),
+        migrations.AddConstraint(
+            model_name='discountcampaign',
+            constraint=models.CheckConstraint(condition=models.Q(('ends_at__gt', models.F('starts_at'))), name='discount_campaign_ends_after_start'),
+        ),
+        migrations.AddConstraint(
+            model_name='discountcampaignitem',
+            constraint=models.UniqueConstraint(fields=('campaign', 'product'), name='discount_campaign_item_uniq'),
+        ),
+    ]
@@ -1,4 +1,7 @@
 from django.contrib.contenttypes.fields import GenericRelation
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.core.validators import MaxValueValidator
 from django.db import models
 from apps.shared.models import BaseModel
 
@@ -21,12 +24,19 @@ class Product(BaseModel):
         'shared.Media',
         related_query_name='products'
     )
+    # Supplier code; the conflict target of bulk imports (apps.products.bulk)
+    sku = models.CharField(max_length=64, unique=True, null=True, blank=True)
     title = models.CharField(max_length=255, db_index=True)
     description = models.TextField()
 
     discount = models.PositiveSmallIntegerField(default=0)
     price = models.DecimalField(max_digits=30, decimal_places=2)
-    real_price = models.DecimalField(max_digits=30, decimal_places=2)
+    # Computed by PostgreSQL, so QuerySet.update() and bulk writes keep it in step
+    real_price = models.GeneratedField(
+        expression=models.F('price') - models.F('price') * models.F('discount') / 100,
+        output_field=models.DecimalField(max_digits=30, decimal_places=2),
+        db_persist=True,
+    )
 
     category = models.CharField(
         choices=ProductCategory, default=ProductCategory.ALL,
@@ -37,9 +47,132 @@ class Product(BaseModel):
     )
     is_active = models.BooleanField(default=True)
 
+    # Maintained by a database trigger from title_*/description_* (migration 0006)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        # INSERT returns real_price; after an UPDATE defer it so the next read
+        # loads the value PostgreSQL computed instead of the stale one
+        if not adding:
+            self.__dict__.pop('real_price', None)
+
     class Meta:
         verbose_name = 'product'
         verbose_name_plural = 'products'
+        indexes = [
+            GinIndex(fields=['search_vector'], name='product_search_vector_gin'),
+            # Listing indexes (see serializers.product_filter); all partial on
+            # is_active because the list only ever shows active products
+            models.Index(
+                fields=['-created_at', '-id'], name='product_active_created_idx',
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=['real_price', 'id'], name='product_active_price_idx',
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=['category', '-created_at', '-id'], name='product_category_created_idx',
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=['category', 'real_price', 'id'], name='product_category_price_idx',
+                condition=models.Q(is_active=True),
+            ),
+            models.Index(
+                fields=['measurement_type', '-created_at', '-id'], name='product_measure_created_idx',
+                condition=models.Q(is_active=True),
+            ),
+            # Discounted products only: min_discount > 0 implies discount > 0
+            models.Index(
+                fields=['-created_at', '-id'], name='product_discounted_created_idx',
+                condition=models.Q(is_active=True, discount__gt=0),
+            ),
+        ]
+
+
+class ProductProjection(BaseModel):
+    """
+    Denormalized read model: one row per (product, language) with the
+    translated text (fallback already applied) and that language's media.
+    Maintained by apps.products.projections from Product/Media signals.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='projections')
+    language = models.CharField(max_length=8)
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True, default='')
+    media = models.JSONField(default=list, blank=True)
+
+    def __str__(self):
+        return f"{self.product_id} [{self.language}]"
+
+    class Meta:
+        verbose_name = 'product projection'
+        verbose_name_plural = 'product projections'
+        constraints = [
+            # Also the index behind the per-page lookup (language, product__in)
+            models.UniqueConstraint(fields=['language', 'product'], name='product_projection_language_uniq'),
+        ]
+
+
+class CampaignStatus(models.TextChoices):
+    SCHEDULED = "SCHEDULED", "Scheduled"
+    ACTIVE = "ACTIVE", "Active"
+    FINISHED = "FINISHED", "Finished"
+
+
+class DiscountCampaign(BaseModel):
+    """
+    A discount applied to a category and/or a list of products between
+    starts_at and ends_at. Applied and reverted in bulk by
+    apps.products.campaigns (run_discount_campaigns command).
+    """
+    name = models.CharField(max_length=255)
+    discount = models.PositiveSmallIntegerField(validators=[MaxValueValidator(100)])
+    category = models.CharField(choices=ProductCategory, null=True, blank=True)
+    products = models.ManyToManyField(Product, blank=True, related_name='targeting_campaigns')
+    starts_at = models.DateTimeField()
+    ends_at = models.DateTimeField()
+    status = models.CharField(choices=CampaignStatus, default=CampaignStatus.SCHEDULED)
+    applied_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.name} (-{self.discount}%)"
+
+    class Meta:
+        verbose_name = 'discount campaign'
+        verbose_name_plural = 'discount campaigns'
+        constraints = [
+            models.CheckConstraint(condition=models.Q(discount__lte=100), name='discount_campaign_discount_lte_100'),
+            models.CheckConstraint(
+                condition=models.Q(ends_at__gt=models.F('starts_at')), name='discount_campaign_ends_after_start'
+            ),
+        ]
+        indexes = [
+            # The scheduler's two lookups: due to start / due to end
+            models.Index(fields=['status', 'starts_at'], name='discount_campaign_start_idx'),
+            models.Index(fields=['status', 'ends_at'], name='discount_campaign_end_idx'),
+        ]
+
+
+class DiscountCampaignItem(models.Model):
+    """A product a campaign changed, with the discount to restore when it ends."""
+    campaign = models.ForeignKey(DiscountCampaign, on_delete=models.CASCADE, related_name='items')
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='campaign_items')
+    previous_discount = models.PositiveSmallIntegerField()
+
+    def __str__(self):
+        return f"{self.campaign_id}: {self.product_id}"
+
+    class Meta:
+        verbose_name = 'discount campaign item'
+        verbose_name_plural = 'discount campaign items'
+        constraints = [
+            models.UniqueConstraint(fields=['campaign', 'product'], name='discount_campaign_item_uniq'),
+        ]
@@ -0,0 +1,130 @@
+"""
+Per-language product projections (ProductProjection rows).
+
+Each row holds what a MOBILE client sees for one product in one language:
+title/description with the translation fallback applied and the media list
+for that language, so a page of products is read in one indexed query
+instead of modeltranslation lookups plus media queries.
+"""
+from collections import defaultdict
+from typing import Iterable
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.utils import translation
+
+from apps.products.models import Product, ProductProjection
+from apps.shared.models import Media
+
+PROJECTION_INDEX_CONTEXT_KEY = "product_projections"
+TRANSLATED_TEXT_FIELDS = ('title', 'description')
+
+
+def _languages():
+    return [code.lower() for code, _ in settings.LANGUAGES]
+
+
+def serialize_media(media: Media) -> dict:
+    """Same shape as TranslatedFieldsReadMixin._get_media."""
+    url = getattr(media.file, 'url', None) if media.file else None
+    return {
+        "id": str(media.id),
+        "url": url,
+        "filename": media.original_filename or getattr(media.file, 'name', None),
+        "language": media.language,
+    }
+
+
+def build_projections(products: Iterable[Product]) -> list:
+    """Unsaved ProductProjection rows for every product and language (one media query)."""
+    products = list(products)
+    if not products:
+        return []
+
+    media_by_key = defaultdict(list)
+    media_qs = Media.objects.filter(
+        content_type=ContentType.objects.get_for_model(Product),
+        object_id__in=[product.pk for product in products],
+    )
+    for media in media_qs:
+        media_by_key[(media.object_id, (media.language or "").lower())].append(serialize_media(media))
+
+    rows = []
+    # Requests run with LANGUAGE_CODE active, so the base-field fallback matches
+    with translation.override(settings.LANGUAGE_CODE):
+        for product in products:
+            for language in _languages():
+                text = {}
+                for field_name in TRANSLATED_TEXT_FIELDS:
+                    value = getattr(product, f"{field_name}_{language}", None)
+                    if value in (None, ""):
+                        value = getattr(product, field_name, "")
+                    text[field_name] = value or ""
+                rows.append(ProductProjection(
+                    product=product,
+                    language=language,
+                    media=media_by_key[(product.pk, language)],
+                    **text,
+                ))
+    return rows
+
+
+def refresh_product_projections(product_ids: Iterable[int]):
+    """Rebuild the projection rows of the given products (missing products are skipped)."""
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+
+    rows = build_projections(Product.objects.filter(pk__in=product_ids))
+    with transaction.atomic():
+        # Languages removed from settings.LANGUAGES must not linger
+        ProductProjection.objects.filter(product_id__in=product_ids).exclude(language__in=_languages()).delete()
+        ProductProjection.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['language', 'product'],
+            update_fields=['title', 'description', 'media', 'updated_at'],
+        )
+
+
+class ProjectionIndex:
+    """
+    Projection rows for one language, shared through the serializer context
+    so a whole page is fetched in one query.
+    """
+
+    def __init__(self, language: str):
+        self.language = language
+        self._rows = {}
+        self._loaded = set()
+
+    def load(self, instances):
+        pending = {
+            instance.pk for instance in instances
+            if isinstance(instance, models.Model) and instance.pk is not None and instance.pk not in self._loaded
+        }
+        if not pending:
+            return
+        rows = ProductProjection.objects.filter(language=self.language, product_id__in=pending).only(
+            'product_id', 'title', 'description', 'media'
+        )
+        for row in rows:
+            self._rows[row.product_id] = row
+        self._loaded.update(pending)
+
+    def get(self, instance):
+        """Projection row, or None (not loaded or not built yet)."""
+        return self._rows.get(getattr(instance, 'pk', None))
+
+
+def get_projection_index(context):
+    """ProjectionIndex for MOBILE requests (one language), else None."""
+    request = context.get("request")
+    lang = getattr(request, "lang", None)
+    if getattr(request, "device_type", "WEB") != "MOBILE" or not lang:
+        return None
+    index = context.get(PROJECTION_INDEX_CONTEXT_KEY)
+    if index is None or index.language != lang:
+        index = context[PROJECTION_INDEX_CONTEXT_KEY] = ProjectionIndex(lang)
+    return index
@@ -0,0 +1,64 @@
+"""
+Product search: PostgreSQL full-text search over every title_*/description_*
+column, with pg_trgm word similarity on titles for typo tolerance when the
+extension is installed.
+"""
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast, Greatest
+
+from apps.products.models import Product
+
+SEARCH_CONFIG = 'simple'
+MAX_TERMS = 8
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+@lru_cache(maxsize=1)
+def trigram_enabled() -> bool:
+    """Whether pg_trgm is installed in the current database (checked once per process)."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def build_search_query(text: str):
+    """
+    Prefix-matching tsquery from free text: 'sut ich' -> 'sut:* & ich:*'.
+    Returns None when the text has no searchable tokens.
+    """
+    tokens = TOKEN_RE.findall(text.lower())[:MAX_TERMS]
+    if not tokens:
+        return None
+    return SearchQuery(' & '.join(f'{token}:*' for token in tokens), search_type='raw', config=SEARCH_CONFIG)
+
+
+def search_products(text: str, queryset=None):
+    """
+    Active products matching ``text``, annotated with ``rank`` and ordered by
+    (rank, id) descending, which is what keyset pagination walks.
+    """
+    queryset = Product.objects.filter(is_active=True) if queryset is None else queryset
+    query = build_search_query(text)
+    if query is None:
+        return queryset.none()
+
+    match = Q(search_vector=query)
+    rank = SearchRank(F('search_vector'), query)
+
+    if trigram_enabled():
+        title_fields = [f'title_{code.lower()}' for code, _ in settings.LANGUAGES]
+        for field in title_fields:
+            match |= Q(**{f'{field}__trigram_word_similar': text})
+        similarities = [TrigramWordSimilarity(text, field) for field in title_fields]
+        rank = rank + (Greatest(*similarities) if len(similarities) > 1 else similarities[0])
+
+    return queryset.filter(match).annotate(
+        # float8 so the cursor value round-trips exactly
+        rank=Cast(rank, FloatField())
+    ).order_by('-rank', '-id')
@@ -0,0 +1,55 @@
+from rest_framework import serializers
+
+from apps.products.models import MeasurementType, ProductCategory
+
+# ordering param -> ORDER BY; each has a matching partial index in Product.Meta
+ORDERINGS = {
+    '-created_at': ('-created_at', '-id'),
+    'created_at': ('created_at', 'id'),
+    'real_price': ('real_price', 'id'),
+    '-real_price': ('-real_price', '-id'),
+}
+DEFAULT_ORDERING = '-created_at'
+
+
+class ProductListFilterSerializer(serializers.Serializer):
+    """
+    Query parameters of the product list.
+
+    Price bounds apply to real_price (the price after discount).
+    """
+    category = serializers.ChoiceField(choices=ProductCategory.choices, required=False)
+    measurement_type = serializers.ChoiceField(choices=MeasurementType.choices, required=False)
+    min_price = serializers.DecimalField(max_digits=30, decimal_places=2, min_value=0, required=False)
+    max_price = serializers.DecimalField(max_digits=30, decimal_places=2, min_value=0, required=False)
+    min_discount = serializers.IntegerField(min_value=0, max_value=100, required=False)
+    ordering = serializers.ChoiceField(choices=list(ORDERINGS), default=DEFAULT_ORDERING)
+
+    def validate(self, attrs):
+        min_price, max_price = attrs.get('min_price'), attrs.get('max_price')
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise serializers.ValidationError({'max_price': ["Must be greater than or equal to min_price."]})
+        return attrs
+
+    def filter_queryset(self, queryset):
+        data = self.validated_data
+
+        if 'category' in data:
+            queryset = queryset.filter(category=data['category'])
+        if 'measurement_type' in data:
+            queryset = queryset.filter(measurement_type=data['measurement_type'])
+        if 'min_price' in data:
+            queryset = queryset.filter(real_price__gte=data['min_price'])
+        if 'max_price' in data:
+            queryset = queryset.filter(real_price__lte=data['max_price'])
+        if data.get('min_discount'):
+            queryset = queryset.filter(discount__gte=data['min_discount'])
+
+        return queryset.order_by(*ORDERINGS[data['ordering']])
+
+    def get_keyset_fields(self):
+        """(order field, tiebreak) for cursor pagination; cursors only walk descending orders."""
+        ordering = self.validated_data['ordering']
+        if not ordering.startswith('-'):
+            return None
+        return ordering[1:], 'id'
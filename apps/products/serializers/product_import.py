@@ -0,0 +1,35 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from apps.products.models import Product
+from apps.shared.mixins.translation_mixins import TranslatedFieldsWriteMixin
+
+
+class ProductImportSerializer(TranslatedFieldsWriteMixin, serializers.ModelSerializer):
+    """
+    One row of a bulk import (apps.products.bulk).
+
+    Media is not part of the row: files are passed to the importer
+    separately, keyed by sku.
+    """
+    translatable_fields = ['title', 'description']
+    media_fields = []
+
+    class Meta:
+        model = Product
+        fields = [
+            'sku', 'title', 'description', 'price',
+            'measurement_type', 'is_active', 'category', 'discount'
+        ]
+        extra_kwargs = {
+            # Conflicts on sku are the upsert itself, not a validation error
+            'sku': {'required': True, 'allow_null': False, 'allow_blank': False, 'validators': []},
+            'price': {'min_value': 0},
+            'discount': {'max_value': 100},
+        }
+
+    def validate(self, attrs):
+        titles = [attrs.get('title')] + [attrs.get(f"title_{code.lower()}") for code, _ in settings.LANGUAGES]
+        if not any(titles):
+            raise serializers.ValidationError({'title': ["At least one translation is required."]})
+        return attrs
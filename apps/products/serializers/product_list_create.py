@@ -1,8 +1,12 @@
+from django.db import models
 from rest_framework import serializers
 from apps.products.models import Product
+from apps.products.projections import TRANSLATED_TEXT_FIELDS, get_projection_index
 from apps.shared.mixins.translation_mixins import (
     TranslatedFieldsWriteMixin,
-    TranslatedFieldsReadMixin
+    TranslatedFieldsReadMixin,
+    TranslatedMediaListSerializer,
+    get_media_index
 )
 
 
@@ -11,6 +15,47 @@ class ProductTranslationMixin:
     media_fields = ['images']
 
 
+class ProductProjectionListSerializer(TranslatedMediaListSerializer):
+    """
+    MOBILE pages read ProductProjection rows in one query; media is only
+    prefetched for products whose projection hasn't been built.
+    """
+
+    def to_representation(self, data):
+        projections = get_projection_index(self.context)
+        if projections is None:
+            return super().to_representation(data)
+
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        items = list(iterable)
+        projections.load(items)
+
+        missing = [item for item in items if projections.get(item) is None]
+        if missing:
+            get_media_index(self.context).load(missing)
+
+        return [self.child.to_representation(item) for item in items]
+
+
+class ProductProjectionReadMixin:
+    """Serve MOBILE representations from ProductProjection, falling back to the live path."""
+
+    def to_representation(self, instance):
+        projections = get_projection_index(self.context)
+        if projections is not None:
+            projections.load([instance])
+            projection = projections.get(instance)
+            if projection is not None:
+                # Plain model fields only; translated fields come from the projection
+                data = super(TranslatedFieldsReadMixin, self).to_representation(instance)
+                for field_name in TRANSLATED_TEXT_FIELDS:
+                    data[field_name] = getattr(projection, field_name)
+                for field_name in self.media_fields:
+                    data[field_name] = projection.media
+                return data
+        return super().to_representation(instance)
+
+
 # -----------------------------
 # CREATE / UPDATE Serializer
 # -----------------------------
@@ -29,8 +74,11 @@ class ProductCreateSerializer(
 # LIST / GET Serializer
 # -----------------------------
 class ProductListSerializer(
-    ProductTranslationMixin, TranslatedFieldsReadMixin, serializers.ModelSerializer
+    ProductTranslationMixin, ProductProjectionReadMixin, TranslatedFieldsReadMixin, serializers.ModelSerializer
 ):
+    # GeneratedField maps to a ModelField (float in JSON); keep it a string like price
+    real_price = serializers.DecimalField(max_digits=30, decimal_places=2, read_only=True)
+
     class Meta:
         model = Product
         fields = [
@@ -38,6 +86,7 @@ class ProductListSerializer(
             'measurement_type', 'created_at', 'is_active',
             'category', 'discount', 'title', 'description'
         ]
+        list_serializer_class = ProductProjectionListSerializer
    
 
 
@@ -45,8 +94,10 @@ class ProductListSerializer(
 # DETAIL Serializer
 # -----------------------------
 class ProductDetailSerializer(
-    ProductTranslationMixin, TranslatedFieldsReadMixin, serializers.ModelSerializer
+    ProductTranslationMixin, ProductProjectionReadMixin, TranslatedFieldsReadMixin, serializers.ModelSerializer
 ):
+    real_price = serializers.DecimalField(max_digits=30, decimal_places=2, read_only=True)
+
     class Meta:
         model = Product
         fields = [
@@ -54,4 +105,5 @@ class ProductDetailSerializer(
             'price', 'real_price', 'measurement_type',
             'created_at', 'is_active', 'category', 'discount'
         ]
+        list_serializer_class = ProductProjectionListSerializer
    
@@ -1,14 +1,30 @@
+from django.contrib.contenttypes.models import ContentType
 from django.dispatch import receiver
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_delete, post_save
 
+from apps.products.cache import bump_catalog_version
 from apps.products.models import Product
+from apps.products.projections import refresh_product_projections
+from apps.shared.models import Media
 
 
-@receiver(pre_save, sender=Product)
-def update_real_price_field(sender, instance, **kwargs):
-    if instance.discount is None:
-        instance.discount = 0
-    if instance.discount < 0:
-        raise ValueError("Discount cannot be negative")
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_catalog_on_product_change(sender, instance, **kwargs):
+    bump_catalog_version()
 
-    instance.real_price = instance.price - (instance.price * instance.discount / 100)
\ No newline at end of file
+
+@receiver(post_save, sender=Product)
+def refresh_projections_on_product_save(sender, instance, raw=False, **kwargs):
+    # Rows of deleted products go with the FK cascade
+    if not raw:
+        refresh_product_projections([instance.pk])
+
+
+@receiver(post_save, sender=Media)
+@receiver(post_delete, sender=Media)
+def invalidate_catalog_on_media_change(sender, instance, raw=False, **kwargs):
+    if instance.content_type_id and instance.content_type_id == ContentType.objects.get_for_model(Product).id:
+        bump_catalog_version()
+        if not raw:
+            refresh_product_projections([instance.object_id])
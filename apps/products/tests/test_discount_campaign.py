@@ -0,0 +1,93 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.products.cache import get_catalog_version
+from apps.products.campaigns import apply_campaign, revert_campaign, run_due_campaigns
+from apps.products.models import CampaignStatus, DiscountCampaign, Product
+
+
+class TestDiscountCampaign(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.lunch = [self.create_product("Soup", "LUNCH", discount=5), self.create_product("Plov", "LUNCH")]
+        self.dinner = self.create_product("Steak", "DINNER", discount=10)
+
+    def create_product(self, title, category, discount=0):
+        return Product.objects.create(
+            title_en=title, description_en="d", price=Decimal("100.00"), category=category, discount=discount
+        )
+
+    def create_campaign(self, discount=30, category=None, products=(), starts_in=-1, ends_in=60):
+        campaign = DiscountCampaign.objects.create(
+            name="Sale", discount=discount, category=category,
+            starts_at=self.now + timedelta(minutes=starts_in), ends_at=self.now + timedelta(minutes=ends_in),
+        )
+        campaign.products.set(products)
+        return campaign
+
+    def discounts(self):
+        return dict(Product.objects.values_list('pk', 'discount'))
+
+    def test_apply_is_set_based_and_scoped(self):
+        campaign = self.create_campaign(category="LUNCH", products=[self.lunch[0]])
+        dinner_updated_at = self.dinner.updated_at
+        version = get_catalog_version()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(apply_campaign(campaign), 2)
+
+        product_writes = [q['sql'] for q in queries.captured_queries
+                          if q['sql'].startswith(('INSERT INTO "products_discountcampaignitem"', 'UPDATE "products_product"'))]
+        self.assertEqual(len(product_writes), 2)
+        self.assertEqual(self.discounts(), {self.lunch[0].pk: 30, self.lunch[1].pk: 30, self.dinner.pk: 10})
+        self.assertEqual(Product.objects.get(pk=self.lunch[1].pk).real_price, Decimal("70.00"))
+        self.assertEqual(Product.objects.get(pk=self.dinner.pk).updated_at, dinner_updated_at)
+        self.assertGreater(get_catalog_version(), version)
+
+    def test_revert_restores_previous_discounts(self):
+        campaign = self.create_campaign(category="LUNCH")
+        apply_campaign(campaign)
+        # Edited during the campaign: the edit wins
+        Product.objects.filter(pk=self.lunch[1].pk).update(discount=50)
+
+        self.assertEqual(revert_campaign(campaign), 1)
+        self.assertEqual(self.discounts(), {self.lunch[0].pk: 5, self.lunch[1].pk: 50, self.dinner.pk: 10})
+        self.assertEqual(DiscountCampaign.objects.get(pk=campaign.pk).status, CampaignStatus.FINISHED)
+
+    def test_scheduler(self):
+        running = self.create_campaign(category="LUNCH")
+        overlapping = self.create_campaign(discount=40, products=[self.lunch[0], self.dinner])
+        future = self.create_campaign(category="DINNER", starts_in=10)
+        missed = self.create_campaign(category="DINNER", starts_in=-20, ends_in=-10)
+
+        self.assertEqual(run_due_campaigns(self.now), {'applied': 2, 'reverted': 0, 'expired': 1})
+        # The product already held by the first campaign is skipped by the second
+        self.assertEqual(self.discounts(), {self.lunch[0].pk: 30, self.lunch[1].pk: 30, self.dinner.pk: 40})
+
+        later = self.now + timedelta(minutes=61)
+        self.assertEqual(run_due_campaigns(later), {'applied': 0, 'reverted': 2, 'expired': 1})
+        self.assertEqual(self.discounts(), {self.lunch[0].pk: 5, self.lunch[1].pk: 0, self.dinner.pk: 10})
+
+        statuses = dict(DiscountCampaign.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses[running.pk], CampaignStatus.FINISHED)
+        self.assertEqual(statuses[overlapping.pk], CampaignStatus.FINISHED)
+        self.assertEqual(statuses[future.pk], CampaignStatus.FINISHED)
+        self.assertEqual(statuses[missed.pk], CampaignStatus.FINISHED)
+
+    def test_admin_locks_applied_terms(self):
+        campaign = self.create_campaign(products=[self.dinner])
+        model_admin = site._registry[DiscountCampaign]
+        self.assertNotIn('discount', model_admin.get_readonly_fields(None, campaign))
+
+        apply_campaign(campaign)
+        campaign.refresh_from_db()
+        readonly = model_admin.get_readonly_fields(None, campaign)
+        for field_name in ('discount', 'category', 'products', 'starts_at'):
+            self.assertIn(field_name, readonly)
+        self.assertNotIn('ends_at', readonly)
@@ -0,0 +1,80 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.products.models import Product
+
+User = get_user_model()
+
+
+@override_settings(PRODUCT_CACHE={'LIST_TTL': 300, 'LIST_CACHE': True})
+class TestProductConditionalGet(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(phone_number="+998901112255", password="testpassword123")
+        self.client.force_authenticate(user=self.user)
+        self.product = Product.objects.create(
+            title_en="Milk", title_uz="Sut", description_en="d", description_uz="d", price=Decimal("100.00")
+        )
+        self.list_url = reverse('products:product-list-create')
+        self.detail_url = reverse('products:product-detail', args=[self.product.pk])
+
+    def test_detail_not_modified_costs_one_query(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+
+    def test_list_etag_changes_with_products_and_language(self):
+        etag = self.client.get(self.list_url)['ETag']
+        # Decided from the catalog version alone
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED
+            )
+        self.assertEqual(
+            self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag, HTTP_ACCEPT_LANGUAGE='en').status_code,
+            status.HTTP_200_OK
+        )
+
+        Product.objects.filter(pk=self.product.pk).delete()
+        self.assertEqual(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
+
+    def test_list_miss_runs_no_validator_aggregate(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.list_url)
+        # Only the page and its count: no aggregate over the whole catalog
+        self.assertFalse([q['sql'] for q in ctx.captured_queries if 'COUNT(DISTINCT' in q['sql']])
+
+
+class TestProductListValidatorsWithoutSharedCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(phone_number="+998901112277", password="testpassword123")
+        self.client.force_authenticate(user=self.user)
+        self.product = Product.objects.create(
+            title_en="Milk", title_uz="Sut", description_en="d", description_uz="d", price=Decimal("100.00")
+        )
+        self.list_url = reverse('products:product-list-create')
+
+    def test_etag_follows_the_rendered_page(self):
+        etag = self.client.get(self.list_url)['ETag']
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+
+        Product.objects.filter(pk=self.product.pk).update(price=Decimal("90.00"))
+        self.assertEqual(self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_200_OK)
@@ -0,0 +1,107 @@
+import json
+import shutil
+import tempfile
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.notifications.models import Notification
+from apps.products.bulk import ProductImporter
+from apps.products.cache import get_catalog_version
+from apps.products.models import Product, ProductProjection
+from apps.shared.models import Media
+
+User = get_user_model()
+
+
+class TestProductImport(APITestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.url = reverse('products:product-import')
+        self.admin = User.objects.create_superuser(phone_number="+998901112288", password="testpassword123")
+        self.client.force_authenticate(user=self.admin)
+
+    def row(self, sku, price="100.00", **kwargs):
+        return {'sku': sku, 'title_en': f"Product {sku}", 'description_en': "d", 'price': price, **kwargs}
+
+    def test_batch_is_one_upsert(self):
+        rows = [self.row(f"SKU-{i}", discount=10) for i in range(50)]
+        importer = ProductImporter(batch_size=50)
+
+        with CaptureQueriesContext(connection) as queries:
+            importer.run(rows)
+
+        inserts = [q['sql'] for q in queries.captured_queries if q['sql'].startswith('INSERT INTO "products_product"')]
+        self.assertEqual(len(inserts), 1)
+        self.assertIn('ON CONFLICT', inserts[0])
+        self.assertEqual(importer.result.created, 50)
+        self.assertEqual(Product.objects.get(sku="SKU-7").real_price, Decimal("90.00"))
+        self.assertEqual(Notification.objects.count(), 1)
+
+    def test_upsert_updates_existing_and_reports_invalid_rows(self):
+        version = get_catalog_version()
+        ProductImporter().run([self.row("A"), self.row("B")])
+        product = Product.objects.get(sku="A")
+
+        result = ProductImporter(batch_size=2).run([
+            self.row("A", price="50.00", title_uz="Sut"),
+            self.row("C", price="-1"),
+            {'sku': "D", 'price': "1.00"},
+            self.row("E"),
+        ])
+
+        self.assertEqual((result.created, result.updated), (1, 1))
+        self.assertEqual([error['index'] for error in result.errors], [1, 2])
+        product.refresh_from_db()
+        self.assertEqual((product.price, product.real_price, product.title_uz), (Decimal("50.00"), Decimal("50.00"), "Sut"))
+        self.assertEqual(
+            ProductProjection.objects.get(product=product, language='uz').title, "Sut"
+        )
+        self.assertGreater(get_catalog_version(), version)
+        # One broadcast per batch that created products
+        self.assertEqual(Notification.objects.count(), 2)
+        self.assertFalse(Notification.objects.exclude(type='PRODUCT', recipient=None).exists())
+
+    def test_api_with_media(self):
+        with override_settings(MEDIA_ROOT=self.media_root):
+            response = self.client.post(self.url, {
+                'items': json.dumps([self.row("M1"), self.row("M2")]),
+                'M1:images_en': [SimpleUploadedFile("a.jpg", b"a", content_type="image/jpeg"),
+                                 SimpleUploadedFile("b.jpg", b"bb", content_type="image/jpeg")],
+                'M2:images_uz': SimpleUploadedFile("c.jpg", b"c", content_type="image/jpeg"),
+            }, format='multipart')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['media'], 3)
+        media = Media.objects.filter(object_id=Product.objects.get(sku="M1").pk)
+        self.assertEqual(sorted(media.values_list('file_size', flat=True)), [1, 2])
+        projection = ProductProjection.objects.get(product__sku="M2", language='uz')
+        self.assertEqual(len(projection.media), 1)
+
+    def test_api_rejects_bad_requests(self):
+        for payload in ({}, {'items': []}, {'items': "not json"}):
+            response = self.client.post(self.url, payload, format='multipart')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
+
+        response = self.client.post(self.url, {
+            'items': json.dumps([self.row("X")]),
+            'X:photos': SimpleUploadedFile("a.jpg", b"a"),
+        }, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        with override_settings(PRODUCT_IMPORT={'BATCH_SIZE': 10, 'MAX_ITEMS': 1}):
+            response = self.client.post(self.url, {'items': [self.row("X"), self.row("Y")]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_admin_only(self):
+        self.client.force_authenticate(user=User.objects.create_user(phone_number="+998901112299", password="x"))
+        response = self.client.post(self.url, {'items': [self.row("X")]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
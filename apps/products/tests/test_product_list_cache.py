@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.urls import reverse_lazy
+from rest_framework.test import APITestCase
+
+from apps.products.cache import CATALOG_VERSION_KEY, bump_catalog_version, get_catalog_version
+from apps.products.models import Product
+from apps.shared.models import Media
+
+User = get_user_model()
+
+
+# Tests run in one process, so locmem stands in for a shared cache
+@override_settings(PRODUCT_CACHE={'LIST_TTL': 300, 'LIST_CACHE': True})
+class TestProductListCache(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse_lazy('products:product-list-create')
+        self.user = User.objects.create_user(phone_number="+998901112244", password="testpassword123")
+        self.client.force_authenticate(user=self.user)
+        self.product = self.create_product("Milk")
+
+    def create_product(self, title):
+        return Product.objects.create(
+            title_en=title, title_uz=title, description_en="d", description_uz="d", price=Decimal("100.00")
+        )
+
+    def test_hit_skips_the_orm(self):
+        first = self.client.get(self.url, {'page_size': 5})
+        self.assertEqual(first['X-Cache'], 'MISS')
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url, {'page_size': 5})
+        self.assertEqual(second['X-Cache'], 'HIT')
+        self.assertEqual(second.content, first.content)
+
+        # Different page parameters are cached separately
+        self.assertEqual(self.client.get(self.url, {'page_size': 6})['X-Cache'], 'MISS')
+
+    def test_product_and_media_changes_invalidate(self):
+        self.client.get(self.url)
+        self.create_product("Bread")
+        response = self.client.get(self.url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['pagination']['total_items'], 2)
+
+        Media.objects.create(
+            content_type=ContentType.objects.get_for_model(Product),
+            object_id=self.product.pk,
+            file=SimpleUploadedFile("milk.jpg", b"img", content_type="image/jpeg"),
+            media_type="image",
+            original_filename="milk.jpg",
+            language="en",
+        )
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+
+    def test_language_is_part_of_the_key(self):
+        self.client.get(self.url, HTTP_ACCEPT_LANGUAGE='en')
+        self.assertEqual(self.client.get(self.url, HTTP_ACCEPT_LANGUAGE='uz')['X-Cache'], 'MISS')
+        self.assertEqual(self.client.get(self.url, HTTP_ACCEPT_LANGUAGE='en-US')['X-Cache'], 'HIT')
+
+    def test_evicted_version_does_not_revive_old_pages(self):
+        self.client.get(self.url)
+        version = get_catalog_version()
+        bump_catalog_version()
+        cache.delete(CATALOG_VERSION_KEY)
+        self.assertNotEqual(get_catalog_version(), version)
+        self.assertEqual(self.client.get(self.url)['X-Cache'], 'MISS')
+
+
+class TestProductListCacheBackend(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse_lazy('products:product-list-create')
+        self.user = User.objects.create_user(phone_number="+998901112266", password="testpassword123")
+        self.client.force_authenticate(user=self.user)
+
+    def test_per_process_cache_is_bypassed(self):
+        # locmem: another worker's save would never reach this process
+        for _ in range(2):
+            response = self.client.get(self.url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('X-Cache', response)
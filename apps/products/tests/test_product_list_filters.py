@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.products.models import Product
+from apps.products.serializers.product_filter import ProductListFilterSerializer
+
+User = get_user_model()
+
+
+class TestProductListFilters(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('products:product-list-create')
+        self.user = User.objects.create_user(phone_number="+998901112277", password="testpassword123")
+        self.client.force_authenticate(user=self.user)
+
+        self.milk = self.create_product("Milk", "10.00", category="BREAKFAST", measurement_type="L")
+        self.bread = self.create_product("Bread", "5.00", category="BREAKFAST", discount=20)
+        self.steak = self.create_product("Steak", "50.00", category="DINNER")
+        self.create_product("Hidden", "1.00", is_active=False)
+
+    def create_product(self, title, price, **kwargs):
+        return Product.objects.create(
+            title_en=title, title_uz=title, description_en="d", description_uz="d",
+            price=Decimal(price), **kwargs
+        )
+
+    def get_ids(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.json()['results']]
+
+    def test_filters_and_ordering(self):
+        self.assertEqual(self.get_ids({'ordering': 'real_price'}), [self.bread.pk, self.milk.pk, self.steak.pk])
+        self.assertEqual(self.get_ids({'category': 'BREAKFAST', 'ordering': '-real_price'}), [self.milk.pk, self.bread.pk])
+        self.assertEqual(self.get_ids({'min_price': '4.50', 'max_price': '20'}), [self.milk.pk])
+        self.assertEqual(self.get_ids({'max_price': '4'}), [self.bread.pk])
+        self.assertEqual(self.get_ids({'measurement_type': 'L'}), [self.milk.pk])
+        self.assertEqual(self.get_ids({'min_discount': 10}), [self.bread.pk])
+
+    def test_invalid_parameters(self):
+        for params in ({'category': 'SNACK'}, {'min_price': '9', 'max_price': '1'}, {'ordering': 'title'},
+                       {'ordering': 'real_price', 'cursor': ''}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, params)
+
+    def test_price_cursor_walk(self):
+        seen, cursor = [], ''
+        while cursor is not None:
+            response = self.client.get(self.url, {'ordering': '-real_price', 'cursor': cursor, 'page_size': 2})
+            seen.extend(item['id'] for item in response.json()['results'])
+            cursor = response.json()['pagination']['next_page']
+        self.assertEqual(seen, [self.steak.pk, self.milk.pk, self.bread.pk])
+
+    def test_each_combination_uses_a_listing_index(self):
+        combinations = {
+            (): 'product_active_created_idx',
+            (('ordering', 'real_price'),): 'product_active_price_idx',
+            (('ordering', '-real_price'), ('min_price', '5')): 'product_active_price_idx',
+            (('category', 'LUNCH'),): 'product_category_created_idx',
+            (('category', 'LUNCH'), ('ordering', 'real_price'), ('max_price', '20')): 'product_category_price_idx',
+            (('measurement_type', 'PC'),): 'product_measure_created_idx',
+            # Both walk created_at in order; which one wins depends on the statistics
+            (('min_discount', '15'),): ('product_discounted_created_idx', 'product_active_created_idx'),
+        }
+        for params, index in combinations.items():
+            filters = ProductListFilterSerializer(data=dict(params))
+            self.assertTrue(filters.is_valid(), filters.errors)
+            queryset = filters.filter_queryset(Product.objects.filter(is_active=True))[:11]
+
+            with connection.cursor() as cursor:
+                # A handful of rows would always be seq-scanned (or bitmap-scanned and
+                # sorted); ask whether an index can serve the filter *and* the order
+                for setting in ('enable_seqscan', 'enable_bitmapscan', 'enable_sort'):
+                    cursor.execute(f'SET LOCAL {setting} = off')
+                plan = queryset.explain()
+                for setting in ('enable_seqscan', 'enable_bitmapscan', 'enable_sort'):
+                    cursor.execute(f'RESET {setting}')
+
+            indexes = (index,) if isinstance(index, str) else index
+            self.assertTrue(any(name in plan for name in indexes), f'{params}:\n{plan}')
+            self.assertNotIn('Sort', plan, f'{params}:\n{plan}')
@@ -0,0 +1,58 @@
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from rest_framework.test import APITestCase
+from django.contrib.auth import get_user_model
+
+from apps.products.models import Product
+from apps.shared.models import Media
+
+User = get_user_model()
+
+
+class TestProductMediaPrefetch(APITestCase):
+    def setUp(self):
+        self.url = reverse_lazy('products:product-list-create')
+        self.user = User.objects.create_user(phone_number="+998901112233", password="testpassword123")
+        self.client.force_authenticate(user=self.user)
+
+    def create_products(self, count):
+        content_type = ContentType.objects.get_for_model(Product)
+        for i in range(count):
+            product = Product.objects.create(
+                title_en=f"Milk {i}", title_uz=f"Sut {i}",
+                description_en="Natural milk", description_uz="Tabiiy sut",
+                price=Decimal("100.00"),
+            )
+            for language in ("en", "uz"):
+                Media.objects.create(
+                    content_type=content_type,
+                    object_id=product.pk,
+                    file=SimpleUploadedFile(f"milk_{i}_{language}.jpg", b"img", content_type="image/jpeg"),
+                    media_type="image",
+                    original_filename=f"milk_{i}_{language}.jpg",
+                    language=language,
+                )
+
+    def count_list_queries(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return len(ctx.captured_queries), response
+
+    def test_media_queries_do_not_grow_with_page_size(self):
+        self.create_products(1)
+        single_page_queries, _ = self.count_list_queries()
+
+        self.create_products(5)
+        queries, response = self.count_list_queries()
+
+        self.assertEqual(queries, single_page_queries)
+        for item in response.data['results']:
+            self.assertEqual(len(item['images']), 2)
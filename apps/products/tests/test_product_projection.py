@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse_lazy
+from rest_framework.test import APITestCase
+
+from apps.products.models import Product, ProductProjection
+from apps.shared.models import Media
+from apps.users.models.device import AppVersion, Device
+from apps.users.utils.device_resolver import get_device_resolver
+
+
+class TestProductProjection(APITestCase):
+    def setUp(self):
+        cache.clear()
+        get_device_resolver().clear()
+        self.url = reverse_lazy('products:product-list-create')
+        device = Device.objects.create(
+            device_model="Pixel", operation_version="14", device_id="device-1",
+            ip_address="127.0.0.1", app_version=AppVersion.objects.create(version="1.0.0"),
+        )
+        self.client.credentials(HTTP_DEVICE_TOKEN=str(device.device_token))
+
+    def create_product(self, i, title_uz=""):
+        product = Product.objects.create(
+            title_en=f"Milk {i}", title_uz=title_uz, description_en="Natural", description_uz="Tabiiy",
+            price=Decimal("100.00"),
+        )
+        Media.objects.create(
+            content_type=ContentType.objects.get_for_model(Product),
+            object_id=product.pk,
+            file=SimpleUploadedFile(f"milk_{i}.jpg", b"img", content_type="image/jpeg"),
+            media_type="image",
+            original_filename=f"milk_{i}.jpg",
+            language="uz",
+        )
+        return product
+
+    def get_list(self, lang):
+        cache.clear()
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url, HTTP_ACCEPT_LANGUAGE=lang)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results'], len(ctx.captured_queries)
+
+    def test_rows_follow_product_and_media_changes(self):
+        product = self.create_product(1)
+        row = ProductProjection.objects.get(product=product, language='uz')
+        # Empty uz title falls back to the default-language value
+        self.assertEqual((row.title, row.description), ("Milk 1", "Tabiiy"))
+        self.assertEqual([m['filename'] for m in row.media], ["milk_1.jpg"])
+
+        product.title_uz = "Sut 1"
+        product.save()
+        Media.objects.filter(object_id=product.pk).delete()
+        row.refresh_from_db()
+        self.assertEqual((row.title, row.media), ("Sut 1", []))
+
+    def test_mobile_list_matches_live_path(self):
+        for i in range(3):
+            self.create_product(i, title_uz=f"Sut {i}")
+        projected, projected_queries = self.get_list('uz')
+
+        ProductProjection.objects.all().delete()
+        live, live_queries = self.get_list('uz')
+
+        self.assertEqual(projected, live)
+        # The projection replaces the media query for the page
+        self.assertEqual(projected_queries, live_queries)
+        self.assertEqual(
+            sorted(item['images'][0]['filename'] for item in projected),
+            ["milk_0.jpg", "milk_1.jpg", "milk_2.jpg"]
+        )
@@ -0,0 +1,45 @@
+from decimal import Decimal
+
+import json
+
+from django.db.models import F
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from apps.cart.serializers.cart_create import CartProductSerializer
+from apps.notifications.serializers.create_notifications import ProductMiniSerializer
+from apps.products.models import Product
+from apps.products.serializers.product_list_create import ProductDetailSerializer, ProductListSerializer
+
+
+class TestProductRealPrice(TestCase):
+    def create_product(self, price, discount=0):
+        return Product.objects.create(
+            title_en="Milk", description_en="d", price=Decimal(price), discount=discount
+        )
+
+    def test_computed_on_insert_and_save(self):
+        product = self.create_product("5.00", discount=20)
+        self.assertEqual(product.real_price, Decimal("4.00"))
+
+        product.discount = 50
+        product.save()
+        self.assertEqual(product.real_price, Decimal("2.50"))
+
+    def test_set_based_update(self):
+        products = [self.create_product("10.00"), self.create_product("30.00", discount=10)]
+
+        with self.assertNumQueries(1):
+            Product.objects.filter(pk__in=[p.pk for p in products]).update(price=F('price') * 2, discount=25)
+
+        self.assertEqual(
+            sorted(Product.objects.values_list('real_price', flat=True)), [Decimal("15.00"), Decimal("45.00")]
+        )
+
+    def test_rendered_as_a_string_like_price(self):
+        product = Product.objects.get(pk=self.create_product("10.00", discount=10).pk)
+        for serializer_class in (
+            ProductListSerializer, ProductDetailSerializer, ProductMiniSerializer, CartProductSerializer
+        ):
+            data = json.loads(JSONRenderer().render(serializer_class(product).data))
+            self.assertEqual((data['price'], data['real_price']), ("10.00", "9.00"), serializer_class.__name__)
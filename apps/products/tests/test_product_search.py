@@ -0,0 +1,64 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.products.models import Product
+from apps.products.search import search_products, trigram_enabled
+
+User = get_user_model()
+
+
+class TestProductSearch(APITestCase):
+    def setUp(self):
+        self.url = reverse('products:product-search')
+        self.user = User.objects.create_user(phone_number="+998901112266", password="testpassword123")
+        self.client.force_authenticate(user=self.user)
+
+    def create_product(self, title_en, title_uz="", description_en="", description_uz=""):
+        return Product.objects.create(
+            title_en=title_en, title_uz=title_uz,
+            description_en=description_en, description_uz=description_uz,
+            price=Decimal("100.00"),
+        )
+
+    def test_matches_every_translation_and_ranks_titles_first(self):
+        in_title = self.create_product("Milk", title_uz="Sut")
+        in_description = self.create_product("Kefir", description_uz="Sutdan tayyorlangan")
+        self.create_product("Bread", title_uz="Non")
+
+        self.assertEqual(list(search_products("sut")), [in_title, in_description])
+        self.assertEqual(list(search_products("MIL")), [in_title])
+        self.assertEqual(list(search_products("!!!")), [])
+
+    def test_search_vector_follows_updates(self):
+        product = self.create_product("Milk")
+        product.title_uz = "Qatiq"
+        product.save()
+        self.assertEqual(list(search_products("qatiq")), [product])
+
+    def test_keyset_pages_cover_all_results(self):
+        expected = [self.create_product(f"Milk {i}").pk for i in range(7)]
+
+        seen, cursor = [], ''
+        while cursor is not None:
+            response = self.client.get(self.url, {'q': 'milk', 'cursor': cursor, 'page_size': 3})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(item['id'] for item in response.data['results'])
+            cursor = response.data['pagination']['next_page']
+
+        self.assertEqual(sorted(seen), sorted(expected))
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_query_is_required(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_typo_tolerance_with_trigrams(self):
+        if not trigram_enabled():
+            self.skipTest("pg_trgm is not installed")
+        product = self.create_product("Chocolate")
+        self.assertEqual(list(search_products("chocolat")), [product])
+        self.assertEqual(list(search_products("chocolade")), [product])
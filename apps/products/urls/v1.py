@@ -3,11 +3,15 @@ from django.urls import path
 from django.conf.urls.static import static
 from apps.products.views.product_list_create import ProductListCreateAPIView
 from apps.products.views.product_detail import ProductRetrieveUpdateDestroyAPIView
+from apps.products.views.product_search import ProductSearchAPIView
+from apps.products.views.product_import import ProductBulkImportAPIView
 
 app_name = 'products'
 
 urlpatterns = [
     path('', ProductListCreateAPIView.as_view(), name='product-list-create'),
+    path('search/', ProductSearchAPIView.as_view(), name='product-search'),
+    path('import/', ProductBulkImportAPIView.as_view(), name='product-import'),
     path('<int:pk>/', ProductRetrieveUpdateDestroyAPIView.as_view(), name='product-detail')
     
 ]
@@ -1,5 +1,6 @@
 from rest_framework import status
 from rest_framework.generics import RetrieveUpdateDestroyAPIView
+from apps.products.cache import VARY_HEADERS, product_validators
 from apps.products.models import Product
 from apps.products.serializers.product_list_create import (
     ProductListSerializer,
@@ -7,6 +8,7 @@ from apps.products.serializers.product_list_create import (
     ProductCreateSerializer
 )
 from apps.shared.permissions.mobile import IsMobileOrWebUser
+from apps.shared.utils.conditional import conditional_response, set_validators
 from apps.shared.utils.custom_response import CustomResponse
 
 
@@ -26,13 +28,22 @@ class ProductRetrieveUpdateDestroyAPIView(RetrieveUpdateDestroyAPIView):
         return ProductListSerializer
 
     def retrieve(self, request, *args, **kwargs):
+        # One aggregate query decides 304 before the object is even loaded
+        lookup = {self.lookup_field: kwargs[self.lookup_url_kwarg or self.lookup_field]}
+        etag, last_modified, found = product_validators(self.get_queryset().filter(**lookup), request)
+        if found:
+            not_modified = conditional_response(request, etag, last_modified)
+            if not_modified is not None:
+                return set_validators(not_modified, etag, last_modified, VARY_HEADERS)
+
         instance = self.get_object()
         serializer = self.get_serializer(instance)
-        return CustomResponse.success(
+        response = CustomResponse.success(
             message_key="SUCCESS_MESSAGE",
             data=serializer.data,
             status_code=status.HTTP_200_OK
         )
+        return set_validators(response, etag, last_modified, VARY_HEADERS)
 
     def update(self, request, *args, **kwargs):
         instance = self.get_object()
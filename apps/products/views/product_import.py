@@ -0,0 +1,50 @@
+import json
+
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+
+from apps.products.bulk import ProductImporter, parse_media_files
+from apps.shared.utils.custom_response import CustomResponse
+
+
+class ProductBulkImportAPIView(APIView):
+    """
+    POST /products/import/
+
+    Upsert products by sku. The body is ``{"items": [...]}`` as JSON, or
+    multipart with ``items`` as a JSON string and files under
+    ``<sku>:images_<lang>`` keys.
+    """
+    permission_classes = [IsAdminUser]
+    parser_classes = [JSONParser, MultiPartParser, FormParser]
+
+    def post(self, request, *args, **kwargs):
+        try:
+            items = self.get_items(request)
+            media = parse_media_files(request.FILES)
+        except serializers.ValidationError as exc:
+            return CustomResponse.validation_error(errors=exc.detail, request=request)
+
+        result = ProductImporter(user=request.user).run(items, media)
+        return CustomResponse.success(message_key="SUCCESS_MESSAGE", request=request, data=result.as_dict())
+
+    @staticmethod
+    def get_items(request):
+        items = request.data.get('items')
+        if isinstance(items, str):
+            try:
+                items = json.loads(items)
+            except ValueError:
+                raise serializers.ValidationError({'items': ["Must be a JSON list."]})
+        if not isinstance(items, list) or not items:
+            raise serializers.ValidationError({'items': ["A non-empty list is required."]})
+
+        max_items = settings.PRODUCT_IMPORT['MAX_ITEMS']
+        if len(items) > max_items:
+            raise serializers.ValidationError(
+                {'items': [f"At most {max_items} items per request; use the import_products command."]}
+            )
+        return items
@@ -1,14 +1,26 @@
+from django.http import HttpResponse
 from rest_framework import status
 from rest_framework.generics import ListCreateAPIView
 from rest_framework.permissions import IsAuthenticated
 
+from apps.products.cache import (
+    VARY_HEADERS,
+    get_cached_list,
+    get_catalog_version,
+    list_cache_enabled,
+    list_validators,
+    product_list_cache_key,
+    set_cached_list
+)
 from apps.products.models import Product
+from apps.products.serializers.product_filter import ProductListFilterSerializer
 from apps.products.serializers.product_list_create import (
     ProductCreateSerializer,
     ProductDetailSerializer,
     ProductListSerializer
 )
 from apps.shared.permissions.mobile import IsMobileOrWebUser
+from apps.shared.utils.conditional import conditional_response, make_etag, set_validators
 from apps.shared.utils.custom_pagination import CustomPageNumberPagination
 from apps.shared.utils.custom_response import CustomResponse
 
@@ -17,6 +29,8 @@ class ProductListCreateAPIView(ListCreateAPIView):
     serializer_class = ProductCreateSerializer
     pagination_class = CustomPageNumberPagination
     permission_classes = [IsMobileOrWebUser]
+    # Counts only run on a response cache miss (see list)
+    count_strategy = 'exact'
 
     def get_queryset(self):
         return Product.objects.filter(is_active=True)
@@ -52,16 +66,75 @@ class ProductListCreateAPIView(ListCreateAPIView):
             )
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
+        is_json = request.accepted_renderer.format == 'json'
+        cache_key = etag = last_modified = None
+        if list_cache_enabled():
+            # Validators from the shared catalog version: no query at all
+            version = get_catalog_version()
+            etag, last_modified = list_validators(request, version)
+            not_modified = conditional_response(request, etag, last_modified)
+            if not_modified is not None:
+                return set_validators(not_modified, etag, last_modified, VARY_HEADERS)
+
+            # Only JSON is cached; the browsable API renders normally
+            if is_json:
+                cache_key = product_list_cache_key(request, version)
+                content = get_cached_list(cache_key)
+                if content is not None:
+                    response = HttpResponse(content, content_type=self.get_cached_content_type(request))
+                    response['X-Cache'] = 'HIT'
+                    return set_validators(response, etag, last_modified, VARY_HEADERS)
+
+        filters = ProductListFilterSerializer(data=request.query_params)
+        if not filters.is_valid():
+            return CustomResponse.validation_error(errors=filters.errors, request=request)
+
+        keyset_fields = filters.get_keyset_fields()
+        if self.paginator.use_keyset(request, self):
+            if keyset_fields is None:
+                return CustomResponse.validation_error(
+                    errors={'ordering': ["Cursor pagination supports descending orderings only."]},
+                    request=request
+                )
+            self.keyset_fields = keyset_fields
+        queryset = filters.filter_queryset(self.get_queryset())
+
         page = self.paginate_queryset(queryset)
-        
+
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            response = self.get_paginated_response(serializer.data)
+        else:
+            serializer = self.get_serializer(queryset, many=True)
+            response = CustomResponse.success(
+                message_key="SUCCESS_MESSAGE",
+                data=serializer.data,
+                status_code=status.HTTP_200_OK
+            )
+
+        if response.status_code == status.HTTP_200_OK:
+            if cache_key or (etag is None and is_json):
+                # Render once here and keep the bytes; finalize_response won't render again
+                response.accepted_renderer = request.accepted_renderer
+                response.accepted_media_type = request.accepted_media_type
+                response.renderer_context = self.get_renderer_context()
+                response.render()
+            if cache_key:
+                set_cached_list(cache_key, response.content)
+                response['X-Cache'] = 'MISS'
+            elif etag is None and is_json:
+                # No shared version to trust: validate against the page itself
+                etag = make_etag(response.content)
+                not_modified = conditional_response(request, etag)
+                if not_modified is not None:
+                    return set_validators(not_modified, etag, None, VARY_HEADERS)
+            if etag is not None:
+                set_validators(response, etag, last_modified, VARY_HEADERS)
+        return response
 
-        serializer = self.get_serializer(queryset, many=True)
-        return CustomResponse.success(
-            message_key="SUCCESS_MESSAGE",
-            data=serializer.data,
-            status_code=status.HTTP_200_OK
-        )
+    @staticmethod
+    def get_cached_content_type(request):
+        renderer = request.accepted_renderer
+        if renderer.charset:
+            return f'{request.accepted_media_type}; charset={renderer.charset}'
+        return request.accepted_media_type
@@ -0,0 +1,38 @@
+from rest_framework.generics import ListAPIView
+
+from apps.products.search import search_products
+from apps.products.serializers.product_list_create import ProductDetailSerializer, ProductListSerializer
+from apps.shared.permissions.mobile import IsMobileOrWebUser
+from apps.shared.utils.custom_pagination import CustomPageNumberPagination
+from apps.shared.utils.custom_response import CustomResponse
+
+
+class ProductSearchAPIView(ListAPIView):
+    """
+    GET /products/search/?q=<text>
+
+    Ranked full-text (+ trigram when available) search over all product
+    translations, paginated by (rank, id) cursors.
+    """
+    pagination_class = CustomPageNumberPagination
+    permission_classes = [IsMobileOrWebUser]
+    pagination_mode = 'keyset'
+    keyset_fields = ('rank', 'id')
+    search_query_param = 'q'
+
+    def get_queryset(self):
+        return search_products(self.request.query_params.get(self.search_query_param, ''))
+
+    def get_serializer_class(self):
+        device_type = getattr(self.request, "device_type", "WEB")
+        if device_type == "WEB":
+            return ProductListSerializer
+        return ProductDetailSerializer
+
+    def list(self, request, *args, **kwargs):
+        if not request.query_params.get(self.search_query_param, '').strip():
+            return CustomResponse.validation_error(
+                errors={self.search_query_param: ["This query parameter is required."]},
+                request=request
+            )
+        return super().list(request, *args, **kwargs)
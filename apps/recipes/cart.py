@@ -0,0 +1,31 @@
+"""
+Recipe to cart conversion.
+
+A recipe's ingredients become cart entries with one query, one entry per
+product, and go into the cart through the cart item upsert.
+"""
+import math
+from collections import defaultdict
+from decimal import Decimal
+from typing import List
+
+from apps.cart.items import MAX_QUANTITY
+from apps.recipes.models import Recipe
+
+
+def recipe_cart_entries(recipe: Recipe, servings: int = 1) -> List[dict]:
+    """
+    Cart entries for the ingredients of ``recipe``.
+
+    Quantities of the same product are summed and multiplied by
+    ``servings``. Cart items are counted in whole products, so the result
+    is rounded up (at least one, at most MAX_QUANTITY). Sums are Decimal: float error must not
+    round 0.1 + 0.2 + 0.7 up to two items.
+    """
+    quantities = defaultdict(Decimal)
+    for ingredient in recipe.ingredients.select_related('product').order_by('id'):
+        quantities[ingredient.product_id] += Decimal(str(ingredient.quantity))
+    return [
+        {'product_id': product_id, 'quantity': min(max(1, math.ceil(quantity * servings)), MAX_QUANTITY), 'notes': None}
+        for product_id, quantity in quantities.items()
+    ]
@@ -0,0 +1,7 @@
+from rest_framework import serializers
+
+
+class RecipeAddToCartSerializer(serializers.Serializer):
+    # The user's default cart when omitted
+    cart_id = serializers.IntegerField(required=False)
+    servings = serializers.IntegerField(min_value=1, max_value=100, default=1)
@@ -1,19 +1,65 @@
+from django.db import models, transaction
 from rest_framework import serializers
 from apps.products.models import Product
+from apps.products.projections import get_projection_index
 from apps.recipes.models import Recipe, RecipeIngredient
 from apps.products.serializers.product_list_create import ProductListSerializer
+from apps.shared.mixins.translation_mixins import get_media_index
+
+
+def load_ingredient_products(context, ingredients):
+    """
+    Load projections (MOBILE) and media for the products of ``ingredients``
+    into the serializer context: one query each, whatever their number.
+    Ingredients must come with their product (select_related).
+    """
+    products = [ingredient.product for ingredient in ingredients]
+    projections = get_projection_index(context)
+    if projections is not None:
+        projections.load(products)
+        products = [product for product in products if projections.get(product) is None]
+    if products:
+        get_media_index(context).load(products)
+
+
+class RecipeIngredientListSerializer(serializers.ListSerializer):
+    """Load the products of one recipe's ingredients at once (no-op when the page already did)."""
+
+    def to_representation(self, data):
+        if isinstance(data, models.manager.BaseManager):
+            data = data.all()
+            if data._result_cache is None:
+                # Not prefetched (e.g. right after a write)
+                data = data.select_related('product')
+        ingredients = list(data)
+        load_ingredient_products(self.context, ingredients)
+        return super().to_representation(ingredients)
+
+
+class RecipeListSerializer(serializers.ListSerializer):
+    """Load the products of every recipe on the page at once."""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        recipes = list(iterable)
+        # ingredients are prefetched (with their products) by the view
+        load_ingredient_products(self.context, [
+            ingredient for recipe in recipes for ingredient in recipe.ingredients.all()
+        ])
+        return super().to_representation(recipes)
 
 
 class RecipeIngredientSerializer(serializers.ModelSerializer):
+    # Optional on writes: identifies the row an update edits
+    id = serializers.IntegerField(required=False)
     product = ProductListSerializer(read_only=True)
-    product_id = serializers.PrimaryKeyRelatedField(
-        queryset=Product.objects.all(),
-        write_only=True
-    )
+    # Plain id: RecipeSerializer checks all of them with one query
+    product_id = serializers.IntegerField(min_value=1, write_only=True)
     
     class Meta:
         model = RecipeIngredient
         fields = ["id", "product", "product_id", "quantity", "unit"]
+        list_serializer_class = RecipeIngredientListSerializer
         
         
 class RecipeSerializer(serializers.ModelSerializer):
@@ -22,17 +68,115 @@ class RecipeSerializer(serializers.ModelSerializer):
     class Meta:
         model = Recipe
         fields = ['id', 'title', 'description', 'image', 'cook_time', 'ingredients']
+        list_serializer_class = RecipeListSerializer
         
         
+    def validate_ingredients(self, ingredients):
+        ingredient_ids = [ingredient['id'] for ingredient in ingredients if 'id' in ingredient]
+        if len(ingredient_ids) != len(set(ingredient_ids)):
+            raise serializers.ValidationError("An ingredient id can only be given once.")
+        # The detail view prefetched the current ingredients
+        current = {ingredient.pk: ingredient for ingredient in self.instance.ingredients.all()} if self.instance else {}
+        unknown = set(ingredient_ids) - set(current)
+        if unknown:
+            raise serializers.ValidationError(
+                [f"Ingredient \"{pk}\" is not part of this recipe." for pk in sorted(unknown)]
+            )
+
+        # PATCH leaves nested fields optional: an entry with an id keeps the
+        # values it doesn't send, a new entry must be complete
+        ingredients = [self.complete_ingredient(data, current.get(data.get('id'))) for data in ingredients]
+        errors = [self.missing_fields(data) for data in ingredients]
+        if any(errors):
+            # Same shape as DRF's per-item list errors
+            raise serializers.ValidationError(errors)
+
+        product_ids = {ingredient['product_id'] for ingredient in ingredients}
+        existing = set(Product.objects.filter(pk__in=product_ids).values_list('pk', flat=True))
+        missing = product_ids - existing
+        if missing:
+            raise serializers.ValidationError(
+                [f"Invalid pk \"{pk}\" - object does not exist." for pk in sorted(missing)]
+            )
+        return ingredients
+
+
+    ingredient_fields = ('product_id', 'quantity', 'unit')
+
+
+    def complete_ingredient(self, data, ingredient=None):
+        if ingredient is None:
+            return data
+        return {**{name: getattr(ingredient, name) for name in self.ingredient_fields}, **data}
+
+
+    def missing_fields(self, data):
+        return {name: ["This field is required."] for name in self.ingredient_fields if name not in data}
+
+
     def create(self, validated_data):
         ingredients_data = validated_data.pop('ingredients', [])
-        recipe = Recipe.objects.create(**validated_data)
-        for ingredient in ingredients_data:
-            product = ingredient.pop('product_id')
-            RecipeIngredient.objects.create(recipe=recipe, product=product, **ingredient)
+        with transaction.atomic():
+            recipe = Recipe.objects.create(**validated_data)
+            RecipeIngredient.objects.bulk_create(
+                self.build_ingredient(recipe, ingredient) for ingredient in ingredients_data
+            )
         return recipe
 
 
+    def update(self, instance, validated_data):
+        ingredients_data = validated_data.pop('ingredients', None)
+        with transaction.atomic():
+            instance = super().update(instance, validated_data)
+            if ingredients_data is not None:
+                self.sync_ingredients(instance, ingredients_data)
+        return instance
 
-    
-    
\ No newline at end of file
+
+    def build_ingredient(self, recipe, data):
+        return RecipeIngredient(
+            recipe=recipe, product_id=data['product_id'], quantity=data['quantity'], unit=data['unit']
+        )
+
+
+    def sync_ingredients(self, recipe, ingredients_data):
+        """
+        Make the recipe's ingredients match ``ingredients_data``: rows are
+        matched by id, then rows sent without one by product, and written
+        with one bulk_update, one bulk_create and one delete.
+        """
+        current = {ingredient.pk: ingredient for ingredient in recipe.ingredients.all()}
+        matched, unmatched = {}, []
+        for data in ingredients_data:
+            if 'id' in data:
+                matched[data['id']] = data
+            else:
+                unmatched.append(data)
+
+        by_product = {}
+        for pk, ingredient in current.items():
+            if pk not in matched:
+                by_product.setdefault(ingredient.product_id, []).append(ingredient)
+        new_rows = []
+        for data in unmatched:
+            candidates = by_product.get(data['product_id'])
+            if candidates:
+                matched[candidates.pop(0).pk] = data
+            else:
+                new_rows.append(self.build_ingredient(recipe, data))
+
+        changed = []
+        for pk, data in matched.items():
+            ingredient = current[pk]
+            values = (data['product_id'], data['quantity'], data['unit'])
+            if (ingredient.product_id, ingredient.quantity, ingredient.unit) != values:
+                ingredient.product_id, ingredient.quantity, ingredient.unit = values
+                changed.append(ingredient)
+
+        removed = set(current) - set(matched)
+        if removed:
+            RecipeIngredient.objects.filter(pk__in=removed).delete()
+        if changed:
+            RecipeIngredient.objects.bulk_update(changed, ['product', 'quantity', 'unit'])
+        if new_rows:
+            RecipeIngredient.objects.bulk_create(new_rows)
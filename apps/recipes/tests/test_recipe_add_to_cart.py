@@ -0,0 +1,88 @@
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.cart.items import MAX_QUANTITY
+from apps.cart.models import Cart, CartItem
+from apps.products.models import Product
+from apps.recipes.models import Recipe, RecipeIngredient
+
+User = get_user_model()
+
+
+class RecipeAddToCartTestCase(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='cook', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.cart = Cart.objects.create(user=self.user, is_default=True)
+        self.eggs = Product.objects.create(title="Eggs", description="d", price=Decimal("1.00"))
+        self.flour = Product.objects.create(title="Flour", description="d", price=Decimal("3.00"), discount=50)
+        self.recipe = Recipe.objects.create(user=self.user, title="Pancakes", description="d", cook_time=20)
+        RecipeIngredient.objects.create(recipe=self.recipe, product=self.eggs, quantity=2, unit="pcs")
+        RecipeIngredient.objects.create(recipe=self.recipe, product=self.eggs, quantity=1, unit="pcs")
+        RecipeIngredient.objects.create(recipe=self.recipe, product=self.flour, quantity=0.5, unit="kg")
+        self.url = reverse('recipes:recipe-add-to-cart', args=[self.recipe.pk])
+
+    def quantities(self, cart=None):
+        return dict(CartItem.objects.filter(cart=cart or self.cart).values_list('product_id', 'quantity'))
+
+    def test_adds_aggregated_ingredients(self):
+        CartItem.objects.create(cart=self.cart, product=self.eggs, quantity=1)
+
+        # recipe, default cart, ingredients, upsert, summary aggregate + cache sync (plus savepoints)
+        with self.assertNumQueries(10):
+            response = self.client.post(self.url, {}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.quantities(), {self.eggs.pk: 4, self.flour.pk: 1})
+        self.assertEqual(
+            (response.data['item_count'], response.data['total_quantity'], response.data['total_discounted_price']),
+            (2, 5, "5.50")
+        )
+        cart = Cart.objects.get(pk=self.cart.pk)
+        self.assertEqual((cart.item_count, cart.total), (2, Decimal("5.50")))
+
+    def test_servings_and_named_cart(self):
+        party = Cart.objects.create(user=self.user, name='Party')
+        response = self.client.post(self.url, {'cart_id': party.pk, 'servings': 3}, format='json')
+
+        self.assertEqual(response.data['cart_id'], party.pk)
+        # eggs 3 x 3; flour 0.5 kg x 3 = 1.5, rounded up once
+        self.assertEqual(self.quantities(party), {self.eggs.pk: 9, self.flour.pk: 2})
+        self.assertEqual(self.quantities(), {})
+
+    def test_fractional_quantities(self):
+        sugar = Product.objects.create(title="Sugar", description="d", price=Decimal("2.00"))
+        for quantity in (0.1, 0.2, 0.7):
+            RecipeIngredient.objects.create(recipe=self.recipe, product=sugar, quantity=quantity, unit="kg")
+
+        self.client.post(self.url, {'servings': 1}, format='json')
+        self.assertEqual(self.quantities()[sugar.pk], 1)
+
+        self.client.post(self.url, {'servings': 2}, format='json')
+        # 0.5 kg flour x 2 servings is one item; sugar 1.0 x 2 is two
+        self.assertEqual(self.quantities(), {self.eggs.pk: 9, self.flour.pk: 2, sugar.pk: 3})
+
+    def test_quantities_are_capped(self):
+        RecipeIngredient.objects.create(recipe=self.recipe, product=self.flour, quantity=1e12, unit="g")
+        response = self.client.post(self.url, {'servings': 100}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.quantities()[self.flour.pk], MAX_QUANTITY)
+
+    def test_rejected_requests(self):
+        other = Cart.objects.create(user=User.objects.create_user(username='other', password='x'))
+        response = self.client.post(self.url, {'cart_id': other.pk}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.post(self.url, {'servings': 0}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        empty = Recipe.objects.create(user=self.user, title="Water", description="d", cook_time=1)
+        response = self.client.post(reverse('recipes:recipe-add-to-cart', args=[empty.pk]), {}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(CartItem.objects.count(), 0)
@@ -0,0 +1,73 @@
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.products.models import Product
+from apps.recipes.models import Recipe, RecipeIngredient
+from apps.shared.models import Media
+
+User = get_user_model()
+
+
+class RecipeListQueriesTestCase(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='chef', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('recipes:recipe-list')
+
+    def create_recipes(self, count, ingredients=4):
+        content_type = ContentType.objects.get_for_model(Product)
+        recipes = []
+        for i in range(count):
+            recipe = Recipe.objects.create(user=self.user, title=f"Recipe {i}", description="d", cook_time=10)
+            products = [
+                Product.objects.create(title=f"Product {i}.{j}", description="d", price=1) for j in range(ingredients)
+            ]
+            RecipeIngredient.objects.bulk_create(
+                RecipeIngredient(recipe=recipe, product=product, quantity=1, unit="pcs") for product in products
+            )
+            Media.objects.bulk_create(
+                Media(
+                    content_type=content_type, object_id=product.pk, file=f"2025/01/01/{product.pk}.jpg",
+                    media_type="image", file_size=1, mime_type="image/jpeg",
+                    original_filename=f"{product.pk}.jpg", language="en"
+                )
+                for product in products
+            )
+            recipes.append(recipe)
+        return recipes
+
+    def test_list_queries_are_constant_per_page(self):
+        self.create_recipes(1, ingredients=1)
+        # count, recipes, ingredients + products, media
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
+
+        self.create_recipes(5)
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['pagination']['total_items'], 6)
+        first = response.data['results'][0]
+        self.assertEqual(first['title'], "Recipe 4")
+        self.assertEqual(len(first['ingredients']), 4)
+        product = first['ingredients'][0]['product']
+        self.assertEqual(product['title_en'], "Product 4.0")
+        self.assertTrue(product['images'][0]['url'].endswith(f"{product['id']}.jpg"))
+
+    def test_list_is_paginated(self):
+        self.create_recipes(3, ingredients=1)
+        response = self.client.get(self.url, {'page_size': 2})
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(response.data['pagination']['next_page'], 2)
+
+    def test_detail_queries(self):
+        recipe = self.create_recipes(1, ingredients=6)[0]
+        # recipe, ingredients + products, media
+        with self.assertNumQueries(3):
+            response = self.client.get(reverse('recipes:recipe-detail', args=[recipe.pk]))
+        self.assertEqual(len(response.data['ingredients']), 6)
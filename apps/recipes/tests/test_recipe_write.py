@@ -0,0 +1,126 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.products.models import Product
+from apps.recipes.models import Recipe, RecipeIngredient
+
+User = get_user_model()
+
+
+class RecipeWriteTestCase(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='writer', password='testpass123')
+        self.client.force_authenticate(user=self.user)
+        self.products = [
+            Product.objects.create(title=f"Product {i}", description="d", price=1) for i in range(32)
+        ]
+
+    def payload(self, products, **extra):
+        return {
+            'title': "Soup", 'description': "d", 'cook_time': 30,
+            'ingredients': [
+                {'product_id': product.pk, 'quantity': index + 1, 'unit': "g"} for index, product in enumerate(products)
+            ],
+            **extra
+        }
+
+    def ingredients(self, recipe_id):
+        return list(
+            RecipeIngredient.objects.filter(recipe_id=recipe_id).order_by('product_id')
+            .values_list('product_id', 'quantity', 'unit')
+        )
+
+    def test_create_is_a_handful_of_statements(self):
+        # product check, savepoint, recipe, ingredients, savepoint release, ingredients + products, media
+        with self.assertNumQueries(7):
+            response = self.client.post(reverse('recipes:recipe-list'), self.payload(self.products[:30]), format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data['ingredients']), 30)
+        self.assertEqual(len(self.ingredients(response.data['id'])), 30)
+
+    def test_update_diffs_ingredients(self):
+        recipe_id = self.client.post(
+            reverse('recipes:recipe-list'), self.payload(self.products[:30]), format='json'
+        ).data['id']
+        kept = RecipeIngredient.objects.get(recipe_id=recipe_id, product=self.products[0])
+        url = reverse('recipes:recipe-detail', args=[recipe_id])
+
+        # First product unchanged, second edited by id, 3-29 dropped, two new ones
+        payload = self.payload([self.products[0], self.products[30], self.products[31]], title="Stew")
+        edited = RecipeIngredient.objects.get(recipe_id=recipe_id, product=self.products[1])
+        payload['ingredients'].append({'id': edited.pk, 'product_id': self.products[1].pk, 'quantity': 9, 'unit': "kg"})
+
+        # recipe + ingredients, product check, savepoint, recipe, delete, update, insert,
+        # savepoint release, ingredients + products, media
+        with self.assertNumQueries(11):
+            response = self.client.put(url, payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], "Stew")
+        self.assertEqual(self.ingredients(recipe_id), [
+            (self.products[0].pk, 1.0, "g"),
+            (self.products[1].pk, 9.0, "kg"),
+            (self.products[30].pk, 2.0, "g"),
+            (self.products[31].pk, 3.0, "g"),
+        ])
+        self.assertTrue(RecipeIngredient.objects.filter(pk=kept.pk).exists())
+        self.assertTrue(RecipeIngredient.objects.filter(pk=edited.pk, quantity=9).exists())
+
+        # Ingredients are left alone when not sent
+        self.client.patch(url, {'cook_time': 5}, format='json')
+        self.assertEqual(len(self.ingredients(recipe_id)), 4)
+
+    def test_patch_merges_partial_ingredients(self):
+        recipe_id = self.client.post(
+            reverse('recipes:recipe-list'), self.payload(self.products[:2]), format='json'
+        ).data['id']
+        first = RecipeIngredient.objects.get(recipe_id=recipe_id, product=self.products[0])
+        url = reverse('recipes:recipe-detail', args=[recipe_id])
+
+        response = self.client.patch(url, {'ingredients': [{'id': first.pk, 'quantity': 3}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # A partial list is still the full ingredient list: the second row is dropped
+        self.assertEqual(self.ingredients(recipe_id), [(self.products[0].pk, 3.0, "g")])
+
+        response = self.client.patch(url, {'ingredients': [{'quantity': 1}]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data['ingredients'][0]), {'product_id', 'unit'})
+        self.assertEqual(self.ingredients(recipe_id), [(self.products[0].pk, 3.0, "g")])
+
+    def test_invalid_ingredients_write_nothing(self):
+        other = Recipe.objects.create(user=self.user, title="Other", description="d", cook_time=1)
+        foreign = RecipeIngredient.objects.create(recipe=other, product=self.products[0], quantity=1, unit="g")
+        recipe_id = self.client.post(
+            reverse('recipes:recipe-list'), self.payload(self.products[:2]), format='json'
+        ).data['id']
+        url = reverse('recipes:recipe-detail', args=[recipe_id])
+
+        bad_ingredients = [
+            [{'product_id': 9999, 'quantity': 1, 'unit': "g"}],
+            [{'id': foreign.pk, 'product_id': self.products[0].pk, 'quantity': 1, 'unit': "g"}],
+        ]
+        for ingredients in bad_ingredients:
+            response = self.client.put(url, {**self.payload([]), 'ingredients': ingredients}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, ingredients)
+        self.assertEqual(len(self.ingredients(recipe_id)), 2)
+        self.assertEqual(Recipe.objects.get(pk=recipe_id).title, "Soup")
+
+    def test_only_the_author_can_change_a_recipe(self):
+        recipe_id = self.client.post(
+            reverse('recipes:recipe-list'), self.payload(self.products[:2]), format='json'
+        ).data['id']
+        url = reverse('recipes:recipe-detail', args=[recipe_id])
+
+        self.client.force_authenticate(user=User.objects.create_user(username='other', password='x'))
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+        for method in (self.client.patch, self.client.put):
+            response = method(url, self.payload([]), format='json')
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.client.delete(url).status_code, status.HTTP_404_NOT_FOUND)
+
+        self.assertEqual(len(self.ingredients(recipe_id)), 2)
+        self.assertEqual(Recipe.objects.get(pk=recipe_id).title, "Soup")
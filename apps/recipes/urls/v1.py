@@ -2,12 +2,14 @@ from django.conf import settings
 from django.urls import path
 from django.conf.urls.static import static
 from apps.recipes.views.recipe_list_create import RecipeListCreateAPIView, RecipeDetailAPIView
+from apps.recipes.views.recipe_cart import RecipeAddToCartAPIView
 
 app_name = 'recipes'
 
 urlpatterns = [
    path('', RecipeListCreateAPIView.as_view(), name='recipe-list'),
-   path('<int:pk>/', RecipeDetailAPIView.as_view(), name='recipe-detail')
+   path('<int:pk>/', RecipeDetailAPIView.as_view(), name='recipe-detail'),
+   path('<int:pk>/add-to-cart/', RecipeAddToCartAPIView.as_view(), name='recipe-add-to-cart')
     
 ]
 
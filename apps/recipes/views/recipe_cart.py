@@ -0,0 +1,47 @@
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+from apps.cart.items import get_default_cart, upsert_cart_items
+from apps.cart.models import Cart
+from apps.cart.serializers.cart_create import CartSummarySerializer
+from apps.cart.totals import get_summary, sync_cached_totals, with_summary
+from apps.recipes.cart import recipe_cart_entries
+from apps.recipes.models import Recipe
+from apps.recipes.serializers.recipe_cart import RecipeAddToCartSerializer
+
+
+class RecipeAddToCartAPIView(generics.GenericAPIView):
+    """
+    POST /recipes/<id>/add-to-cart/
+
+    Add every ingredient of a recipe to a cart with one upsert and return
+    the updated cart summary.
+    """
+    queryset = Recipe.objects.all()
+    serializer_class = RecipeAddToCartSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        recipe = self.get_object()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        if 'cart_id' in data:
+            cart = get_object_or_404(Cart, pk=data['cart_id'], user=request.user)
+        else:
+            cart = get_default_cart(request)
+
+        entries = recipe_cart_entries(recipe, data['servings'])
+        if not entries:
+            return Response({'detail': "Recipe has no ingredients."}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            rows = upsert_cart_items(cart.pk, entries, recalculate=False)
+            # One aggregate for both the response and the cached figures
+            cart = with_summary(Cart.objects.filter(pk=cart.pk)).get()
+            summary = get_summary(cart)
+            sync_cached_totals(cart, summary)
+        data = CartSummarySerializer({'cart_id': cart.pk, **summary}).data
+        return Response({**data, 'recipe_id': recipe.pk, 'items': rows})
@@ -1,22 +1,45 @@
+from django.db.models import Prefetch
 from rest_framework import generics, permissions
-from apps.recipes.models import Recipe
+from apps.recipes.models import Recipe, RecipeIngredient
 from apps.recipes.serializers.recipe_serializer import RecipeSerializer
+from apps.shared.utils.custom_pagination import CustomPageNumberPagination
 
 
-class RecipeListCreateAPIView(generics.ListCreateAPIView):
-    queryset = Recipe.objects.all().order_by('-created_at')
+class RecipeQuerysetMixin:
+    """
+    Ingredients and their products in one query per page; product media
+    (or MOBILE projections) are loaded by the serializers in one more.
+    """
+
+    def get_queryset(self):
+        ingredients = RecipeIngredient.objects.select_related('product').order_by('id')
+        return Recipe.objects.prefetch_related(Prefetch('ingredients', queryset=ingredients))
+
+
+class RecipeListCreateAPIView(RecipeQuerysetMixin, generics.ListCreateAPIView):
     serializer_class = RecipeSerializer
+    pagination_class = CustomPageNumberPagination
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     
     
+    def get_queryset(self):
+        return super().get_queryset().order_by('-created_at', '-id')
+    
+    
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
         
     
     
-class RecipeDetailAPIView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Recipe.objects.all()
+class RecipeDetailAPIView(RecipeQuerysetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = RecipeSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     
-
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in permissions.SAFE_METHODS:
+            # Anyone may read a recipe; only its author may change or delete it
+            queryset = queryset.filter(user=self.request.user)
+        return queryset
+    
@@ -21,6 +21,9 @@ def custom_exception_handler(exc, context):
     client_ip = get_client_ip(request) if request else 'unknown'
     port = request.META.get('REMOTE_PORT', 'unknown') if request else 'unknown'
 
+    # Repeats of the same failure are coalesced by the alert dispatcher
+    alert_key = (view_name, type(exc).__name__)
+
     # Full traceback
     tb = traceback.format_exc()
     tb = tb[-2000:] if tb else "No traceback available"
@@ -37,7 +40,7 @@ def custom_exception_handler(exc, context):
         message += f"<b>CustomException Message:</b> {exc.message_key}\n"
         if exc.context:
             message += f"<b>Context:</b> {exc.context}\n"
-        send_alert(message)
+        send_alert(message, key=alert_key)
         return CustomResponse.error(message_key=exc.message_key, request=request, context=exc.context)
 
     # Call default DRF handler first
@@ -47,9 +50,9 @@ def custom_exception_handler(exc, context):
     if response is None:
         message += f"<b>Exception:</b> {str(exc)}\n"
         message += f"<b>Traceback:</b> {tb}\n"
-        send_alert(message)
+        send_alert(message, key=alert_key)
         return CustomResponse.error(message_key="UNKNOWN_ERROR", request=request, context={'exc': str(exc)})
 
     # For DRF-handled exceptions, optionally alert (comment if too noisy)
-    send_alert(message + f"<b>DRF Exception:</b> {str(exc)}")
+    send_alert(message + f"<b>DRF Exception:</b> {str(exc)}", key=alert_key)
     return response
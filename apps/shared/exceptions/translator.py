@@ -1,5 +1,6 @@
 import logging
-from typing import TypedDict, Any, Dict
+from functools import lru_cache
+from typing import TypedDict, Any, Dict, Hashable, Tuple
 
 from apps.shared.messages import MESSAGES, MessageTemplate
 
@@ -13,36 +14,67 @@ class MessageDetail(TypedDict):
     status_code: int
 
 
-def get_message_detail(
-        message_key: str,
-        lang: str = "en",
-        context: Dict[str, Any] | None = None
-) -> MessageDetail:
-    # Get message template with fallback
-    message = MESSAGES.get(message_key)
+DEFAULT_LANGUAGE = "en"
+DEFAULT_TEMPLATE = "Error occurred"
+RENDER_CACHE_SIZE = 1024
 
-    if not message:
-        logger.warning(f"Message key not found: {message_key}")
-        message = MESSAGES.get('UNKNOWN_ERROR')
+SYSTEM_ERROR: MessageDetail = {
+    "id": "SYSTEM_ERROR",
+    "message": "An unexpected error occurred",
+    "status_code": 500
+}
 
-        if not message:
-            logger.error("UNKNOWN_ERROR message not found in MESSAGES dictionary")
-            return {
-                "id": "SYSTEM_ERROR",
-                "message": "An unexpected error occurred",
-                "status_code": 500
-            }
 
-    context = context or {}
-    messages_dict = message["messages"]
+def _build_fallback_table() -> Dict[str, Dict[str, str]]:
+    """
+    Precompute language -> template per message key.
+
+    Every language resolves to its own template; the None entry holds the
+    English (or generic) template used when nothing else matches.
+    """
+    table = {}
+    for key, message in MESSAGES.items():
+        templates = {lang.lower(): template for lang, template in message["messages"].items()}
+        templates[None] = templates.get(DEFAULT_LANGUAGE, DEFAULT_TEMPLATE)
+        table[key] = templates
+    return table
+
+
+FALLBACK_TABLE = _build_fallback_table()
+
+# Every language any message is translated into, for request negotiation
+MESSAGE_LANGUAGES = tuple(sorted({
+    lang for templates in FALLBACK_TABLE.values() for lang in templates if lang is not None
+}))
+
+
+@lru_cache(maxsize=64)
+def normalize_language(lang: str | None) -> Tuple[str, str]:
+    """
+    Normalize a language tag to (full, base).
+
+    Examples:
+        'en-US' -> ('en-us', 'en')
+        'uz_UZ' -> ('uz-uz', 'uz')
+    """
+    lang = (lang or DEFAULT_LANGUAGE).strip().lower().replace('_', '-')
+    return lang, lang.split('-')[0]
+
+
+def _freeze_context(context: Dict[str, Any]) -> Hashable | None:
+    """Hashable form of the context, or None when a value can't be hashed."""
+    try:
+        frozen = tuple(sorted(context.items()))
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
+
 
-    # Language fallback chain
-    base_lang = lang.split('-')[0].split('_')[0]
-    template = (
-            messages_dict.get(lang)
-            or messages_dict.get(base_lang)
-            or messages_dict.get("en", "Error occurred")
-    )
+def _render(message_key: str, lang: str, base_lang: str, context: Dict[str, Any]) -> Tuple[str, str, int]:
+    message = MESSAGES[message_key]
+    templates = FALLBACK_TABLE[message_key]
+    template = templates.get(lang) or templates.get(base_lang) or templates[None]
 
     # Format message
     try:
@@ -55,10 +87,47 @@ def get_message_detail(
         )
         formatted_message = template
 
+    return message["id"], formatted_message, message["status_code"]
+
+
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_cached(message_key: str, lang: str, base_lang: str, frozen_context: Hashable) -> Tuple[str, str, int]:
+    return _render(message_key, lang, base_lang, dict(frozen_context))
+
+
+def get_message_detail(
+        message_key: str,
+        lang: str = "en",
+        context: Dict[str, Any] | None = None
+) -> MessageDetail:
+    """
+    Render a message in the requested language.
+
+    Rendered messages are memoized per (message_key, normalized language,
+    frozen context); contexts with unhashable values are rendered directly.
+    """
+    # Get message template with fallback
+    if message_key not in MESSAGES:
+        logger.warning(f"Message key not found: {message_key}")
+        message_key = 'UNKNOWN_ERROR'
+
+        if message_key not in MESSAGES:
+            logger.error("UNKNOWN_ERROR message not found in MESSAGES dictionary")
+            return dict(SYSTEM_ERROR)
+
+    context = context or {}
+    lang, base_lang = normalize_language(lang)
+
+    frozen_context = _freeze_context(context)
+    if frozen_context is None:
+        message_id, formatted_message, status_code = _render(message_key, lang, base_lang, context)
+    else:
+        message_id, formatted_message, status_code = _render_cached(message_key, lang, base_lang, frozen_context)
+
     return {
-        "id": message["id"],
+        "id": message_id,
         "message": formatted_message,
-        "status_code": message["status_code"]
+        "status_code": status_code
     }
 
 
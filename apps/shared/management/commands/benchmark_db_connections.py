@@ -0,0 +1,143 @@
+"""
+Django command to compare request throughput across database connection modes.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.backends.signals import connection_created
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import RequestFactory
+
+# mode -> env overrides read by core/config.py
+MODES = {
+    'fresh': {'DB_CONN_MAX_AGE': '0', 'DB_POOL': 'false'},
+    'persistent': {'DB_CONN_MAX_AGE': '60', 'DB_POOL': 'false'},
+    'pool': {'DB_CONN_MAX_AGE': '0', 'DB_POOL': 'true'},
+}
+
+
+class Command(BaseCommand):
+    """
+    Run the same request loop once per connection mode, each in its own
+    process so the settings are loaded from that mode's environment.
+    """
+
+    help = 'Benchmark requests/second with fresh, persistent and pooled DB connections.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/v1/products/')
+        parser.add_argument('--requests', type=int, default=500, help='Requests per thread.')
+        parser.add_argument('--threads', type=int, default=4, help='Concurrent clients (like uWSGI workers).')
+        parser.add_argument('--device-token', default=None, help='Device-Token header for mobile endpoints.')
+        parser.add_argument('--host', default='localhost')
+        parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+        parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        if options['worker']:
+            self.stdout.write(json.dumps(self.run_worker(options)))
+            return
+
+        rows = []
+        for mode in options['modes']:
+            if mode == 'pool' and importlib.util.find_spec('psycopg_pool') is None:
+                self.stdout.write(self.style.WARNING('pool: skipped (psycopg 3 with psycopg_pool not installed)'))
+                continue
+            result = self.run_mode(mode, options)
+            rows.append((mode, result))
+            self.stdout.write(
+                f'{mode:>10}: {result["rps"]:8.1f} req/s  '
+                f'p50 {result["p50_ms"]:6.2f} ms  p95 {result["p95_ms"]:6.2f} ms  '
+                f'connections opened {result["connections"]:5d}  errors {result["errors"]}'
+            )
+
+        if len(rows) > 1:
+            baseline = rows[0][1]['rps']
+            for mode, result in rows[1:]:
+                self.stdout.write(self.style.SUCCESS(f'{mode} vs {rows[0][0]}: {result["rps"] / baseline:.2f}x'))
+
+    def run_mode(self, mode, options):
+        args = [
+            sys.executable, sys.argv[0], 'benchmark_db_connections', '--worker',
+            '--path', options['path'],
+            '--requests', str(options['requests']),
+            '--threads', str(options['threads']),
+            '--host', options['host'],
+        ]
+        if options['device_token']:
+            args += ['--device-token', options['device_token']]
+
+        result = subprocess.run(
+            args, capture_output=True, text=True,
+            env={**os.environ, **MODES[mode]}, cwd=str(settings.BASE_DIR)
+        )
+        if result.returncode != 0:
+            raise CommandError(f'{mode} run failed:\n{result.stderr[-2000:]}')
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def run_worker(self, options):
+        opened = []
+        connection_created.connect(lambda **kwargs: opened.append(1), weak=False)
+
+        headers = {}
+        if options['device_token']:
+            headers['HTTP_DEVICE_TOKEN'] = options['device_token']
+
+        latencies, errors = [], []
+        lock = threading.Lock()
+
+        # A real WSGI handler: the test Client keeps connections open between
+        # requests, which would hide exactly the cost being measured
+        handler = WSGIHandler()
+        environ = RequestFactory(HTTP_HOST=options['host'], **headers).get(options['path']).environ
+
+        def call():
+            statuses = []
+            response = handler(dict(environ), lambda status, response_headers, *args: statuses.append(status))
+            try:
+                for _ in response:
+                    pass
+            finally:
+                response.close()  # fires request_finished -> close_old_connections
+            return int(statuses[0].split()[0])
+
+        def client_loop():
+            local_latencies, local_errors = [], 0
+            for _ in range(options['requests']):
+                start = time.perf_counter()
+                try:
+                    failed = call() >= 400
+                except Exception:
+                    failed = True
+                local_latencies.append(time.perf_counter() - start)
+                local_errors += failed
+            with lock:
+                latencies.extend(local_latencies)
+                errors.append(local_errors)
+
+        threads = [threading.Thread(target=client_loop) for _ in range(options['threads'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        latencies.sort()
+        return {
+            'rps': len(latencies) / elapsed,
+            'p50_ms': statistics.median(latencies) * 1000,
+            'p95_ms': latencies[int(len(latencies) * 0.95) - 1] * 1000,
+            'connections': len(opened),
+            'errors': sum(errors),
+        }
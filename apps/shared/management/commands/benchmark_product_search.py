@@ -0,0 +1,91 @@
+"""
+Django command to benchmark product search on a synthetic catalog.
+"""
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from apps.products.search import search_products, trigram_enabled
+
+SYNTHETIC_MARKER = 'bench-search'
+
+WORDS_EN = ['milk', 'bread', 'cheese', 'butter', 'apple', 'chocolate', 'yogurt', 'rice', 'honey', 'tea',
+            'coffee', 'sugar', 'flour', 'juice', 'water', 'chicken', 'beef', 'tomato', 'potato', 'onion']
+WORDS_UZ = ['sut', 'non', 'pishloq', "sariyog'", 'olma', 'shokolad', 'qatiq', 'guruch', 'asal', 'choy',
+            'qahva', 'shakar', 'un', 'sharbat', 'suv', 'tovuq', "mol go'shti", 'pomidor', 'kartoshka', 'piyoz']
+
+# Set-based insert; the search_vector trigger and the real_price generated column fill the rest
+INSERT_SQL = """
+INSERT INTO products_product (
+    uuid, created_at, updated_at, title, description, price, discount,
+    category, measurement_type, is_active, title_en, title_uz, description_en, description_uz
+)
+SELECT
+    md5(random()::text || g)::uuid, now(), now(),
+    t.en, %(marker)s, 100, 0, 'ALL', 'GR', true,
+    t.en, t.uz,
+    %(marker)s || ' ' || t.en || ' fresh organic',
+    %(marker)s || ' ' || t.uz || ' yangi tabiiy'
+FROM generate_series(1, %(count)s) AS g
+CROSS JOIN LATERAL (
+    SELECT
+        (%(en)s::text[])[1 + g %% 20] || ' ' || (%(en)s::text[])[1 + (g / 20) %% 20] || ' ' || g AS en,
+        (%(uz)s::text[])[1 + g %% 20] || ' ' || (%(uz)s::text[])[1 + (g / 20) %% 20] || ' ' || g AS uz
+) AS t
+"""
+
+QUERIES = ['milk', 'chocolate bread', 'sut', 'shokolad', 'choc', 'qatiq asal', 'chocolat', 'kartoshk']
+
+
+class Command(BaseCommand):
+    """Insert a synthetic catalog (default 1M products) and time ranked search queries."""
+
+    help = 'Benchmark product search (full-text + trigram) on a synthetic catalog.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=1_000_000)
+        parser.add_argument('--repeat', type=int, default=20, help='Runs per query.')
+        parser.add_argument('--page-size', type=int, default=20)
+        parser.add_argument('--keep', action='store_true', help='Keep the synthetic rows afterwards.')
+        parser.add_argument('--explain', action='store_true', help='Print the plan of the first query.')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        # Raw SQL: the ORM maps `description` to the active translation column
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT count(*) FROM products_product WHERE description = %s', [SYNTHETIC_MARKER])
+            existing = cursor.fetchone()[0]
+        missing = options['products'] - existing
+        if missing > 0:
+            self.stdout.write(f'Inserting {missing} synthetic products...')
+            start = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute(INSERT_SQL, {'marker': SYNTHETIC_MARKER, 'count': missing, 'en': WORDS_EN, 'uz': WORDS_UZ})
+                cursor.execute('ANALYZE products_product')
+            self.stdout.write(f'  done in {time.perf_counter() - start:.1f}s')
+
+        self.stdout.write(f'Trigram matching: {"on" if trigram_enabled() else "off (pg_trgm not installed)"}')
+
+        try:
+            for text in QUERIES:
+                queryset = search_products(text)[:options['page_size'] + 1]
+                timings = []
+                for _ in range(options['repeat']):
+                    start = time.perf_counter()
+                    rows = list(queryset.values_list('id', flat=True))
+                    timings.append(time.perf_counter() - start)
+                timings.sort()
+                self.stdout.write(
+                    f'{text!r:>20}: p50 {statistics.median(timings) * 1000:8.2f} ms  '
+                    f'p95 {timings[max(0, int(len(timings) * 0.95) - 1)] * 1000:8.2f} ms  rows {len(rows)}'
+                )
+
+            if options['explain']:
+                self.stdout.write(search_products(QUERIES[0])[:options['page_size'] + 1].explain(analyze=True))
+        finally:
+            if not options['keep']:
+                with connection.cursor() as cursor:
+                    cursor.execute('DELETE FROM products_product WHERE description = %s', [SYNTHETIC_MARKER])
+                    self.stdout.write(f'Removed {cursor.rowcount} synthetic rows')
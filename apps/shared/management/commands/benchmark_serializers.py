@@ -0,0 +1,49 @@
+"""
+Django command to measure translated serializer construction cost.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.products.serializers.product_list_create import ProductCreateSerializer
+
+
+class UncachedProductCreateSerializer(ProductCreateSerializer):
+    """Rebuilds the translated field layout on every instantiation (old behaviour)."""
+    cache_translated_fields = False
+
+
+class Command(BaseCommand):
+    """Compare cached vs uncached TranslatedFieldsWriteMixin field construction."""
+
+    help = 'Benchmark serializer construction with and without the translated field cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        iterations = options['iterations']
+        payload = {'title_en': 'Milk', 'title_uz': 'Sut', 'price': '100.00'}
+
+        results = {}
+        for label, serializer_class in (
+                ('uncached', UncachedProductCreateSerializer),
+                ('cached', ProductCreateSerializer),
+        ):
+            # Warm up: the cached variant builds its template here
+            serializer_class(data=payload).fields
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                serializer_class(data=payload).fields
+            elapsed = time.perf_counter() - start
+
+            results[label] = elapsed
+            self.stdout.write(
+                f'{label:>9}: {elapsed * 1000:8.1f} ms total, '
+                f'{elapsed / iterations * 1_000_000:7.1f} us per serializer'
+            )
+
+        speedup = results['uncached'] / results['cached'] if results['cached'] else 0
+        self.stdout.write(self.style.SUCCESS(f'Speedup: {speedup:.2f}x over {iterations} iterations'))
@@ -0,0 +1,92 @@
+"""
+Django command to bulk import (upsert by sku) products from a file.
+"""
+import csv
+import json
+import os
+import time
+from contextlib import ExitStack
+
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.products.bulk import MEDIA_FIELD, ProductImporter, media_languages
+
+
+def read_rows(path):
+    """Yield rows from a .json (list), .jsonl or .csv file; lines and CSV records are streamed."""
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding='utf-8') as fh:
+        if extension == '.json':
+            yield from json.load(fh)
+        elif extension == '.jsonl':
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+        elif extension == '.csv':
+            for row in csv.DictReader(fh):
+                # Empty cells mean "not given", not empty strings
+                yield {key: value for key, value in row.items() if value != ''}
+        else:
+            raise CommandError(f'Unsupported file type {extension!r}; use .json, .jsonl or .csv')
+
+
+class Command(BaseCommand):
+    """
+    Upsert products in batches; each batch is one INSERT ... ON CONFLICT.
+
+    Media is given per row as ``images_<lang>``: a list of paths (or a
+    '|'-separated string in CSV), relative to --media-dir.
+    """
+
+    help = 'Bulk import products (upsert by sku) from a JSON, JSON Lines or CSV file.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--batch-size', type=int, default=None)
+        parser.add_argument('--media-dir', default='.', help='Base directory of media paths.')
+        parser.add_argument('--no-notify', action='store_true', help='Skip the new-products broadcast.')
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        importer = ProductImporter(batch_size=options['batch_size'], notify=not options['no_notify'])
+        media_dir = options['media_dir']
+        start = time.perf_counter()
+
+        batch, offset = [], 0
+        for row in read_rows(options['path']):
+            batch.append(row)
+            if len(batch) >= importer.batch_size:
+                self.import_batch(importer, batch, offset, media_dir)
+                offset += len(batch)
+                batch = []
+        if batch:
+            self.import_batch(importer, batch, offset, media_dir)
+            offset += len(batch)
+
+        result = importer.result
+        for error in result.errors:
+            self.stderr.write(f"row {error['index']} (sku={error['sku']}): {json.dumps(error['errors'])}")
+        self.stdout.write(self.style.SUCCESS(
+            f'{offset} rows in {time.perf_counter() - start:.1f}s: {result.created} created, '
+            f'{result.updated} updated, {result.media} media files, {len(result.errors)} rejected'
+        ))
+
+    def import_batch(self, importer, rows, offset, media_dir):
+        # Files are opened per batch so a large catalog never holds them all open
+        with ExitStack() as stack:
+            media = {}
+            for row in rows:
+                for suffix, language in media_languages().items():
+                    paths = row.pop(f'{MEDIA_FIELD}_{suffix}', None) if isinstance(row, dict) else None
+                    if isinstance(paths, str):
+                        paths = [path for path in paths.split('|') if path]
+                    if not paths:
+                        continue
+                    files = [
+                        File(stack.enter_context(open(os.path.join(media_dir, path), 'rb')), name=os.path.basename(path))
+                        for path in paths
+                    ]
+                    media.setdefault(row.get('sku'), {})[language] = files
+            importer.import_batch(rows, media, offset)
+        self.stdout.write(f'  imported rows {offset}-{offset + len(rows) - 1}')
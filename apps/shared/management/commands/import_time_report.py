@@ -0,0 +1,89 @@
+"""
+Django command to report which modules dominate startup import time.
+"""
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORT_TIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+STARTUP_SCRIPT = (
+    "import django; django.setup(); "
+    "from importlib import import_module; import_module({urlconf!r})"
+)
+
+
+def group_name(module: str) -> str:
+    """apps.products.views.x -> apps.products; rest_framework.fields -> rest_framework"""
+    parts = module.split('.')
+    if parts[0] == 'apps' and len(parts) > 1:
+        return '.'.join(parts[:2])
+    return parts[0]
+
+
+class Command(BaseCommand):
+    """Run Django startup under ``python -X importtime`` and aggregate the result."""
+
+    help = 'Show import time per app module / top-level package for Django startup.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=15, help='Number of groups to show.')
+        parser.add_argument(
+            '--budget', type=float, default=None,
+            help='Fail if total startup import time exceeds this many milliseconds.'
+        )
+        parser.add_argument(
+            '--modules', type=int, default=0,
+            help='Also list the N slowest individual modules (cumulative).'
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        env = {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'core.settings')}
+        script = STARTUP_SCRIPT.format(urlconf=settings.ROOT_URLCONF)
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script],
+            capture_output=True, text=True, env=env, cwd=str(settings.BASE_DIR)
+        )
+        if result.returncode != 0:
+            raise CommandError(f'Startup failed:\n{result.stderr[-2000:]}')
+
+        # Self time is attributed to exactly one module, so groups add up to the total
+        self_by_group = defaultdict(int)
+        modules = []
+        for line in result.stderr.splitlines():
+            match = IMPORT_TIME_LINE.match(line)
+            if not match:
+                continue
+            self_us, cumulative_us, _, module = match.groups()
+            self_by_group[group_name(module)] += int(self_us)
+            modules.append((int(cumulative_us), module))
+
+        total_us = sum(self_by_group.values())
+        if not total_us:
+            raise CommandError('No import timings captured.')
+
+        self.stdout.write(f'{"group":<32} {"ms":>9} {"share":>7}')
+        for group, self_us in sorted(self_by_group.items(), key=lambda item: -item[1])[:options['top']]:
+            style = self.style.WARNING if group.startswith('apps.') else (lambda s: s)
+            self.stdout.write(style(f'{group:<32} {self_us / 1000:9.1f} {self_us / total_us:7.1%}'))
+
+        apps_us = sum(us for group, us in self_by_group.items() if group.startswith('apps.'))
+        self.stdout.write(f'\nTotal: {total_us / 1000:.1f} ms, of which project apps: {apps_us / 1000:.1f} ms')
+
+        if options['modules']:
+            self.stdout.write('\nSlowest modules (cumulative):')
+            for cumulative_us, module in sorted(modules, reverse=True)[:options['modules']]:
+                self.stdout.write(f'  {cumulative_us / 1000:9.1f} ms  {module}')
+
+        budget = options['budget']
+        if budget is not None:
+            if total_us / 1000 > budget:
+                raise CommandError(f'Startup imports took {total_us / 1000:.1f} ms, budget is {budget:.1f} ms')
+            self.stdout.write(self.style.SUCCESS(f'Within budget of {budget:.1f} ms'))
@@ -0,0 +1,29 @@
+"""
+Django command to rebuild the per-language product projections.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.products.models import Product
+from apps.products.projections import refresh_product_projections
+
+
+class Command(BaseCommand):
+    """Rebuild ProductProjection rows for all (or the given) products."""
+
+    help = 'Rebuild ProductProjection rows from Product and Media.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('product_ids', nargs='*', type=int)
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        product_ids = options['product_ids'] or list(
+            Product.objects.order_by('pk').values_list('pk', flat=True)
+        )
+        batch_size = options['batch_size']
+
+        for start in range(0, len(product_ids), batch_size):
+            refresh_product_projections(product_ids[start:start + batch_size])
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt projections for {len(product_ids)} products'))
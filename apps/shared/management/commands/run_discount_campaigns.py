@@ -0,0 +1,33 @@
+"""
+Django command to apply and revert scheduled discount campaigns.
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.products.campaigns import run_due_campaigns
+
+
+class Command(BaseCommand):
+    """Apply campaigns that have started and revert those that have ended (run from cron)."""
+
+    help = 'Apply due discount campaigns and revert finished ones.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Keep running, checking every N seconds (0: run once).'
+        )
+
+    def handle(self, *args, **options):
+        """Entrypoint for command."""
+        while True:
+            summary = run_due_campaigns()
+            if any(summary.values()) or not options['interval']:
+                self.stdout.write(self.style.SUCCESS(
+                    f"Applied {summary['applied']}, reverted {summary['reverted']}, "
+                    f"expired {summary['expired']} campaign(s)"
+                ))
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
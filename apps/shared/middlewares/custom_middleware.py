@@ -1,6 +1,8 @@
 from apps.shared.exceptions.custom_exceptions import CustomException
-from apps.users.models.device import Device
-from apps.shared.models import Language
+from apps.users.utils.device_resolver import get_device_token, resolve_device
+from apps.shared.utils.language import (
+    DEFAULT_CONTENT_LANGUAGE, content_languages, get_request_language, get_language_preferences
+)
 
 class DeviceAndLanguageMiddleware:
 
@@ -8,22 +10,24 @@ class DeviceAndLanguageMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        device_token = request.headers.get('Device-Token') or request.headers.get('device_token')
+        device_token = get_device_token(request)
 
         if device_token:
            
             request.device_type = "MOBILE"
-            try:
-                device = Device.objects.get(device_token=device_token)
-                
-                request.lang = request.headers.get("Accept-Language") or device.language or Language.UZ
-            except Device.DoesNotExist:
+            device = resolve_device(device_token)
+            if device is None:
                 raise CustomException(message_key="NOT_FOUND")
+
+            # Resolved once here, reused by IsMobileOrWebUser
+            request.device = device
+            get_language_preferences(request, device_language=device.language)
         else:
            
             request.device_type = "WEB"
-           
-            request.lang = request.headers.get("Accept-Language", Language.UZ)
+
+        # Header first, then the device's saved language; always one of settings.LANGUAGES
+        request.lang = get_request_language(request, content_languages(), DEFAULT_CONTENT_LANGUAGE)
 
         response = self.get_response(request)
         return response
@@ -1,37 +1,145 @@
+import copy
+from collections import defaultdict
+
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
+from django.db import models
 from rest_framework import serializers
 
+MEDIA_INDEX_CONTEXT_KEY = "media_index"
+
+# (serializer class, LANGUAGES) -> unbound field layout
+_TRANSLATED_FIELD_TEMPLATES = {}
+
+
+def _clone_field(field):
+    """
+    Re-create an unbound field from its init arguments.
+
+    Like DRF's Field.__deepcopy__, but only nested fields (ListField.child)
+    are cloned; other kwargs (max_length, choices, validators) are treated as
+    immutable, which skips the deepcopy memo bookkeeping.
+    """
+    if not isinstance(field, serializers.Field):
+        return copy.copy(field) if isinstance(field, (list, dict, set)) else field
+    kwargs = {key: _clone_field(value) for key, value in field._kwargs.items()}
+    return field.__class__(*field._args, **kwargs)
+
+
+class MediaIndex:
+    """
+    In-memory (object, language) -> Media lookup shared through the
+    serializer context, so one query serves a whole page of objects.
+    """
+
+    def __init__(self):
+        self._media = defaultdict(list)
+        self._loaded = set()
+
+    def load(self, instances):
+        """Fetch media for every not-yet-loaded instance, one query per model."""
+        from apps.shared.models import Media
+
+        pending = defaultdict(set)
+        for instance in instances:
+            if not isinstance(instance, models.Model) or instance.pk is None:
+                continue
+            if not hasattr(type(instance), "media_files"):
+                continue
+            content_type_id = ContentType.objects.get_for_model(instance).id
+            if (content_type_id, instance.pk) not in self._loaded:
+                pending[content_type_id].add(instance.pk)
+
+        for content_type_id, object_ids in pending.items():
+            media_qs = Media.objects.filter(
+                content_type_id=content_type_id, object_id__in=object_ids
+            )
+            for media in media_qs:
+                language = (media.language or "").lower()
+                self._media[(content_type_id, media.object_id, language)].append(media)
+            self._loaded.update((content_type_id, pk) for pk in object_ids)
+
+    def get(self, instance, language):
+        """Return the media list, or None when the instance was never loaded."""
+        if not isinstance(instance, models.Model) or instance.pk is None:
+            return None
+        content_type_id = ContentType.objects.get_for_model(instance).id
+        if (content_type_id, instance.pk) not in self._loaded:
+            return None
+        return self._media.get((content_type_id, instance.pk, language.lower()), [])
+
+
+def get_media_index(context):
+    """Return the MediaIndex stored in a serializer context, creating it once."""
+    return context.setdefault(MEDIA_INDEX_CONTEXT_KEY, MediaIndex())
+
+
+class TranslatedMediaListSerializer(serializers.ListSerializer):
+    """Prefetch media for the whole page before the child serializes each row."""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        items = list(iterable)
+
+        if getattr(self.child, "media_fields", None):
+            get_media_index(self.context).load(items)
+
+        return super().to_representation(items)
+
 
 class TranslatedFieldsWriteMixin:
+    # Set to False to rebuild the field layout on every instantiation
+    cache_translated_fields = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.languages = settings.LANGUAGES
 
+    def get_fields(self):
+        """
+        Return base + per-language fields.
+
+        The layout depends only on the serializer class and LANGUAGES, so it
+        is built once and cloned per instance from each field's init kwargs.
+        """
+        if not self.cache_translated_fields:
+            return self._build_translated_fields(super().get_fields())
+
+        key = (type(self), tuple(settings.LANGUAGES))
+        template = _TRANSLATED_FIELD_TEMPLATES.get(key)
+        if template is None:
+            template = self._build_translated_fields(super().get_fields())
+            _TRANSLATED_FIELD_TEMPLATES[key] = template
+        return {name: _clone_field(field) for name, field in template.items()}
+
+    def _build_translated_fields(self, fields):
         translatable_fields = getattr(self, "translatable_fields", [])
         media_fields = getattr(self, "media_fields", [])
 
         for field_name in translatable_fields:
             is_media = field_name in media_fields
 
-            # Base field is optional
-            if field_name in self.fields:
-                self.fields[field_name].required = False
+            # Base field is optional (passed as a kwarg so it survives cloning)
+            if field_name in fields:
+                original = fields[field_name]
+                fields[field_name] = original.__class__(
+                    *original._args, **{**original._kwargs, "required": False}
+                )
 
             # Create language-specific fields
-            for lang_code, lang_name in self.languages:
+            for lang_code, lang_name in settings.LANGUAGES:
                 field_key = f"{field_name}_{lang_code.lower()}"
 
                 if is_media:
-                    self.fields[field_key] = serializers.ListField(
+                    fields[field_key] = serializers.ListField(
                         child=serializers.FileField(),
                         required=False,
                         allow_empty=True,
                         help_text=f"{lang_name} files",
                     )
-                elif field_name in self.fields:
-                    original = self.fields[field_name]
-                    self.fields[field_key] = original.__class__(
+                elif field_name in fields:
+                    original = fields[field_name]
+                    fields[field_key] = original.__class__(
                         required=False,
                         allow_blank=True,
                         allow_null=True,
@@ -39,6 +147,8 @@ class TranslatedFieldsWriteMixin:
                         max_length=getattr(original, "max_length", None),
                     )
 
+        return fields
+
     def create(self, validated_data):
         media_data = self._extract_media_data(validated_data)
         instance = super().create(validated_data)
@@ -120,6 +230,10 @@ class TranslatedFieldsReadMixin:
         device_type = getattr(request, "device_type", "WEB") 
         lang = getattr(request, "lang", None)
 
+        # No-op when the list serializer already loaded this page
+        if media_fields:
+            get_media_index(self.context).load([instance])
+
         for field_name in translatable_fields:
             is_media = field_name in media_fields
 
@@ -162,26 +276,32 @@ class TranslatedFieldsReadMixin:
         """Return list of media dicts filtered by language.
 
         Supports:
-         - model related manager `media_files` (preferred),
+         - media prefetched into the context MediaIndex (preferred),
+         - model related manager `media_files`,
          - a FileField/ImageField on the instance (e.g., instance.image),
          - serialized dicts (instance may be a dict).
         """
-        # 1) If instance has a related manager media_files, use it
+        # 1) Prefer media already loaded into the context's MediaIndex
         qs_or_list = []
+        media_index = self.context.get(MEDIA_INDEX_CONTEXT_KEY)
+        indexed = media_index.get(instance, language) if media_index is not None else None
 
-        if hasattr(instance, "media_files") and hasattr(getattr(instance, "media_files"), "filter"):
+        if indexed is not None:
+            qs_or_list = indexed
+        # 2) If instance has a related manager media_files, use it
+        elif hasattr(instance, "media_files") and hasattr(getattr(instance, "media_files"), "filter"):
             try:
                 qs_or_list = instance.media_files.filter(language__iexact=language)
             except Exception:
                 qs_or_list = []
         else:
-            # 2) If instance is a dict (serialized) and contains media under common keys
+            # 3) If instance is a dict (serialized) and contains media under common keys
             if isinstance(instance, dict):
                 candidate = instance.get("media_files") or instance.get(field_name) or []
                 # candidate might be a list of dicts
                 qs_or_list = candidate
             else:
-                # 3) If the model has a FileField/ImageField named field_name, return it (single file)
+                # 4) If the model has a FileField/ImageField named field_name, return it (single file)
                 file_attr = getattr(instance, field_name, None)
                 if file_attr:
                     # file_attr might be a FieldFile object; return it as a single-item list
@@ -1,6 +1,6 @@
 from rest_framework.permissions import BasePermission
 from apps.shared.exceptions.custom_exceptions import CustomException
-from apps.users.models.device import Device
+from apps.users.utils.device_resolver import get_device_token, resolve_request_device
 
 
 class IsMobileOrWebUser(BasePermission):
@@ -12,13 +12,12 @@ class IsMobileOrWebUser(BasePermission):
             return True
 
         
-        device_token = request.headers.get("device_token")
-        if not device_token:
+        if not getattr(request, "device", None) and not get_device_token(request):
             raise CustomException(message_key="TOKEN_IS_NOT_PROVIDED")
 
-        try:
-            device = Device.objects.get(device_token=device_token)
-        except Device.DoesNotExist:
+        # Reuses the device attached by DeviceAndLanguageMiddleware when present
+        device = resolve_request_device(request)
+        if device is None:
             raise CustomException(message_key="NOT_FOUND")
         
 
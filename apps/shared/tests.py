@@ -1,3 +1,152 @@
-from django.test import TestCase
+import threading
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from apps.notifications.models import Notification
+from apps.shared.exceptions.translator import _render_cached, get_message_detail
+from apps.shared.utils.alert_transports import LogTransport, NoopTransport, build_transport
+from apps.shared.utils.counting import APPROXIMATE, CACHED, EXACT, count_queryset
+from apps.shared.utils.custom_response import ResponseBody
+from apps.shared.utils.language import negotiate_language, parse_accept_language
+from apps.shared.utils.telegram_alerts import MAX_MESSAGE_LENGTH, AlertDispatcher
+
+
+class CountStrategyTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        Notification.objects.bulk_create(
+            [Notification(title=f"N{i}", message="msg") for i in range(5)]
+        )
+
+    def test_exact(self):
+        result = count_queryset(Notification.objects.all(), EXACT)
+        self.assertEqual((result.value, result.strategy), (5, EXACT))
+
+    def test_cached_count_is_reused_per_filter_signature(self):
+        queryset = Notification.objects.filter(is_read=False)
+        self.assertEqual(count_queryset(queryset, CACHED).value, 5)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(count_queryset(Notification.objects.filter(is_read=False), CACHED).value, 5)
+        with self.assertNumQueries(1):
+            self.assertEqual(count_queryset(Notification.objects.filter(is_read=True), CACHED).value, 0)
+
+    def test_small_tables_fall_back_from_approximate(self):
+        result = count_queryset(Notification.objects.filter(is_read=False), APPROXIMATE)
+        self.assertEqual((result.value, result.strategy), (5, CACHED))
+
+    @override_settings(PAGINATION_COUNT={'APPROXIMATE_THRESHOLD': 0})
+    def test_approximate_uses_planner_estimate(self):
+        if connection.vendor != 'postgresql':
+            self.skipTest("Planner estimates are PostgreSQL-only")
+        result = count_queryset(Notification.objects.filter(is_read=False), APPROXIMATE)
+        self.assertEqual(result.strategy, APPROXIMATE)
+        self.assertGreaterEqual(result.value, 0)
+
+
+class MessageRenderingTestCase(TestCase):
+    def setUp(self):
+        _render_cached.cache_clear()
+
+    def test_language_fallback(self):
+        self.assertEqual(
+            get_message_detail('USER_NOT_FOUND', 'uz_UZ', {'user_id': 7})['message'],
+            "ID 7 bo'lgan foydalanuvchi topilmadi"
+        )
+        self.assertEqual(get_message_detail('USER_NOT_FOUND', 'de', {'user_id': 7})['message'], "User with ID 7 not found")
+        self.assertEqual(get_message_detail('NO_SUCH_KEY')['id'], 'UNKNOWN_ERROR')
+
+    def test_rendering_is_memoized_per_context(self):
+        for _ in range(3):
+            get_message_detail('USER_NOT_FOUND', 'en-US', {'user_id': 7})
+        get_message_detail('USER_NOT_FOUND', 'EN-us', {'user_id': 8})
+
+        info = _render_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 2))
+
+    def test_unhashable_context_is_rendered_uncached(self):
+        detail = get_message_detail('USER_NOT_FOUND', 'en', {'user_id': [1]})
+        self.assertEqual(detail['message'], "User with ID [1] not found")
+        self.assertEqual(_render_cached.cache_info().currsize, 0)
+
+
+class LanguageNegotiationTestCase(SimpleTestCase):
+    def test_parse_honours_quality_values(self):
+        self.assertEqual(parse_accept_language('en-US,en;q=0.9,uz;q=0.8'), ('en-us', 'en', 'uz'))
+        self.assertEqual(parse_accept_language('uz;q=0.5, RU'), ('ru', 'uz'))
+        self.assertEqual(parse_accept_language('en;q=0, uz;q=abc'), ())
+
+    def test_negotiate_against_supported(self):
+        self.assertEqual(negotiate_language(('en-us', 'uz'), ('en', 'uz'), 'uz'), 'en')
+        self.assertEqual(negotiate_language(('ru', 'uz-cyrl'), ('en', 'uz'), 'en'), 'uz')
+        self.assertEqual(negotiate_language(('de', '*'), ('en', 'uz'), 'uz'), 'uz')
+
+    def test_response_body_uses_request_preferences(self):
+        request = RequestFactory().get('/', HTTP_ACCEPT_LANGUAGE='de, ru;q=0.7, en;q=0.3')
+        body, status_code = ResponseBody('USER_CREATED', request=request).render()
+        self.assertEqual(body['message'], "Учетная запись пользователя успешно создана")
+        self.assertEqual(status_code, 201)
+        self.assertEqual(request.accept_languages, ('de', 'ru', 'en'))
+
+
+class AlertDispatcherTestCase(SimpleTestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.sent = []
+
+    def make_dispatcher(self, **kwargs):
+        options = {'batch_interval': 0.05, 'clock': lambda: self.now, **kwargs}
+        return AlertDispatcher(send=self.sent.append, **options)
+
+    @override_settings(ALERTS={'TRANSPORT': 'telegram', 'TELEGRAM_BOT_TOKEN': None})
+    def test_transport_selection_is_lazy_and_falls_back(self):
+        self.assertIsInstance(build_transport('noop'), NoopTransport)
+        self.assertIsInstance(build_transport(), LogTransport)
+        self.assertIsInstance(build_transport('apps.shared.utils.alert_transports.NoopTransport'), NoopTransport)
+
+    def test_coalesces_repeats_within_window(self):
+        dispatcher = self.make_dispatcher(dedup_window=60)
+        for _ in range(100):
+            dispatcher.submit("boom", key=('ProductView', 'KeyError'))
+        self.now = 61
+        dispatcher.submit("boom again", key=('ProductView', 'KeyError'))
+        self.assertTrue(dispatcher.flush())
+
+        metrics = dispatcher.metrics()
+        self.assertEqual((metrics['sent'], metrics['coalesced']), (2, 99))
+        self.assertIn("+99 similar alert(s) suppressed", "".join(self.sent))
+
+    def test_batches_into_telegram_sized_messages(self):
+        dispatcher = self.make_dispatcher(batch_interval=0.5, batch_size=50)
+        for i in range(10):
+            dispatcher.submit(f"alert {i} " + "x" * 1000)
+        self.assertTrue(dispatcher.flush())
+
+        self.assertEqual(dispatcher.metrics()['sent'], 10)
+        self.assertLess(len(self.sent), 10)
+        self.assertTrue(all(len(message) <= MAX_MESSAGE_LENGTH for message in self.sent))
+
+    def test_queue_and_rate_limits_count_drops(self):
+        sending, release = threading.Event(), threading.Event()
+
+        def slow_send(text):
+            sending.set()
+            release.wait(5)
+            self.sent.append(text)
+
+        dispatcher = self.make_dispatcher(queue_size=2, rate_per_minute=1, batch_size=1)
+        dispatcher.send = slow_send
+        dispatcher.submit("a")
+        self.assertTrue(sending.wait(5))  # worker is busy with "a"
+
+        self.assertTrue(dispatcher.submit("b"))
+        self.assertTrue(dispatcher.submit("c"))
+        self.assertFalse(dispatcher.submit("d"))
+        release.set()
+        self.assertTrue(dispatcher.flush())
+
+        metrics = dispatcher.metrics()
+        self.assertEqual(metrics['dropped_queue_full'], 1)
+        self.assertEqual((metrics['sent'], metrics['dropped_rate_limited']), (1, 2))
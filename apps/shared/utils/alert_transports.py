@@ -0,0 +1,91 @@
+"""
+Delivery backends for exception alerts.
+
+The transport is chosen by ``settings.ALERTS['TRANSPORT']`` ('noop', 'log',
+'telegram' or a dotted path to an AlertTransport subclass) and built on the
+first alert, so processes that never alert never import telebot.
+"""
+import logging
+import threading
+from typing import Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class AlertTransport:
+    """Base transport: deliver one (possibly batched) alert message."""
+
+    def send(self, text: str):
+        raise NotImplementedError
+
+
+class NoopTransport(AlertTransport):
+    """Discard alerts (tests, local development)."""
+
+    def send(self, text: str):
+        pass
+
+
+class LogTransport(AlertTransport):
+    """Write alerts to the log, or append them to a file when a path is given."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send(self, text: str):
+        if not self.path:
+            logger.error(f"Alert:\n{text}")
+            return
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(text + "\n\n")
+
+
+class TelegramTransport(AlertTransport):
+    """Send alerts to a Telegram channel; the bot is created on first send."""
+
+    def __init__(self, token: str, chat_id: int):
+        self.token = token
+        self.chat_id = chat_id
+        self._bot = None
+
+    @property
+    def bot(self):
+        if self._bot is None:
+            # Imported here: telebot adds ~100ms to every process that loads it
+            import telebot
+            self._bot = telebot.TeleBot(self.token)
+        return self._bot
+
+    def send(self, text: str):
+        self.bot.send_message(
+            chat_id=self.chat_id,
+            text=text,
+            parse_mode='HTML',
+            disable_web_page_preview=True
+        )
+
+
+def build_transport(name: Optional[str] = None) -> AlertTransport:
+    """
+    Construct the configured alert transport.
+
+    Falls back to LogTransport when Telegram is selected but not configured.
+    """
+    options = getattr(settings, 'ALERTS', {})
+    name = name or options.get('TRANSPORT') or 'log'
+
+    if name == 'noop':
+        return NoopTransport()
+    if name == 'log':
+        return LogTransport(options.get('LOG_FILE'))
+    if name == 'telegram':
+        token, chat_id = options.get('TELEGRAM_BOT_TOKEN'), options.get('TELEGRAM_CHANNEL_ID')
+        if not token or not chat_id:
+            logger.warning("Telegram alerts selected but TELEGRAM_BOT_TOKEN/TELEGRAM_CHANNEL_ID are not set; logging instead")
+            return LogTransport(options.get('LOG_FILE'))
+        return TelegramTransport(token, chat_id)
+    return import_string(name)()
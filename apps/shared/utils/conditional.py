@@ -0,0 +1,41 @@
+"""
+Conditional GET helpers (ETag / Last-Modified / 304) for DRF views.
+
+Views compute their validators from a cheap query, call
+``conditional_response`` before doing any serialization and, when that
+returns None, attach the same validators to the full response.
+"""
+import hashlib
+from datetime import datetime
+from typing import Iterable, Optional
+
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag from any repr-able parts."""
+    return '"%s"' % hashlib.sha1(repr(parts).encode()).hexdigest()
+
+
+def conditional_response(request, etag: str, last_modified: Optional[datetime] = None) -> Optional[HttpResponse]:
+    """
+    Return 304 (or 412) when the client's validators still match, else None.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    return get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+
+
+def set_validators(response, etag: str, last_modified: Optional[datetime] = None, vary: Iterable[str] = ()):
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    if vary:
+        patch_vary_headers(response, vary)
+    return response
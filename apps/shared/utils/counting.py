@@ -0,0 +1,117 @@
+"""
+Count strategies for paginated list endpoints.
+
+- exact:       plain COUNT(*)
+- cached:      COUNT(*) cached per query signature for a short TTL
+- approximate: PostgreSQL planner estimate (pg_class.reltuples for
+               unfiltered tables, EXPLAIN row estimate otherwise), falling
+               back to an exact count for small results or other databases
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+EXACT = 'exact'
+CACHED = 'cached'
+APPROXIMATE = 'approximate'
+STRATEGIES = (EXACT, CACHED, APPROXIMATE)
+
+
+@dataclass
+class CountResult:
+    """A row count and the strategy that actually produced it"""
+    value: int
+    strategy: str
+
+
+def _options():
+    return getattr(settings, 'PAGINATION_COUNT', {})
+
+
+def count_queryset(queryset, strategy: str = EXACT) -> CountResult:
+    """
+    Count a queryset using the requested strategy.
+
+    Args:
+        queryset: QuerySet (or any object with .count())
+        strategy: One of STRATEGIES
+    Returns:
+        CountResult; strategy is the one used after any fallback
+    """
+    if not hasattr(queryset, 'query'):
+        return CountResult(len(queryset), EXACT)
+
+    if strategy == APPROXIMATE:
+        estimate = _approximate_count(queryset)
+        if estimate is not None:
+            return CountResult(estimate, APPROXIMATE)
+        # Small or unsupported: an exact (cached) count is cheap enough
+        strategy = CACHED
+
+    if strategy == CACHED:
+        return CountResult(_cached_count(queryset), CACHED)
+
+    return CountResult(queryset.count(), EXACT)
+
+
+def count_cache_key(queryset) -> str:
+    """Cache key derived from the model and the compiled WHERE signature."""
+    sql, params = queryset.order_by().query.sql_with_params()
+    signature = json.dumps([queryset.model._meta.label, sql, [str(p) for p in params]])
+    return 'count:' + hashlib.sha1(signature.encode()).hexdigest()
+
+
+def _cached_count(queryset) -> int:
+    try:
+        key = count_cache_key(queryset)
+    except EmptyResultSet:
+        # e.g. pk__in=[]: Django answers this without querying
+        return queryset.count()
+
+    value = cache.get(key)
+    if value is None:
+        value = queryset.count()
+        cache.set(key, value, _options().get('CACHE_TTL', 30))
+    return value
+
+
+def _approximate_count(queryset):
+    """Return the planner estimate, or None when an exact count should be used."""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    try:
+        with connection.cursor() as cursor:
+            if not queryset.query.where:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+                estimate = row[0] if row else None
+            else:
+                sql, params = queryset.order_by().values('pk').query.sql_with_params()
+                cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = plan[0]['Plan']['Plan Rows']
+    except EmptyResultSet:
+        return None
+    except (DatabaseError, LookupError, TypeError, ValueError) as e:
+        logger.warning(f"Approximate count failed - model: {queryset.model._meta.label}, error: {e}")
+        return None
+
+    # reltuples is -1 for never-analyzed tables; small estimates are unreliable
+    if estimate is None or estimate < _options().get('APPROXIMATE_THRESHOLD', 10000):
+        return None
+    return int(estimate)
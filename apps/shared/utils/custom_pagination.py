@@ -1,25 +1,95 @@
+import base64
+import binascii
+import json
+import math
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db.models import GeneratedField, Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 
 from rest_framework.response import Response
 
+from apps.shared.utils.counting import APPROXIMATE, EXACT, count_queryset
+
+
+class CountingPaginator(Paginator):
+    """Paginator whose total comes from a count strategy (see utils.counting)."""
+
+    def __init__(self, object_list, per_page, count_strategy=EXACT, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+        self.count_strategy_used = None
+
+    @cached_property
+    def count(self):
+        result = count_queryset(self.object_list, self.count_strategy)
+        self.count_strategy_used = result.strategy
+        return result.value
+
+    def validate_number(self, number):
+        if self.count and self.count_strategy_used == APPROXIMATE:
+            # An estimate must not reject pages that really exist
+            try:
+                number = int(number)
+            except (TypeError, ValueError):
+                raise PageNotAnInteger(self.error_messages['invalid_page'])
+            if number < 1:
+                raise EmptyPage(self.error_messages['min_page'])
+            return number
+        return super().validate_number(number)
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if self.count_strategy_used != APPROXIMATE:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        page = self._get_page(self.object_list[bottom:bottom + self.per_page], number, self)
+        if not page.object_list and number > 1:
+            raise EmptyPage(self.error_messages['no_results'])
+        return page
+
+
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 10
     page_query_param = 'page'
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+    # Keyset mode: used when the client sends ?cursor= (empty for the first
+    # page), or by default on views that set pagination_mode = 'keyset'
+    # unless the client asks for a ?page=
+    cursor_query_param = 'cursor'
+    count_query_param = 'with_count'
+    keyset_fields = ('created_at', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    # Views override with count_strategy = 'cached' / 'approximate'
+    count_strategy = EXACT
+
     def __init__(self):
         super().__init__()
         self.page = None
         self.request = None
+        self.keyset = None
+        self.count_strategy_used = None
 
     def paginate_queryset(self, queryset, request, view=None):
         page_size = self.get_page_size(request)
         if not page_size:
             return None
 
-        paginator = Paginator(queryset, page_size)
+        if self.use_keyset(request, view):
+            return self.paginate_keyset(queryset, request, view, page_size)
+
+        paginator = CountingPaginator(
+            queryset, page_size,
+            count_strategy=getattr(view, 'count_strategy', self.count_strategy)
+        )
         page_number = request.query_params.get(self.page_query_param, 1)
 
         try:
@@ -28,9 +98,129 @@ class CustomPageNumberPagination(PageNumberPagination):
             return None
 
         self.request = request
+        self.count_strategy_used = paginator.count_strategy_used
         return list(self.page)
 
+    def use_keyset(self, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            return True
+        if self.page_query_param in request.query_params:
+            # An explicit page number keeps the page-number contract
+            return False
+        return getattr(view, 'pagination_mode', 'page') == 'keyset'
+
+    def paginate_keyset(self, queryset, request, view, page_size):
+        """
+        Page on (created_at, id) descending without COUNT(*) or OFFSET.
+        Each page is one indexed range query fetching page_size + 1 rows.
+        """
+        order_field, tiebreak_field = getattr(view, 'keyset_fields', self.keyset_fields)
+        cursor = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+
+        total_items = None
+        if self.wants_count(request):
+            result = count_queryset(queryset, getattr(view, 'count_strategy', self.count_strategy))
+            total_items = result.value
+            self.count_strategy_used = result.strategy
+
+        reverse = False
+        try:
+            if cursor is None:
+                queryset = queryset.order_by(f'-{order_field}', f'-{tiebreak_field}')
+            else:
+                value, pk, reverse = self.clean_cursor(queryset, cursor, order_field, tiebreak_field)
+                if reverse:
+                    queryset = queryset.filter(
+                        Q(**{f'{order_field}__gt': value})
+                        | Q(**{order_field: value, f'{tiebreak_field}__gt': pk})
+                    ).order_by(order_field, tiebreak_field)
+                else:
+                    queryset = queryset.filter(
+                        Q(**{f'{order_field}__lt': value})
+                        | Q(**{order_field: value, f'{tiebreak_field}__lt': pk})
+                    ).order_by(f'-{order_field}', f'-{tiebreak_field}')
+            rows = list(queryset[:page_size + 1])
+        except (ValidationError, ValueError, TypeError):
+            # Cursor decoded but holds values the fields can't compare with
+            raise NotFound(self.invalid_cursor_message)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        # Walking backwards: more rows means an earlier page exists,
+        # and the page we came from is always a next page
+        has_next = True if reverse else has_more
+        has_prev = has_more if reverse else cursor is not None
+
+        self.keyset = {
+            'total_items': total_items,
+            'total_pages': math.ceil(total_items / page_size) if total_items is not None else None,
+            'next_page': self.encode_cursor(rows[-1], order_field, tiebreak_field) if has_next and rows else None,
+            'prev_page': self.encode_cursor(rows[0], order_field, tiebreak_field, reverse=True) if has_prev and rows else None,
+        }
+        self.request = request
+        return rows
+
+    def wants_count(self, request):
+        return request.query_params.get(self.count_query_param, '').lower() in ('1', 'true', 'yes')
+
+    def encode_cursor(self, row, order_field, tiebreak_field, reverse=False):
+        value = getattr(row, order_field)
+        # isoformat keeps microseconds, which the keyset comparison needs
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        elif isinstance(value, Decimal):
+            value = str(value)
+        payload = json.dumps([value, getattr(row, tiebreak_field), reverse], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, encoded):
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            value, pk, reverse = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        except (TypeError, ValueError, binascii.Error):
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk, reverse
+
+    def clean_cursor(self, queryset, cursor, order_field, tiebreak_field):
+        """Convert the decoded cursor values with the fields they are compared to."""
+        value, pk, reverse = cursor
+        if value is None or pk is None or not isinstance(reverse, bool):
+            raise ValidationError(self.invalid_cursor_message)
+        return (
+            self.cursor_field(queryset, order_field).to_python(value),
+            self.cursor_field(queryset, tiebreak_field).to_python(pk),
+            reverse,
+        )
+
+    @staticmethod
+    def cursor_field(queryset, name):
+        # Keyset fields may be annotations (e.g. search rank)
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        field = queryset.model._meta.get_field(name)
+        # GeneratedField converts through the field it is stored as
+        return field.output_field if isinstance(field, GeneratedField) else field
+
     def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return Response({
+                'pagination': {
+                    'total_items': self.keyset['total_items'],
+                    'total_pages': self.keyset['total_pages'],
+                    'current_page': None,
+                    'page_size': len(data),
+                    'next_page': self.keyset['next_page'],
+                    'prev_page': self.keyset['prev_page'],
+                    'count_strategy': self.count_strategy_used,
+                },
+                'results': data
+            })
+
         if self.page is None:
             return Response({
                 'pagination': {
@@ -40,6 +230,7 @@ class CustomPageNumberPagination(PageNumberPagination):
                     'page_size': 0,
                     'next_page': None,
                     'prev_page': None,
+                    'count_strategy': self.count_strategy_used,
                 },
                 'results': None
             })
@@ -52,6 +243,7 @@ class CustomPageNumberPagination(PageNumberPagination):
                 'page_size': len(data),
                 'next_page': self.page.next_page_number() if self.page.has_next() else None,
                 'prev_page': self.page.previous_page_number() if self.page.has_previous() else None,
+                'count_strategy': self.count_strategy_used,
             },
             'results': data
         })
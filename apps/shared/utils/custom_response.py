@@ -1,11 +1,12 @@
 import logging
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, Tuple, Union
 
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from apps.shared.exceptions.translator import get_message_detail
+from apps.shared.exceptions.translator import DEFAULT_LANGUAGE, MESSAGE_LANGUAGES, get_message_detail
+from apps.shared.utils.language import get_request_language
 
 logger = logging.getLogger(__name__)
 
@@ -19,34 +20,32 @@ class ResponseBody:
 
     def get_language(self) -> str:
         """
-        Extract language from request headers.
-        Supports Accept-Language header with quality values.
+        Negotiate the message language from the request.
+
+        Uses the preferences parsed once per request (Accept-Language with
+        quality values, then the device language).
 
         Examples:
-            'en-US,en;q=0.9' -> 'en-US'
-            'uz' -> 'uz'
+            'en-US,en;q=0.9' -> 'en'
+            'ru;q=0.5,uz' -> 'uz'
         """
         if self.request and hasattr(self.request, 'headers'):
-            accept_lang = self.request.headers.get('Accept-Language', 'en')
-            # Parse Accept-Language header (remove quality values)
-            lang = accept_lang.split(';')[0].split(',')[0].strip()
-            return lang
-        return 'en'
+            return get_request_language(self.request, MESSAGE_LANGUAGES, DEFAULT_LANGUAGE)
+        return DEFAULT_LANGUAGE
 
-    def to_dict(self, **kwargs) -> Dict[str, Any]:
+    def render(self, **kwargs) -> Tuple[Dict[str, Any], int]:
         """
-        Convert to response dictionary with translated message.
+        Build the response body and resolve the status code in one pass.
 
         Args:
             **kwargs: Additional fields to include in response
 
         Returns:
-            Dictionary with message details and any additional fields
+            (response dictionary, status code from the message template)
         """
-        lang = self.get_language()
         message_detail = get_message_detail(
             message_key=self.message_key,
-            lang=lang,
+            lang=self.get_language(),
             context=self.context
         )
 
@@ -56,17 +55,23 @@ class ResponseBody:
             **kwargs
         }
 
-        return response_body
+        return response_body, message_detail["status_code"]
+
+    def to_dict(self, **kwargs) -> Dict[str, Any]:
+        """
+        Convert to response dictionary with translated message.
+
+        Args:
+            **kwargs: Additional fields to include in response
+
+        Returns:
+            Dictionary with message details and any additional fields
+        """
+        return self.render(**kwargs)[0]
 
     def get_status_code(self) -> int:
         """Get the HTTP status code for this message"""
-        lang = self.get_language()
-        message_detail = get_message_detail(
-            message_key=self.message_key,
-            lang=lang,
-            context=self.context
-        )
-        return message_detail["status_code"]
+        return self.render()[1]
 
 
 class CustomResponse:
@@ -110,10 +115,10 @@ class CustomResponse:
         )
 
         # Build response body
-        body = body_maker.to_dict(data=data, **kwargs)
+        body, template_status = body_maker.render(data=data, **kwargs)
 
         # Use explicit status code or get from message template
-        final_status = status_code or body_maker.get_status_code()
+        final_status = status_code or template_status
 
         return Response(body, status=final_status)
 
@@ -158,10 +163,10 @@ class CustomResponse:
         if errors:
             response_data['errors'] = errors
 
-        body = body_maker.to_dict(**response_data, **kwargs)
+        body, template_status = body_maker.render(**response_data, **kwargs)
 
         # Use explicit status code or get from message template
-        final_status = status_code or body_maker.get_status_code()
+        final_status = status_code or template_status
 
         # Log error for monitoring
         logger.warning(
@@ -0,0 +1,130 @@
+"""
+Accept-Language negotiation shared by the middleware, serializers and
+response rendering.
+
+The header is parsed once per request (q-values honoured) and memoized per
+distinct header string; the ordered preferences are stored on the request
+as ``request.accept_languages`` so each consumer only has to match them
+against the languages it supports.
+"""
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+
+from apps.shared.models import Language
+
+# Language choice (Device.language) -> language tag
+LANGUAGE_CHOICE_TAGS = {
+    Language.EN: 'en',
+    Language.RU: 'ru',
+    Language.UZ: 'uz',
+    Language.CRL: 'uz-cyrl',
+}
+
+DEFAULT_CONTENT_LANGUAGE = LANGUAGE_CHOICE_TAGS[Language.UZ]
+WILDCARD = '*'
+MAX_HEADER_LENGTH = 256
+
+
+def normalize_tag(tag: str) -> str:
+    """'en_US' / 'EN-us' -> 'en-us'"""
+    return tag.strip().lower().replace('_', '-')
+
+
+@lru_cache(maxsize=256)
+def parse_accept_language(header: Optional[str]) -> Tuple[str, ...]:
+    """
+    Parse an Accept-Language header into tags ordered by preference.
+
+    Examples:
+        'en-US,en;q=0.9,uz;q=0.8' -> ('en-us', 'en', 'uz')
+        'uz;q=0.5, ru'            -> ('ru', 'uz')
+        'en;q=0'                  -> ()
+    """
+    if not header:
+        return ()
+
+    weighted = []
+    for position, part in enumerate(header[:MAX_HEADER_LENGTH].split(',')):
+        tag, _, params = part.partition(';')
+        tag = normalize_tag(tag)
+        if not tag:
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params:
+            name, _, value = params.partition('=')
+            if name.strip().lower() != 'q':
+                continue
+            try:
+                quality = float(value)
+            except ValueError:
+                continue
+        if quality <= 0:
+            continue
+
+        weighted.append((-quality, position, tag))
+
+    return tuple(tag for _, _, tag in sorted(weighted))
+
+
+@lru_cache(maxsize=32)
+def _lookup_table(supported: Tuple[str, ...]) -> dict:
+    """Map each supported tag and its base language to the supported tag."""
+    table = {}
+    for tag in supported:
+        table.setdefault(tag, tag)
+        table.setdefault(tag.split('-')[0], tag)
+    return table
+
+
+@lru_cache(maxsize=512)
+def negotiate_language(preferences: Tuple[str, ...], supported: Tuple[str, ...], default: str) -> str:
+    """
+    Pick the best supported language for the ordered preferences.
+
+    A preference matches a supported tag exactly or by base language
+    ('en-us' -> 'en', 'uz-cyrl' -> 'uz'); '*' selects the default.
+    """
+    table = _lookup_table(supported)
+    for tag in preferences:
+        if tag == WILDCARD:
+            return default
+        match = table.get(tag) or table.get(tag.split('-')[0])
+        if match:
+            return match
+    return default
+
+
+def content_languages() -> Tuple[str, ...]:
+    """Lowercase codes from settings.LANGUAGES (the translated model fields)."""
+    return tuple(code.lower() for code, _ in settings.LANGUAGES)
+
+
+def get_language_preferences(request, device_language: Optional[str] = None) -> Tuple[str, ...]:
+    """
+    Ordered language preferences for a request, cached on the request.
+
+    The Accept-Language header comes first; the device's saved language is
+    appended as a lower-priority fallback.
+    """
+    preferences = getattr(request, 'accept_languages', None)
+    if preferences is not None:
+        return preferences
+
+    preferences = parse_accept_language(request.headers.get('Accept-Language'))
+    device_tag = LANGUAGE_CHOICE_TAGS.get(device_language)
+    if device_tag and device_tag not in preferences:
+        preferences += (device_tag,)
+
+    request.accept_languages = preferences
+    return preferences
+
+
+def get_request_language(request, supported: Iterable[str], default: str) -> str:
+    """Negotiate the request's preferences against ``supported``."""
+    if request is None:
+        return default
+    return negotiate_language(get_language_preferences(request), tuple(supported), default)
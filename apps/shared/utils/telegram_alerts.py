@@ -1,21 +1,265 @@
+"""
+Exception alerts delivered by one background dispatcher per process.
+
+``send_alert`` never blocks the request: alerts go onto a bounded queue that a
+single daemon thread drains. Repeats of the same key (view, exception type)
+within the dedup window are coalesced, a token bucket caps outgoing messages,
+and queued alerts are batched into as few Telegram messages as possible.
+Everything that is not delivered is counted in ``get_alert_metrics()``.
+
+Delivery goes through the configured transport (see alert_transports),
+which is built on the first alert rather than at import.
+"""
+import logging
+import os
+import queue
 import threading
-import telebot
-import html
-from core import config
-
-bot = telebot.TeleBot(config.TELEGRAM_BOT_TOKEN)
-
-def _send_telegram_message(text: str):
-    try:
-        bot.send_message(
-            chat_id=config.TELEGRAM_CHANNEL_ID,
-            text=text,
-            parse_mode='HTML',
-            disable_web_page_preview=True
-        )
-    except Exception as e:
-        print(f"Failed to send Telegram message: {e}")
-
-def send_alert(text: str):
-    """Send Telegram alert in background thread."""
-    threading.Thread(target=_send_telegram_message, args=(text,), daemon=True).start()
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+from django.conf import settings
+
+from apps.shared.utils.alert_transports import AlertTransport, build_transport
+
+logger = logging.getLogger(__name__)
+
+# Telegram rejects messages longer than this
+MAX_MESSAGE_LENGTH = 4096
+BATCH_SEPARATOR = "\n\n➖➖➖\n\n"
+
+
+_transport: Optional[AlertTransport] = None
+
+
+def get_alert_transport() -> AlertTransport:
+    global _transport
+    if _transport is None:
+        _transport = build_transport()
+    return _transport
+
+
+def _send(text: str):
+    get_alert_transport().send(text)
+
+
+def _truncate(text: str, limit: int = MAX_MESSAGE_LENGTH) -> str:
+    if len(text) <= limit:
+        return text
+    text = text[:limit - 1]
+    # Don't leave a half-written HTML tag behind
+    if text.rfind('<') > text.rfind('>'):
+        text = text[:text.rfind('<')]
+    return text + "…"
+
+
+class AlertDispatcher:
+    """
+    Bounded, rate-limited, deduplicating alert queue with a single worker thread.
+
+    The worker is started lazily and restarted after fork (uWSGI workers
+    inherit the module but not the thread).
+    """
+
+    def __init__(
+            self,
+            send: Callable[[str], None],
+            queue_size: int = 500,
+            dedup_window: float = 60.0,
+            rate_per_minute: int = 20,
+            batch_size: int = 20,
+            batch_interval: float = 2.0,
+            clock: Callable[[], float] = time.monotonic,
+    ):
+        self.send = send
+        self.queue_size = queue_size
+        self.dedup_window = dedup_window
+        self.rate_per_minute = rate_per_minute
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+        self._thread = None
+
+        # key -> (window start, alerts suppressed since)
+        self._seen: Dict[Hashable, list] = {}
+        self._tokens = float(rate_per_minute)
+        self._refilled_at = clock()
+        self._metrics = dict.fromkeys((
+            'submitted', 'sent', 'batches', 'coalesced',
+            'dropped_queue_full', 'dropped_rate_limited', 'send_failures',
+        ), 0)
+
+    # Producer side
+
+    def submit(self, text: str, key: Optional[Hashable] = None) -> bool:
+        """
+        Queue an alert without blocking.
+
+        Returns False when the alert was coalesced into an earlier one or
+        dropped because the queue is full.
+        """
+        with self._lock:
+            self._metrics['submitted'] += 1
+            now = self.clock()
+
+            if key is not None:
+                entry = self._seen.get(key)
+                if entry and now - entry[0] < self.dedup_window:
+                    entry[1] += 1
+                    self._metrics['coalesced'] += 1
+                    return False
+
+                suppressed = entry[1] if entry else 0
+                self._seen[key] = [now, 0]
+                self._prune_seen(now)
+                if suppressed:
+                    text += f"\n<i>+{suppressed} similar alert(s) suppressed</i>"
+
+            self._ensure_worker()
+            try:
+                self._queue.put_nowait(text)
+            except queue.Full:
+                self._metrics['dropped_queue_full'] += 1
+                return False
+            return True
+
+    def _prune_seen(self, now: float):
+        if len(self._seen) <= self.queue_size:
+            return
+        expired = [k for k, (start, count) in self._seen.items() if now - start >= self.dedup_window and not count]
+        for k in expired:
+            del self._seen[k]
+
+    def _ensure_worker(self):
+        pid = os.getpid()
+        if self._pid == pid and self._thread.is_alive():
+            return
+        if self._pid != pid:
+            # Fresh queue after fork: the parent's queue and lock state are not ours
+            self._queue = queue.Queue(maxsize=self.queue_size)
+        self._pid = pid
+        self._thread = threading.Thread(target=self._run, name='alert-dispatcher', daemon=True)
+        self._thread.start()
+
+    # Consumer side
+
+    def _run(self):
+        alerts = self._queue
+        while True:
+            batch = [alerts.get()]
+            deadline = time.monotonic() + self.batch_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(alerts.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._deliver(batch)
+            finally:
+                for _ in batch:
+                    alerts.task_done()
+
+    def _deliver(self, batch):
+        for message in self._pack(batch):
+            if not self._take_token():
+                with self._lock:
+                    self._metrics['dropped_rate_limited'] += message.count(BATCH_SEPARATOR) + 1
+                continue
+            try:
+                self.send(message)
+            except Exception as e:
+                logger.warning(f"Failed to send alert: {e}")
+                with self._lock:
+                    self._metrics['send_failures'] += 1
+                continue
+            with self._lock:
+                self._metrics['batches'] += 1
+                self._metrics['sent'] += message.count(BATCH_SEPARATOR) + 1
+
+    @staticmethod
+    def _pack(batch):
+        """Join alerts into as few messages as fit Telegram's length limit."""
+        messages, current = [], ""
+        for text in batch:
+            text = _truncate(text.replace(BATCH_SEPARATOR, "\n\n"))
+            if current and len(current) + len(BATCH_SEPARATOR) + len(text) > MAX_MESSAGE_LENGTH:
+                messages.append(current)
+                current = ""
+            current = f"{current}{BATCH_SEPARATOR}{text}" if current else text
+        if current:
+            messages.append(current)
+        return messages
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(
+                float(self.rate_per_minute),
+                self._tokens + (now - self._refilled_at) * self.rate_per_minute / 60.0
+            )
+            self._refilled_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    # Introspection
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far has been handled."""
+        deadline = time.monotonic() + timeout
+        while self._queue is not None and self._queue.unfinished_tasks:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            snapshot = dict(self._metrics)
+            snapshot['queued'] = self._queue.qsize() if self._queue is not None else 0
+        return snapshot
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_alert_dispatcher() -> AlertDispatcher:
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                options = getattr(settings, 'ALERTS', {})
+                _dispatcher = AlertDispatcher(
+                    send=_send,
+                    queue_size=options.get('QUEUE_SIZE', 500),
+                    dedup_window=options.get('DEDUP_WINDOW', 60.0),
+                    rate_per_minute=options.get('RATE_PER_MINUTE', 20),
+                    batch_size=options.get('BATCH_SIZE', 20),
+                    batch_interval=options.get('BATCH_INTERVAL', 2.0),
+                )
+    return _dispatcher
+
+
+def send_alert(text: str, key: Optional[Hashable] = None) -> bool:
+    """
+    Queue a Telegram alert for background delivery.
+
+    Args:
+        text: HTML-formatted alert text
+        key: Dedup key, e.g. (view name, exception type); None disables coalescing
+    """
+    return get_alert_dispatcher().submit(text, key=key)
+
+
+def get_alert_metrics() -> Dict[str, int]:
+    """Counters for submitted / sent / coalesced / dropped alerts in this process."""
+    return get_alert_dispatcher().metrics()
@@ -4,4 +4,8 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.users'
-    label = 'users' 
\ No newline at end of file
+    label = 'users' 
+
+
+    def ready(self):
+        import apps.users.signals
@@ -29,22 +29,30 @@ class DeviceManager(models.Manager):
 
     def logout_all_devices(self, user):
 
-        return self.filter(user=user, is_active=True).update(
-            is_active=False,
-            logged_out_at=timezone.now()
-        )
+        return self._logout(self.filter(user=user, is_active=True))
 
     def logout_other_devices(self, user, current_device_id):
 
-        return self.filter(
-            user=user,
-            is_active=True
-        ).exclude(
-            id=current_device_id
-        ).update(
+        return self._logout(
+            self.filter(
+                user=user,
+                is_active=True
+            ).exclude(
+                id=current_device_id
+            )
+        )
+
+    def _logout(self, queryset):
+        # QuerySet.update() skips post_save, so evict cached devices here
+        from apps.users.utils.device_resolver import invalidate_devices
+
+        tokens = list(queryset.values_list('device_token', flat=True))
+        updated = queryset.update(
             is_active=False,
             logged_out_at=timezone.now()
         )
+        invalidate_devices(tokens)
+        return updated
 
     def is_token_valid(self, refresh_token_jti):
 
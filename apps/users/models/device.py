@@ -202,23 +202,12 @@ class Device(BaseModel):
     @classmethod
     def logout_all_devices(cls, user):
         """Logout from all devices for a user"""
-        return cls.objects.filter(user=user, is_active=True).update(
-            is_active=False,
-            logged_out_at=timezone.now()
-        )
+        return cls.objects.logout_all_devices(user)
 
     @classmethod
     def logout_other_devices(cls, user, current_device_id):
         """Logout from all devices except current one"""
-        return cls.objects.filter(
-            user=user,
-            is_active=True
-        ).exclude(
-            id=current_device_id
-        ).update(
-            is_active=False,
-            logged_out_at=timezone.now()
-        )
+        return cls.objects.logout_other_devices(user, current_device_id)
 
     @classmethod
     def is_token_valid(cls, refresh_token_jti):
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.users.models.device import Device
+from apps.users.utils.device_resolver import invalidate_devices
+
+
+@receiver(post_save, sender=Device)
+@receiver(post_delete, sender=Device)
+def invalidate_device_cache(sender, instance, **kwargs):
+    invalidate_devices([instance.device_token])
@@ -0,0 +1,62 @@
+import uuid
+
+from django.test import RequestFactory
+from rest_framework.test import APITestCase
+
+from apps.shared.exceptions.custom_exceptions import CustomException
+from apps.shared.permissions.mobile import IsMobileOrWebUser
+from apps.users.models.device import AppVersion, Device
+from apps.users.utils.device_resolver import get_device_resolver, resolve_device
+
+
+class DeviceResolverTestCase(APITestCase):
+    def setUp(self):
+        get_device_resolver().clear()
+        self.app_version = AppVersion.objects.create(version="1.0.0")
+        self.device = Device.objects.create(
+            device_model="Pixel",
+            operation_version="14",
+            device_id="device-1",
+            ip_address="127.0.0.1",
+            app_version=self.app_version,
+        )
+        self.token = str(self.device.device_token)
+
+    def tearDown(self):
+        get_device_resolver().clear()
+
+    def test_second_lookup_is_served_from_cache(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(resolve_device(self.token).pk, self.device.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_device(self.token).pk, self.device.pk)
+
+    def test_unknown_and_malformed_tokens(self):
+        self.assertIsNone(resolve_device(str(uuid.uuid4())))
+        with self.assertNumQueries(0):
+            self.assertIsNone(resolve_device("not-a-uuid"))
+
+    def test_save_invalidates_cached_device(self):
+        resolve_device(self.token)
+        self.device.logout()
+        self.assertFalse(resolve_device(self.token).is_active)
+
+    def test_bulk_logout_invalidates_cached_device(self):
+        resolve_device(self.token)
+        Device.objects.filter(pk=self.device.pk).update(is_active=True)
+        Device.objects._logout(Device.objects.filter(pk=self.device.pk))
+        self.assertFalse(resolve_device(self.token).is_active)
+
+    def test_permission_reuses_device_attached_by_middleware(self):
+        request = RequestFactory().get("/", HTTP_DEVICE_TOKEN=self.token)
+        request.user = None
+        request.device = resolve_device(self.token)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(IsMobileOrWebUser().has_permission(request, None))
+
+    def test_permission_without_token(self):
+        request = RequestFactory().get("/")
+        request.user = None
+        with self.assertRaises(CustomException):
+            IsMobileOrWebUser().has_permission(request, None)
@@ -0,0 +1,164 @@
+"""
+Cached resolution of the ``Device-Token`` header to a ``Device`` row.
+
+Lookups go through a per-process LRU first, then an optional shared Django
+cache, and only then the database. Entries are invalidated from the Device
+signals and from the bulk logout helpers, and the resolved device is attached
+to the request so the middleware and permission classes share one lookup.
+"""
+import copy
+import logging
+import uuid
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from apps.shared.utils.local_cache import LRUCache
+from apps.users.models.device import Device
+
+logger = logging.getLogger(__name__)
+
+DEVICE_TOKEN_HEADER = 'Device-Token'
+SHARED_CACHE_PREFIX = 'device:token:'
+
+
+def normalize_device_token(raw_token) -> Optional[str]:
+    """
+    Return the canonical string form of a device token, or None when the
+    value is not a valid UUID (such tokens can never match a device).
+    """
+    if not raw_token:
+        return None
+    try:
+        return str(uuid.UUID(str(raw_token).strip()))
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+
+def get_device_token(request) -> Optional[str]:
+    """Read the device token header (``Device-Token`` or ``device_token``)."""
+    headers = getattr(request, 'headers', None)
+    if headers is None:
+        return None
+    return headers.get(DEVICE_TOKEN_HEADER)
+
+
+class DeviceResolver:
+    """Two-tier cache in front of ``Device.objects.get(device_token=...)``."""
+
+    def __init__(
+            self,
+            local_size: int = 2048,
+            local_ttl: float = 60,
+            shared_alias: Optional[str] = None,
+            shared_ttl: int = 300
+    ):
+        self.local = LRUCache(maxsize=local_size, ttl=local_ttl)
+        self.shared_alias = shared_alias
+        self.shared_ttl = shared_ttl
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias] if self.shared_alias else None
+
+    def resolve(self, raw_token) -> Optional[Device]:
+        token = normalize_device_token(raw_token)
+        if token is None:
+            return None
+
+        device = self.local.get(token)
+        if device is None and self.shared is not None:
+            device = self._shared_get(token)
+            if device is not None:
+                self.local.set(token, device)
+
+        if device is None:
+            device = Device.objects.filter(device_token=token).first()
+            if device is None:
+                return None
+            self.local.set(token, device)
+            self._shared_set(token, device)
+
+        # Hand out a copy so request code can't mutate the cached instance
+        return copy.copy(device)
+
+    def invalidate(self, *raw_tokens) -> None:
+        for raw_token in raw_tokens:
+            token = normalize_device_token(raw_token)
+            if token is None:
+                continue
+            self.local.delete(token)
+            if self.shared is not None:
+                try:
+                    self.shared.delete(SHARED_CACHE_PREFIX + token)
+                except Exception as e:
+                    logger.warning(f"Device cache delete failed - token: {token}, error: {e}")
+
+    def clear(self) -> None:
+        """Drop the local tier (used by tests)."""
+        self.local.clear()
+
+    def _shared_get(self, token: str) -> Optional[Device]:
+        try:
+            return self.shared.get(SHARED_CACHE_PREFIX + token)
+        except Exception as e:
+            logger.warning(f"Device cache read failed - token: {token}, error: {e}")
+            return None
+
+    def _shared_set(self, token: str, device: Device) -> None:
+        if self.shared is None:
+            return
+        try:
+            self.shared.set(SHARED_CACHE_PREFIX + token, device, self.shared_ttl)
+        except Exception as e:
+            logger.warning(f"Device cache write failed - token: {token}, error: {e}")
+
+
+_resolver: Optional[DeviceResolver] = None
+
+
+def get_device_resolver() -> DeviceResolver:
+    global _resolver
+    if _resolver is None:
+        options = getattr(settings, 'DEVICE_RESOLVER', {})
+        _resolver = DeviceResolver(
+            local_size=options.get('LOCAL_CACHE_SIZE', 2048),
+            local_ttl=options.get('LOCAL_CACHE_TTL', 60),
+            shared_alias=options.get('SHARED_CACHE_ALIAS'),
+            shared_ttl=options.get('SHARED_CACHE_TTL', 300),
+        )
+    return _resolver
+
+
+def resolve_device(raw_token) -> Optional[Device]:
+    return get_device_resolver().resolve(raw_token)
+
+
+def invalidate_devices(tokens: Iterable) -> None:
+    """
+    Evict tokens now and again once the surrounding transaction commits,
+    so a concurrent request can't re-cache the pre-commit row.
+    """
+    tokens = [token for token in tokens if token]
+    if not tokens:
+        return
+    resolver = get_device_resolver()
+    resolver.invalidate(*tokens)
+    transaction.on_commit(lambda: resolver.invalidate(*tokens))
+
+
+def resolve_request_device(request) -> Optional[Device]:
+    """
+    Return the device for this request, resolving the header at most once.
+    The result is stored as ``request.device`` for downstream consumers.
+    """
+    device = getattr(request, 'device', None)
+    if device is not None:
+        return device
+
+    device = resolve_device(get_device_token(request))
+    if device is not None:
+        request.device = device
+    return device
@@ -1,8 +1,8 @@
 from typing import Any
 
 from rest_framework import generics, permissions, status
-from rest_framework.pagination import PageNumberPagination
 from apps.shared.permissions.mobile import IsMobileOrWebUser
+from apps.shared.utils.custom_pagination import CustomPageNumberPagination
 from apps.shared.utils.custom_response import CustomResponse
 from apps.users.models.device import Device
 from apps.users.serializers.device import DeviceListSerializer, DeviceRegisterSerializer
@@ -40,10 +40,11 @@ class DeviceRegisterCreateAPIView(generics.CreateAPIView):
 class DeviceListApiView(generics.ListAPIView):
     serializer_class = DeviceListSerializer
     permission_classes = [IsMobileOrWebUser]  
-    pagination_class = PageNumberPagination
+    pagination_class = CustomPageNumberPagination
+    count_strategy = 'approximate'
     
     def get_queryset(self):
-        return Device.objects.all()
+        return Device.objects.select_related('app_version')
 
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
@@ -51,11 +52,7 @@ class DeviceListApiView(generics.ListAPIView):
       
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response({
-                "id": "SUCCESS_MESSAGE",
-                "message": "Operation completed successfully",
-                "data": serializer.data
-            })
+            return self.get_paginated_response(serializer.data)
 
         serializer = self.get_serializer(queryset, many=True)
         return CustomResponse.success(
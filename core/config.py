@@ -1,6 +1,8 @@
+import importlib.util
 import os
 from pathlib import Path
 import environ
+from django.core.exceptions import ImproperlyConfigured
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -34,6 +36,59 @@ DB_PASSWORD = env('DB_PASSWORD')
 DB_HOST = env('DB_HOST')
 DB_PORT = env('DB_PORT')
 
+# Seconds to keep a connection open between requests (0 = close after each
+# request). Ignored when DB_POOL is on: the pool owns connection lifetime.
+DB_CONN_MAX_AGE = env.int('DB_CONN_MAX_AGE', default=60)
+DB_CONN_HEALTH_CHECKS = env.bool('DB_CONN_HEALTH_CHECKS', default=True)
+DB_CONNECT_TIMEOUT = env.int('DB_CONNECT_TIMEOUT', default=5)
+# Server-side statement_timeout in milliseconds (0 = disabled)
+DB_STATEMENT_TIMEOUT = env.int('DB_STATEMENT_TIMEOUT', default=0)
+
+# Connection pooling (requires psycopg 3: pip install "psycopg[binary,pool]")
+DB_POOL = env.bool('DB_POOL', default=False)
+DB_POOL_MIN_SIZE = env.int('DB_POOL_MIN_SIZE', default=2)
+DB_POOL_MAX_SIZE = env.int('DB_POOL_MAX_SIZE', default=4)
+DB_POOL_TIMEOUT = env.int('DB_POOL_TIMEOUT', default=10)
+
+# Fail at startup rather than on the first connection
+if DB_POOL and importlib.util.find_spec('psycopg_pool') is None:
+    raise ImproperlyConfigured(
+        'DB_POOL requires psycopg 3 with its pool: pip install "psycopg[binary,pool]"'
+    )
+
+# CACHE SETTINGS
+CACHE_DEFAULT = env.cache_url('CACHE_URL', default='locmemcache://')
+
+# PAGINATION COUNT SETTINGS
+PAGINATION_COUNT_CACHE_TTL = env.int('PAGINATION_COUNT_CACHE_TTL', default=30)
+PAGINATION_APPROXIMATE_THRESHOLD = env.int('PAGINATION_APPROXIMATE_THRESHOLD', default=10000)
+
+# PRODUCT CATALOG CACHE SETTINGS
+PRODUCT_LIST_CACHE_TTL = env.int('PRODUCT_LIST_CACHE_TTL', default=300)
+# Unset: cache list pages only when CACHE_URL is shared (redis, memcached, db)
+PRODUCT_LIST_CACHE = env.bool('PRODUCT_LIST_CACHE', default=None)
+
+# PRODUCT BULK IMPORT SETTINGS
+PRODUCT_IMPORT_BATCH_SIZE = env.int('PRODUCT_IMPORT_BATCH_SIZE', default=1000)
+PRODUCT_IMPORT_MAX_ITEMS = env.int('PRODUCT_IMPORT_MAX_ITEMS', default=5000)
+
+# DEVICE RESOLVER SETTINGS
+DEVICE_CACHE_SIZE = env.int('DEVICE_CACHE_SIZE', default=2048)
+DEVICE_CACHE_TTL = env.int('DEVICE_CACHE_TTL', default=60)
+DEVICE_SHARED_CACHE_ALIAS = env('DEVICE_SHARED_CACHE_ALIAS', default=None)
+DEVICE_SHARED_CACHE_TTL = env.int('DEVICE_SHARED_CACHE_TTL', default=300)
+
+# ALERT DISPATCHER SETTINGS
+ALERT_QUEUE_SIZE = env.int('ALERT_QUEUE_SIZE', default=500)
+ALERT_DEDUP_WINDOW = env.float('ALERT_DEDUP_WINDOW', default=60.0)
+ALERT_RATE_PER_MINUTE = env.int('ALERT_RATE_PER_MINUTE', default=20)
+ALERT_BATCH_SIZE = env.int('ALERT_BATCH_SIZE', default=20)
+ALERT_BATCH_INTERVAL = env.float('ALERT_BATCH_INTERVAL', default=2.0)
+
 # TELEGRAM BOT SETTINGS
-TELEGRAM_BOT_TOKEN = env('TELEGRAM_BOT_TOKEN')
-TELEGRAM_CHANNEL_ID = env.int('TELEGRAM_CHANNEL_ID')
+TELEGRAM_BOT_TOKEN = env('TELEGRAM_BOT_TOKEN', default=None)
+TELEGRAM_CHANNEL_ID = env.int('TELEGRAM_CHANNEL_ID', default=None)
+
+# 'telegram', 'log' (ALERT_LOG_FILE or the logger), 'noop' or a dotted path
+ALERT_TRANSPORT = env('ALERT_TRANSPORT', default='telegram' if TELEGRAM_BOT_TOKEN else 'log')
+ALERT_LOG_FILE = env('ALERT_LOG_FILE', default=None)
@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'django_extensions',
     
     
@@ -126,9 +127,81 @@ DATABASES = {
         'PASSWORD': config.DB_PASSWORD,
         'HOST': config.DB_HOST, 
         'PORT': config.DB_PORT,
+        'CONN_MAX_AGE': 0 if config.DB_POOL else config.DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': config.DB_CONN_HEALTH_CHECKS,
+        'OPTIONS': {
+            'connect_timeout': config.DB_CONNECT_TIMEOUT,
+        },
     }
 }
 
+if config.DB_STATEMENT_TIMEOUT:
+    DATABASES['default']['OPTIONS']['options'] = f'-c statement_timeout={config.DB_STATEMENT_TIMEOUT}'
+
+if config.DB_POOL:
+    # Django's psycopg 3 pool; one pool per worker process
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': config.DB_POOL_MIN_SIZE,
+        'max_size': config.DB_POOL_MAX_SIZE,
+        'timeout': config.DB_POOL_TIMEOUT,
+    }
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    'default': config.CACHE_DEFAULT,
+}
+
+# Paginated total counts (apps.shared.utils.counting).
+# Planner estimates below APPROXIMATE_THRESHOLD fall back to a cached exact count.
+PAGINATION_COUNT = {
+    'CACHE_TTL': config.PAGINATION_COUNT_CACHE_TTL,
+    'APPROXIMATE_THRESHOLD': config.PAGINATION_APPROXIMATE_THRESHOLD,
+}
+
+# Rendered product list pages (apps.products.cache), invalidated by the
+# catalog version bumped from Product/Media signals. Every worker and
+# management command must see the same version, so pages are only cached
+# when CACHE_URL points at a shared cache (redis://, pymemcache://, dbcache://);
+# with the locmem default the list cache is bypassed. LIST_CACHE forces it.
+PRODUCT_CACHE = {
+    'LIST_TTL': config.PRODUCT_LIST_CACHE_TTL,
+    'LIST_CACHE': config.PRODUCT_LIST_CACHE,
+}
+
+# Bulk product upserts (apps.products.bulk). MAX_ITEMS caps one API request;
+# the import_products command streams files of any size.
+PRODUCT_IMPORT = {
+    'BATCH_SIZE': config.PRODUCT_IMPORT_BATCH_SIZE,
+    'MAX_ITEMS': config.PRODUCT_IMPORT_MAX_ITEMS,
+}
+
+# Device-Token lookups (apps.users.utils.device_resolver).
+# SHARED_CACHE_ALIAS enables the cross-worker tier; leave it unset with a
+# per-process cache backend such as locmem.
+DEVICE_RESOLVER = {
+    'LOCAL_CACHE_SIZE': config.DEVICE_CACHE_SIZE,
+    'LOCAL_CACHE_TTL': config.DEVICE_CACHE_TTL,
+    'SHARED_CACHE_ALIAS': config.DEVICE_SHARED_CACHE_ALIAS,
+    'SHARED_CACHE_TTL': config.DEVICE_SHARED_CACHE_TTL,
+}
+
+# Exception alerts (apps.shared.utils.telegram_alerts): one background
+# dispatcher per process; repeats of the same (view, exception type) within
+# DEDUP_WINDOW seconds are coalesced into a single alert.
+ALERTS = {
+    'QUEUE_SIZE': config.ALERT_QUEUE_SIZE,
+    'DEDUP_WINDOW': config.ALERT_DEDUP_WINDOW,
+    'RATE_PER_MINUTE': config.ALERT_RATE_PER_MINUTE,
+    'BATCH_SIZE': config.ALERT_BATCH_SIZE,
+    'BATCH_INTERVAL': config.ALERT_BATCH_INTERVAL,
+    'TRANSPORT': config.ALERT_TRANSPORT,
+    'LOG_FILE': config.ALERT_LOG_FILE,
+    'TELEGRAM_BOT_TOKEN': config.TELEGRAM_BOT_TOKEN,
+    'TELEGRAM_CHANNEL_ID': config.TELEGRAM_CHANNEL_ID,
+}
 
 
 # Password validation